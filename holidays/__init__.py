@@ -26,7 +26,18 @@ from holidays.constants import (
     NOV,
     DEC,
 )
-from holidays.holiday_base import HolidayBase, createHolidaySum
+from holidays.holiday_base import (
+    HolidayBase,
+    HolidaySum,
+    HolidayOperation,
+    createHolidaySum,
+    union,
+)
+from holidays.bitmatrix import HolidayMatrix, matrix
+from holidays.overlay import HolidayOverlay
+from holidays.shared import SharedCalendars
 from holidays.utils import list_supported_countries, CountryHoliday
+from holidays.utils import warmup, precompute
+from holidays.utils import countries_on, countries_between, lookup_many
 
 __version__ = "0.11.1"
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+"""Dates of holidays that are only known once they are announced.
+
+Each country with announced dates has a JSON file in ``holidays/data``,
+mapping a holiday key to the announced dates of each year::
+
+    {"version": 1, "country": "SG",
+     "holidays": {"deepavali": {"2021": ["11-04"], ...}, ...}}
+
+A file is parsed once, on first use, into year-indexed tables. Directories
+listed in the ``HOLIDAYS_DATA_PATH`` environment variable (separated like
+``PATH``) are read after the packaged files, so dates announced after a
+release can be added, or corrected, from a local file with the same name.
+Call :func:`clear_cache` after changing them in a running process.
+"""
+
+import json
+import os
+from datetime import date
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+DATA_PATH_ENV = "HOLIDAYS_DATA_PATH"
+VERSION = 1
+
+_tables = {}
+
+
+def _data_files(name):
+    filename = name + ".json"
+    directories = os.environ.get(DATA_PATH_ENV, "").split(os.pathsep)
+    for directory in [DATA_DIR] + directories:
+        if directory:
+            path = os.path.join(directory, filename)
+            if os.path.exists(path):
+                yield path
+
+
+def _parse(path, tables):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != VERSION:
+        raise ValueError(
+            "Unsupported version %s of announced dates file %s"
+            % (data.get("version"), path)
+        )
+    for key, years in data["holidays"].items():
+        table = tables.setdefault(key, {})
+        for year, dates in years.items():
+            year = int(year)
+            table[year] = tuple(
+                date(year, *map(int, month_day.split("-")))
+                for month_day in dates
+            )
+
+
+def load(name):
+    """Return the announced dates of ``name`` (e.g. ``"singapore"``) as
+    ``{holiday key: {year: (date, ...)}}``."""
+    tables = _tables.get(name)
+    if tables is None:
+        tables = {}
+        for path in _data_files(name):
+            _parse(path, tables)
+        _tables[name] = tables
+    return tables
+
+
+def announced_dates(name, key, year):
+    """Return the announced dates of holiday ``key`` of ``name`` in
+    ``year``, or an empty tuple if none was announced."""
+    return load(name).get(key, {}).get(year, ())
+
+
+def clear_cache():
+    """Forget the parsed files, so they are read again on next use."""
+    _tables.clear()
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+import ast
+import json
+import mmap
+import struct
+from datetime import date
+
+from holidays.holiday_base import _to_date
+from holidays.utils import (
+    _OUT_OF_RANGE,
+    _build_calendar,
+    _calendar_specs,
+    _covered_years,
+)
+
+# .npy format: magic string, format version, header length and a Python
+# literal describing the array, padded so that the data is 64-byte aligned.
+# The labels and dates are kept in a JSON file next to it.
+_NPY_MAGIC = b"\x93NUMPY"
+_NPY_PREFIX = {1: struct.Struct("<H"), 2: struct.Struct("<I")}
+_VERSION = 1
+
+
+class HolidayMatrix(object):
+    """A packed bit matrix of the holidays of several calendars.
+
+    Row ``i`` holds the calendar ``labels[i]``, a ``(country,
+    subdivision)`` pair, and column ``j`` the day ``start + j`` up to
+    ``end``. Each row takes ``row_size`` bytes of ``data``: day ``j`` is bit
+    ``j & 7`` (least significant first) of the row byte ``j >> 3``.
+
+    A matrix returned by :meth:`load` owns the memory map of its file until
+    :meth:`close` is called, directly or by using it as a context manager.
+    """
+
+    def __init__(self, labels, start, end, data):
+        self.labels = [tuple(label) for label in labels]
+        self.start = start
+        self.end = end
+        self.days = end.toordinal() - start.toordinal() + 1
+        self.row_size = (self.days + 7) >> 3
+        self.data = data
+        self._rows = {label: i for i, label in enumerate(self.labels)}
+        self._mapped = None
+
+    @property
+    def shape(self):
+        return len(self.labels), self.row_size
+
+    def is_holiday(self, country, day, subdivision=None):
+        row = self._rows[country, subdivision]
+        offset = _to_date(day).toordinal() - self.start.toordinal()
+        if not 0 <= offset < self.days:
+            raise KeyError(day)
+        byte = self.data[row * self.row_size + (offset >> 3)]
+        return bool(byte >> (offset & 7) & 1)
+
+    def to_numpy(self):
+        """Return the packed matrix as a ``uint8`` NumPy array of ``shape``
+        sharing memory with ``data``; ``numpy.unpackbits(array, axis=1,
+        bitorder="little")[:, :days]`` gives one column per day."""
+        import numpy
+
+        array = numpy.frombuffer(self.data, dtype=numpy.uint8)
+        return array.reshape(self.shape)
+
+    def save(self, path):
+        """Write the matrix to ``path`` in the ``.npy`` format and its
+        labels and dates to ``path + ".json"``."""
+        header = "{'descr': '|u1', 'fortran_order': False, 'shape': %r, }" % (
+            self.shape,
+        )
+        size = len(_NPY_MAGIC) + 2 + _NPY_PREFIX[1].size + len(header) + 1
+        header = (header + " " * (-size % 64) + "\n").encode("latin1")
+        with open(path, "wb") as f:
+            f.write(_NPY_MAGIC + b"\x01\x00")
+            f.write(_NPY_PREFIX[1].pack(len(header)))
+            f.write(header)
+            f.write(self.data)
+        with open(path + ".json", "w") as f:
+            json.dump(
+                {
+                    "version": _VERSION,
+                    "start": self.start.isoformat(),
+                    "end": self.end.isoformat(),
+                    "labels": self.labels,
+                },
+                f,
+            )
+
+    @classmethod
+    def load(cls, path):
+        """Read a matrix written by :meth:`save`; the bits are memory
+        mapped read-only rather than read, until :meth:`close`."""
+        with open(path + ".json") as f:
+            meta = json.load(f)
+        if meta["version"] != _VERSION:
+            raise ValueError(
+                "Unsupported holiday matrix version %s" % meta["version"]
+            )
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            prefix = _NPY_PREFIX.get(mapped[6]) if len(mapped) > 8 else None
+            if mapped[:6] != _NPY_MAGIC or prefix is None:
+                raise ValueError("%s is not a .npy file" % path)
+            offset = 8 + prefix.size
+            length = prefix.unpack_from(mapped, 8)[0]
+            header = ast.literal_eval(
+                mapped[offset : offset + length].decode("latin1")
+            )
+        except Exception:
+            mapped.close()
+            raise
+        matrix = cls(
+            meta["labels"],
+            _to_date(meta["start"]),
+            _to_date(meta["end"]),
+            memoryview(mapped)[offset + length :],
+        )
+        matrix._mapped = mapped
+        if (
+            header["descr"] not in ("|u1", "u1")
+            or header["fortran_order"]
+            or tuple(header["shape"]) != matrix.shape
+        ):
+            matrix.close()
+            raise ValueError("%s does not hold this holiday matrix" % path)
+        return matrix
+
+    def close(self):
+        """Unmap the file of a matrix returned by :meth:`load`; ``data``
+        and the arrays returned by :meth:`to_numpy` must no longer be
+        used. Does nothing for other matrices."""
+        if self._mapped is not None:
+            self.data.release()
+            self._mapped.close()
+            self._mapped = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return "<HolidayMatrix %s-%s (%d calendars)>" % (
+            self.start,
+            self.end,
+            len(self.labels),
+        )
+
+
+def matrix(countries, start, end, subdivisions=None, observed=True):
+    """Return a :class:`HolidayMatrix` of the holidays of ``countries``
+    between ``start`` and ``end`` (inclusive).
+
+    ``countries`` and ``subdivisions`` select the calendars (one row each)
+    as for :func:`holidays.warmup`, except that only the national calendars
+    are included by default. Rows are assembled from the per-year holiday
+    bitmaps of the calendars, without creating an object per day.
+    """
+    start, end = _to_date(start), _to_date(end)
+    if end < start:
+        raise ValueError("end must not be before start")
+    first = start.toordinal()
+    days = end.toordinal() - first + 1
+    row_size = (days + 7) >> 3
+    # The adjacent years are populated for the dates they observe in range
+    years = set(range(start.year, end.year + 1))
+    adjacent = {start.year - 1, end.year + 1}
+    labels = []
+    data = bytearray()
+    for country, subdivision, cls in _calendar_specs(countries, subdivisions):
+        try:
+            calendar = _build_calendar(
+                cls, subdivision, years | adjacent, observed
+            )
+        except _OUT_OF_RANGE:
+            # Only the adjacent years the calendar covers are added; the
+            # years of the range themselves still raise when not covered
+            calendar = _build_calendar(
+                cls,
+                subdivision,
+                years.union(_covered_years(cls, adjacent, observed)),
+                observed,
+            )
+        row = 0
+        for year in range(start.year, end.year + 1):
+            mask = calendar._year_bitmap(year)[0]
+            shift = date(year, 1, 1).toordinal() - first
+            row |= mask << shift if shift >= 0 else mask >> -shift
+        row &= (1 << days) - 1
+        data += row.to_bytes(row_size, "little")
+        labels.append((country, subdivision))
+    return HolidayMatrix(labels, start, end, data)
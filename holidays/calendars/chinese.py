@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+"""Chinese lunisolar calendar, as used by Hong Kong and Singapore.
+
+Lunar dates are converted with a table of cumulative day offsets built once
+at import time, so each conversion is a couple of list lookups instead of a
+loop over every lunar year since 1901. Only the lunar years 1901-2099 are
+covered: other years raise ValueError.
+"""
+
+from datetime import date, timedelta
+
+# Store the number of days per year from 1901 to 2099, and the number of
+# days from the 1st to the 13th to store the monthly (including the month
+# of the month), 1 means that the month is 30 days. 0 means the month is
+# 29 days. The 12th to 15th digits indicate the month of the next month.
+# If it is 0x0F, it means that there is no leap month.
+LUNAR_MONTH_DAYS = [
+    0xF0EA4,
+    0xF1D4A,
+    0x52C94,
+    0xF0C96,
+    0xF1536,
+    0x42AAC,
+    0xF0AD4,
+    0xF16B2,
+    0x22EA4,
+    0xF0EA4,  # 1901-1910
+    0x6364A,
+    0xF164A,
+    0xF1496,
+    0x52956,
+    0xF055A,
+    0xF0AD6,
+    0x216D2,
+    0xF1B52,
+    0x73B24,
+    0xF1D24,  # 1911-1920
+    0xF1A4A,
+    0x5349A,
+    0xF14AC,
+    0xF056C,
+    0x42B6A,
+    0xF0DA8,
+    0xF1D52,
+    0x23D24,
+    0xF1D24,
+    0x61A4C,  # 1921-1930
+    0xF0A56,
+    0xF14AE,
+    0x5256C,
+    0xF16B4,
+    0xF0DA8,
+    0x31D92,
+    0xF0E92,
+    0x72D26,
+    0xF1526,
+    0xF0A56,  # 1931-1940
+    0x614B6,
+    0xF155A,
+    0xF0AD4,
+    0x436AA,
+    0xF1748,
+    0xF1692,
+    0x23526,
+    0xF152A,
+    0x72A5A,
+    0xF0A6C,  # 1941-1950
+    0xF155A,
+    0x52B54,
+    0xF0B64,
+    0xF1B4A,
+    0x33A94,
+    0xF1A94,
+    0x8152A,
+    0xF152E,
+    0xF0AAC,
+    0x6156A,  # 1951-1960
+    0xF15AA,
+    0xF0DA4,
+    0x41D4A,
+    0xF1D4A,
+    0xF0C94,
+    0x3192E,
+    0xF1536,
+    0x72AB4,
+    0xF0AD4,
+    0xF16D2,  # 1961-1970
+    0x52EA4,
+    0xF16A4,
+    0xF164A,
+    0x42C96,
+    0xF1496,
+    0x82956,
+    0xF055A,
+    0xF0ADA,
+    0x616D2,
+    0xF1B52,  # 1971-1980
+    0xF1B24,
+    0x43A4A,
+    0xF1A4A,
+    0xA349A,
+    0xF14AC,
+    0xF056C,
+    0x60B6A,
+    0xF0DAA,
+    0xF1D92,
+    0x53D24,  # 1981-1990
+    0xF1D24,
+    0xF1A4C,
+    0x314AC,
+    0xF14AE,
+    0x829AC,
+    0xF06B4,
+    0xF0DAA,
+    0x52D92,
+    0xF0E92,
+    0xF0D26,  # 1991-2000
+    0x42A56,
+    0xF0A56,
+    0xF14B6,
+    0x22AB4,
+    0xF0AD4,
+    0x736AA,
+    0xF1748,
+    0xF1692,
+    0x53526,
+    0xF152A,  # 2001-2010
+    0xF0A5A,
+    0x4155A,
+    0xF156A,
+    0x92B54,
+    0xF0BA4,
+    0xF1B4A,
+    0x63A94,
+    0xF1A94,
+    0xF192A,
+    0x42A5C,  # 2011-2020
+    0xF0AAC,
+    0xF156A,
+    0x22B64,
+    0xF0DA4,
+    0x61D52,
+    0xF0E4A,
+    0xF0C96,
+    0x5192E,
+    0xF1956,
+    0xF0AB4,  # 2021-2030
+    0x315AC,
+    0xF16D2,
+    0xB2EA4,
+    0xF16A4,
+    0xF164A,
+    0x63496,
+    0xF1496,
+    0xF0956,
+    0x50AB6,
+    0xF0B5A,  # 2031-2040
+    0xF16D4,
+    0x236A4,
+    0xF1B24,
+    0x73A4A,
+    0xF1A4A,
+    0xF14AA,
+    0x5295A,
+    0xF096C,
+    0xF0B6A,
+    0x31B54,  # 2041-2050
+    0xF1D92,
+    0x83D24,
+    0xF1D24,
+    0xF1A4C,
+    0x614AC,
+    0xF14AE,
+    0xF09AC,
+    0x40DAA,
+    0xF0EAA,
+    0xF0E92,  # 2051-2060
+    0x31D26,
+    0xF0D26,
+    0x72A56,
+    0xF0A56,
+    0xF14B6,
+    0x52AB4,
+    0xF0AD4,
+    0xF16CA,
+    0x42E94,
+    0xF1694,  # 2061-2070
+    0x8352A,
+    0xF152A,
+    0xF0A5A,
+    0x6155A,
+    0xF156A,
+    0xF0B54,
+    0x4174A,
+    0xF1B4A,
+    0xF1A94,
+    0x3392A,  # 2071-2080
+    0xF192C,
+    0x7329C,
+    0xF0AAC,
+    0xF156A,
+    0x52B64,
+    0xF0DA4,
+    0xF1D4A,
+    0x41C94,
+    0xF0C96,
+    0x8192E,  # 2081-2090
+    0xF0956,
+    0xF0AB6,
+    0x615AC,
+    0xF16D4,
+    0xF0EA4,
+    0x42E4A,
+    0xF164A,
+    0xF1516,
+    0x22936,  # 2090-2099
+]
+# Define range of years
+START_YEAR, END_YEAR = 1901, 1900 + len(LUNAR_MONTH_DAYS)
+# 1901 The 1st day of the 1st month of the Gregorian calendar is 1901/2/19
+SOLAR_START_DATE = date(1901, 2, 19)
+
+
+def get_leap_month(lunar_year):
+    """Return the leap month of ``lunar_year``, 0x0F if there is none."""
+    return (LUNAR_MONTH_DAYS[lunar_year - START_YEAR] >> 16) & 0x0F
+
+
+def lunar_month_days(lunar_year, lunar_month):
+    """Return the number of days of the ``lunar_month``-th month of
+    ``lunar_year``, counting the leap month as a month of its own."""
+    return 29 + (
+        (LUNAR_MONTH_DAYS[lunar_year - START_YEAR] >> lunar_month) & 1
+    )
+
+
+def _build_offsets():
+    # _YEAR_OFFSETS[i]: days from SOLAR_START_DATE to the new year of
+    # START_YEAR + i; _MONTH_OFFSETS[i][m]: days from that new year to the
+    # start of the (m + 1)th month of the year, leap month included.
+    year_offsets = []
+    month_offsets = []
+    span_days = 0
+    for i, months_day in enumerate(LUNAR_MONTH_DAYS):
+        months = 13 if get_leap_month(START_YEAR + i) == 0x0F else 14
+        offsets = [0]
+        for m in range(1, months):
+            offsets.append(offsets[-1] + 29 + ((months_day >> m) & 0x01))
+        year_offsets.append(span_days)
+        month_offsets.append(offsets)
+        span_days += offsets[-1]
+    year_offsets.append(span_days)
+    return year_offsets, month_offsets
+
+
+_YEAR_OFFSETS, _MONTH_OFFSETS = _build_offsets()
+
+
+def lunar_year_days(lunar_year):
+    """Return the number of days of ``lunar_year``."""
+    return _MONTH_OFFSETS[lunar_year - START_YEAR][-1]
+
+
+def _offset(lunar_year, lunar_month, lunar_day):
+    i = lunar_year - START_YEAR
+    if not 0 <= i < len(LUNAR_MONTH_DAYS):
+        raise ValueError(
+            "Lunar year %d out of range (%d-%d)"
+            % (lunar_year, START_YEAR, END_YEAR)
+        )
+    # Months following the leap month are one position further
+    position = lunar_month - 1 + (lunar_month > get_leap_month(lunar_year))
+    return _YEAR_OFFSETS[i] + _MONTH_OFFSETS[i][position] + lunar_day - 1
+
+
+def lunar_to_gregorian(lunar_year, lunar_month, lunar_day):
+    """Return the Gregorian date of a (non leap month) lunar date.
+
+    ``lunar_day`` may be zero or negative, or past the end of the month, to
+    get days before or after the start of ``lunar_month``.
+    """
+    return SOLAR_START_DATE + timedelta(
+        _offset(lunar_year, lunar_month, lunar_day)
+    )
+
+
+def lunar_to_gregorian_range(lunar_years, lunar_month, lunar_day):
+    """Return the Gregorian dates of a lunar date for each of
+    ``lunar_years``."""
+    start = SOLAR_START_DATE.toordinal()
+    return [
+        date.fromordinal(start + _offset(year, lunar_month, lunar_day))
+        for year in lunar_years
+    ]
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+"""Memoized Easter dates.
+
+:func:`easter` is a drop-in replacement for :func:`dateutil.easter.easter`
+that computes each (year, method) pair once per process, so the countries,
+subdivisions and HolidaySum members populating the same year share the
+result.
+"""
+
+from dateutil.easter import (
+    EASTER_JULIAN,
+    EASTER_ORTHODOX,
+    EASTER_WESTERN,
+    easter as _easter,
+)
+
+# (year, method) -> date of Easter Sunday
+_easter_dates = {}
+
+
+def easter(year, method=EASTER_WESTERN):
+    """Return the date of Easter Sunday in ``year``, see
+    :func:`dateutil.easter.easter` for the methods."""
+    try:
+        return _easter_dates[year, method]
+    except KeyError:
+        dt = _easter_dates[year, method] = _easter(year, method)
+        return dt
+
+
+def easter_range(years, method=EASTER_WESTERN):
+    """Return the list of Easter Sunday dates of ``years``."""
+    return [easter(year, method) for year in years]
+
+
+__all__ = [
+    "EASTER_JULIAN",
+    "EASTER_ORTHODOX",
+    "EASTER_WESTERN",
+    "easter",
+    "easter_range",
+]
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+"""Hebrew calendar year table.
+
+A Hebrew year is fully described by the date of its Tishri 1 and its
+length; both are computed once per year and cached, and any Hebrew date
+is derived from them with a few additions. Results match convertdate.
+"""
+
+from datetime import date
+
+(
+    NISAN,
+    IYYAR,
+    SIVAN,
+    TAMMUZ,
+    AV,
+    ELUL,
+    TISHRI,
+    HESHVAN,
+    KISLEV,
+    TEVET,
+    SHEVAT,
+    ADAR,
+    VEADAR,
+) = range(1, 14)
+
+# Gregorian year Y starts during Hebrew year Y + HEBREW_YEAR_OFFSET
+HEBREW_YEAR_OFFSET = 3760
+
+# Ordinal of Tishri 1 is _EPOCH + the molad delays of the year
+_EPOCH = -1373427
+# Days from Nisan 1 to the 1st of each month up to Elul; Nisan 1 is always
+# 177 days before the next Tishri 1.
+_SPRING_OFFSETS = (0, 30, 59, 89, 118, 148)
+_NISAN_TO_TISHRI = 177
+
+# Hebrew year -> ordinal of its Tishri 1
+_new_years = {}
+
+
+def leap(hebrew_year):
+    """Return True if ``hebrew_year`` has 13 months."""
+    return (hebrew_year * 7 + 1) % 19 < 7
+
+
+def _delay_1(hebrew_year):
+    months = (235 * hebrew_year - 234) // 19
+    parts = 12084 + 13753 * months
+    day = months * 29 + parts // 25920
+    if (3 * (day + 1)) % 7 < 3:
+        day += 1
+    return day
+
+
+def _new_year(hebrew_year):
+    ordinal = _new_years.get(hebrew_year)
+    if ordinal is None:
+        last = _delay_1(hebrew_year - 1)
+        present = _delay_1(hebrew_year)
+        following = _delay_1(hebrew_year + 1)
+        if following - present == 356:
+            present += 2
+        elif present - last == 382:
+            present += 1
+        ordinal = _new_years[hebrew_year] = _EPOCH + present
+    return ordinal
+
+
+def year_length(hebrew_year):
+    """Return the number of days in ``hebrew_year``."""
+    return _new_year(hebrew_year + 1) - _new_year(hebrew_year)
+
+
+def _month_start(hebrew_year, month):
+    if month < TISHRI:
+        return (
+            _new_year(hebrew_year + 1)
+            - _NISAN_TO_TISHRI
+            + _SPRING_OFFSETS[month - 1]
+        )
+    ordinal = _new_year(hebrew_year)
+    if month == TISHRI:
+        return ordinal
+    length = year_length(hebrew_year)
+    ordinal += 30
+    if month == HESHVAN:
+        return ordinal
+    ordinal += 30 if length % 10 == 5 else 29
+    if month == KISLEV:
+        return ordinal
+    ordinal += 29 if length % 10 == 3 else 30
+    # Tevet 29, Shevat 30, Adar 29 or 30 in leap years, Adar II 29
+    for m, days in (
+        (TEVET, 29),
+        (SHEVAT, 30),
+        (ADAR, 30 if leap(hebrew_year) else 29),
+    ):
+        if month == m:
+            return ordinal
+        ordinal += days
+    if month == VEADAR:
+        return ordinal
+    raise ValueError("Incorrect month index")
+
+
+def to_gregorian(hebrew_year, month, day):
+    """Return the Gregorian date of a Hebrew date."""
+    return date.fromordinal(_month_start(hebrew_year, month) + day - 1)
+
+
+def to_gregorian_year(year, month, day):
+    """Return the date of the Hebrew ``month`` and ``day`` in the Gregorian
+    ``year``, looking in the two Hebrew years that overlap it."""
+    for hebrew_year in (
+        year + HEBREW_YEAR_OFFSET,
+        year + HEBREW_YEAR_OFFSET + 1,
+    ):
+        dt = to_gregorian(hebrew_year, month, day)
+        if dt.year == year:
+            return dt
+    raise ValueError("Could not determine gregorian year")
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+"""Hijri (Umm al-Qura) calendar month table.
+
+The Gregorian start date of every Hijri month supported by hijri-converter
+is computed once, on first use, so converting a Hijri date is a list lookup
+instead of building converter objects.
+"""
+
+from bisect import bisect_right
+from datetime import date
+
+from hijri_converter import convert, ummalqura
+
+# Supported Hijri years
+START_YEAR = ummalqura.HIJRI_RANGE[0][0]
+END_YEAR = ummalqura.HIJRI_RANGE[1][0]
+
+# Ordinal of the first day of each Hijri month from START_YEAR, followed by
+# the ordinal of the day after the last supported month.
+_month_starts = []
+
+
+def _table():
+    if not _month_starts:
+        starts = []
+        for year in range(START_YEAR, END_YEAR + 1):
+            for month in range(1, 13):
+                gre = convert.Hijri(year, month, 1).to_gregorian()
+                starts.append(date(*gre.datetuple()).toordinal())
+        last = convert.Hijri(END_YEAR, 12, 1)
+        starts.append(starts[-1] + last.month_length())
+        # Concurrent first calls build identical tables
+        _month_starts[:] = starts
+    return _month_starts
+
+
+def to_gregorian(hijri_year, hijri_month, hijri_day):
+    """Return the Gregorian date of a Hijri date."""
+    starts = _table()
+    i = (hijri_year - START_YEAR) * 12 + hijri_month - 1
+    if not START_YEAR <= hijri_year <= END_YEAR:
+        raise OverflowError("date out of range")
+    if not 1 <= hijri_month <= 12:
+        raise ValueError("month must be in 1..12")
+    if not 1 <= hijri_day <= starts[i + 1] - starts[i]:
+        raise ValueError("day must be in 1..%d" % (starts[i + 1] - starts[i]))
+    return date.fromordinal(starts[i] + hijri_day - 1)
+
+
+def hijri_year(dt):
+    """Return the Hijri year of the Gregorian date ``dt``."""
+    starts = _table()
+    i = bisect_right(starts, dt.toordinal()) - 1
+    if not 0 <= i < len(starts) - 1:
+        raise OverflowError("date out of range")
+    return START_YEAR + i // 12
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+"""Hindu and Buddhist lunisolar festivals, as used by India, Singapore and
+Bangladesh.
+
+The festivals follow tithis (lunar days) of months named by the sidereal
+(Lahiri) position of the sun, so there is no simple arithmetic rule for
+them. Their dates from 1901 to 2100 were computed once from the positions
+of the sun and the moon and are stored as one day offset per year from a
+fixed date, so each lookup is a single index into a bytes table.
+"""
+
+from datetime import date, timedelta
+
+from holidays.constants import FEB, APR, OCT
+
+START_YEAR, END_YEAR = 1901, 2100
+
+# Lakshmi Puja: the amavasya ending the lunar month in which the sun enters
+# Libra, on the day it covers most of pradosh (dusk) at Ujjain.
+DIWALI = "DIWALI"
+# South Indian Deepavali (Naraka Chaturdashi): the chaturdashi of the same
+# month, on the day it covers arunodaya (the hour and a half before
+# sunrise) at Chennai.
+DEEPAVALI = "DEEPAVALI"
+# The day after Holika Dahan, the purnima of the lunar month in which the
+# sun enters Pisces, moved a day later when bhadra covers its dusk.
+HOLI = "HOLI"
+# The purnima of the lunar month in which the sun enters Taurus, on the day
+# it covers sunrise at Ujjain.
+BUDDHA_PURNIMA = "BUDDHA_PURNIMA"
+
+_TABLES = {
+    DIWALI: (
+        (OCT, 1),
+        bytes.fromhex(
+            "281d13251a1023172a1f14261c1124192c211628"  # 1901-1920
+            "1d13261a102318291e14271c1124192b2015281d"  # 1921-1940
+            "13261b0f22172a1e14271d1124192b2015281e12"  # 1941-1960
+            "251a0f21172a1f14271c1123182b2115281e1325"  # 1961-1980
+            "1a2d22162a1f15271c1123182b2116281d122519"  # 1981-2000
+            "2c22182a1f14271b1023192b2116291d12251a2c"  # 2001-2020
+            "22172a1e13261c1023192c2015281d11241a2d22"  # 2021-2040
+            "172a1f13261b1123192b2115271d12251a2d2216"  # 2041-2060
+            "291e14261b1124182b2015271d12251a2d221729"  # 2061-2080
+            "1e14271b1123182a2015281d12251a2c2116291f"  # 2081-2100
+        ),
+    ),
+    DEEPAVALI: (
+        (OCT, 1),
+        bytes.fromhex(
+            "281d12241a102317291e14261b1124182b201527"  # 1901-1920
+            "1d12251a0f2217291e14271b1124192b2015281d"  # 1921-1940
+            "12251b0f2116291e14271c1023182b1f15281e12"  # 1941-1960
+            "251a0f2116291f14271c1122182b2015281d1224"  # 1961-1980
+            "192c2216291f14261b1023182b2016281d122519"  # 1981-2000
+            "2c2217291f14261a1023192b2015281c11241a2c"  # 2001-2020
+            "22172a1e13261b1023192b2015271d11241a2d21"  # 2021-2040
+            "16291e13261b1123182b2014271c12241a2d2216"  # 2041-2060
+            "291e13261b1124182a1f15271d1225192c211628"  # 2061-2080
+            "1e13271b1023182a1f15281c12251a2b2116291f"  # 2081-2100
+        ),
+    ),
+    HOLI: (
+        (FEB, 15),
+        bytes.fromhex(
+            "12251b1022182b2014271c1224190f2216291e13"  # 1901-1920
+            "251b1023182a2015261c1225190f2116281d1326"  # 1921-1940
+            "1b1023180c1f14271c12251a0e2116291d13261b"  # 1941-1960
+            "1022170d1f14271d1124190e2015291e13261b10"  # 1961-1980
+            "22172a2014271d1223190e2115291e13251a0f22"  # 1981-2000
+            "172a2015271c1124180e2116281e13261a0f2218"  # 2001-2020
+            "2a1f15271b1124190e2116291d12251a0f22182b"  # 2021-2040
+            "1f14271c1023190f2116281d12251a1022172a1f"  # 2041-2060
+            "13261c1123190e2115281d13251a1023172a1f14"  # 2061-2080
+            "261c1124190e2016271d13261a0f2217291e1427"  # 2081-2100
+        ),
+    ),
+    BUDDHA_PURNIMA: (
+        (APR, 15),
+        bytes.fromhex(
+            "12251a0e21172a1f14271c1023182b2016281d11"  # 1901-1920
+            "241a0f21172a1f13261b1123182b2115281d1224"  # 1921-1940
+            "1a0f2217291f14261b1124182b2015271c12251a"  # 1941-1960
+            "0f2217291e13261b1124192b2015281c12251b0f"  # 1961-1980
+            "2116291e13261c1023182b1f15281d12251a0f21"  # 1981-2000
+            "16291f13261c1122182a2015281d1324190f2116"  # 2001-2020
+            "291f14261b1023172a2016281d1225190e211729"  # 2021-2040
+            "1f14261a1023182a2015281c11241a2c21172a1e"  # 2041-2060
+            "13261b1023182b2015271d11241a2d2117291e12"  # 2061-2080
+            "251b1123182b2014271c12241a2d2216291e1326"  # 2081-2100
+        ),
+    ),
+}
+
+
+def festival_date(festival, year):
+    """Return the Gregorian date of ``festival`` in ``year``."""
+    (month, day), offsets = _TABLES[festival]
+    if not START_YEAR <= year <= END_YEAR:
+        raise ValueError(
+            "Year %d out of range (%d-%d)" % (year, START_YEAR, END_YEAR)
+        )
+    return date(year, month, day) + timedelta(offsets[year - START_YEAR])
+
+
+def diwali(year):
+    """Return the date of Diwali (Lakshmi Puja) in ``year``."""
+    return festival_date(DIWALI, year)
+
+
+def deepavali(year):
+    """Return the date of South Indian Deepavali in ``year``."""
+    return festival_date(DEEPAVALI, year)
+
+
+def holi(year):
+    """Return the date of Holi in ``year``."""
+    return festival_date(HOLI, year)
+
+
+def buddha_purnima(year):
+    """Return the date of Buddha Purnima in ``year``."""
+    return festival_date(BUDDHA_PURNIMA, year)
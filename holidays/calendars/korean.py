@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+"""Korean lunar calendar, as used by Korea and Vietnam.
+
+Conversions use a table of the Gregorian start date of every lunar month
+of START_YEAR..END_YEAR, decoded once at import from the month lengths
+published by the korean_lunar_calendar package. Lookups keep no state and
+are safe to call concurrently; callers can clamp years to the bounds.
+"""
+
+from datetime import date
+
+# Installation: pip install korean_lunar_calendar
+# URL: https://github.com/usingsky/korean_lunar_calendar_py/
+from korean_lunar_calendar import KoreanLunarCalendar
+
+# Supported lunar years
+START_YEAR = KoreanLunarCalendar.KOREAN_LUNAR_MIN_VALUE // 10000
+END_YEAR = KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE // 10000
+
+
+def _build_month_starts():
+    # Each lunar year is packed as: the days of months 1-12 (bit 12 - m
+    # set for 30 days), the intercalary month (bits 12-15) and its length
+    # (bit 16), and the days of the year (bits 17-25).
+    data = KoreanLunarCalendar.KOREAN_LUNAR_DATA
+    base = KoreanLunarCalendar.KOREAN_LUNAR_BASE_YEAR
+    last = KoreanLunarCalendar.KOREAN_LUNAR_MAX_VALUE // 100
+    cal = KoreanLunarCalendar()
+    cal.setLunarDate(2000, 1, 1, False)
+    anchor = date(cal.solarYear, cal.solarMonth, cal.solarDay).toordinal()
+    year_starts = {2000: anchor}
+    for year in range(2001, END_YEAR + 1):
+        days = data[year - 1 - base] >> 17 & 0x1FF
+        year_starts[year] = year_starts[year - 1] + days
+    for year in range(1999, START_YEAR - 1, -1):
+        days = data[year - base] >> 17 & 0x1FF
+        year_starts[year] = year_starts[year + 1] - days
+    month_starts = {}
+    for year, ordinal in year_starts.items():
+        lunar_data = data[year - base]
+        intercalary = lunar_data >> 12 & 0xF
+        for month in range(1, 13):
+            if year * 100 + month > last:
+                break
+            month_starts[year, month] = ordinal
+            ordinal += 30 if lunar_data >> (12 - month) & 1 else 29
+            if month == intercalary:
+                ordinal += 30 if lunar_data >> 16 & 1 else 29
+    return month_starts
+
+
+# (lunar year, lunar month) -> ordinal of the Gregorian date of its 1st day
+_month_starts = _build_month_starts()
+
+
+def _month_start(lunar_year, lunar_month):
+    try:
+        return _month_starts[lunar_year, lunar_month]
+    except KeyError:
+        raise ValueError(
+            "Lunar date %d-%02d out of range" % (lunar_year, lunar_month)
+        )
+
+
+def lunar_to_gregorian(lunar_year, lunar_month, lunar_day):
+    """Return the Gregorian date of a (non intercalary month) lunar date."""
+    return date.fromordinal(
+        _month_start(lunar_year, lunar_month) + lunar_day - 1
+    )
+
+
+def lunar_to_gregorian_range(lunar_years, lunar_month, lunar_day):
+    """Return the Gregorian dates of a lunar date for each of
+    ``lunar_years``."""
+    return [
+        date.fromordinal(_month_start(year, lunar_month) + lunar_day - 1)
+        for year in lunar_years
+    ]
@@ -13,10 +13,10 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd
 
 
+from holidays.calendars.easter import easter
 from holidays.constants import TUE, THU, SUN
 from holidays.constants import FEB, MAR, APR, MAY, SEP, NOV, DEC
 from holidays.holiday_base import HolidayBase
@@ -30,56 +30,61 @@ class Angola(HolidayBase):
         HolidayBase.__init__(self, **kwargs)
 
     def _populate(self, year):
+        self._populate_apart(year, self._populate_holidays)
+
+    def _populate_holidays(self, year, holidays):
         # Observed since 1975
         # TODO do more research on history of Angolan holidays
 
         if year > 2018:
-            self[date(year, MAR, 23)] = "Dia da Libertação da África Austral"
+            holidays[
+                date(year, MAR, 23)
+            ] = "Dia da Libertação da África Austral"
 
         if year > 1979:
-            self[date(year, SEP, 17)] = "Dia do Herói Nacional"
+            holidays[date(year, SEP, 17)] = "Dia do Herói Nacional"
 
         if year > 1974:
-            self[date(year, 1, 1)] = "Ano novo"
+            holidays[date(year, 1, 1)] = "Ano novo"
 
             e = easter(year)
             good_friday = e - rd(days=2)
-            self[good_friday] = "Sexta-feira Santa"
+            holidays[good_friday] = "Sexta-feira Santa"
 
             # carnival is the Tuesday before Ash Wednesday
             # which is 40 days before easter excluding sundays
             carnival = e - rd(days=46)
             while carnival.weekday() != TUE:
                 carnival = carnival - rd(days=1)
-            self[carnival] = "Carnaval"
+            holidays[carnival] = "Carnaval"
 
-            self[date(year, FEB, 4)] = "Dia do Início da Luta Armada"
-            self[date(year, MAR, 8)] = "Dia Internacional da Mulher"
-            self[date(year, APR, 4)] = "Dia da Paz e Reconciliação"
-            self[date(year, MAY, 1)] = "Dia Mundial do Trabalho"
-            self[date(year, SEP, 17)] = "Dia dos Heroes Nacional"
-            self[date(year, NOV, 2)] = "Dia dos Finados"
-            self[date(year, NOV, 11)] = "Dia da Independência"
-            self[date(year, DEC, 25)] = "Dia de Natal e da Família"
+            holidays[date(year, FEB, 4)] = "Dia do Início da Luta Armada"
+            holidays[date(year, MAR, 8)] = "Dia Internacional da Mulher"
+            holidays[date(year, APR, 4)] = "Dia da Paz e Reconciliação"
+            holidays[date(year, MAY, 1)] = "Dia Mundial do Trabalho"
+            holidays[date(year, SEP, 17)] = "Dia dos Heroes Nacional"
+            holidays[date(year, NOV, 2)] = "Dia dos Finados"
+            holidays[date(year, NOV, 11)] = "Dia da Independência"
+            holidays[date(year, DEC, 25)] = "Dia de Natal e da Família"
 
         # As of 1995/1/1, whenever a public holiday falls on a Sunday,
         # it rolls over to the following Monday
         # Since 2018 when a public holiday falls on the Tuesday or Thursday
         # the Monday or Friday is also a holiday
-        for k, v in list(self.items()):
+        for k, v in list(holidays.items()):
             if self.observed and year > 1974:
                 if k.weekday() == SUN:
-                    self[k + rd(days=1)] = v + " (Observed)"
+                    holidays[k + rd(days=1)] = v + " (Observed)"
             if self.observed and year > 2017:
                 if k.weekday() == SUN:
                     pass
             if self.observed and year > 2017:
                 if k.weekday() == TUE:
-                    self[k - rd(days=1)] = v + " (Day off)"
+                    holidays[k - rd(days=1)] = v + " (Day off)"
                 elif k.weekday() == THU:
-                    self[k + rd(days=1)] = v + " (Day off)"
+                    holidays[k + rd(days=1)] = v + " (Day off)"
             if self.observed and year > 1994 and k.weekday() == SUN:
-                self[k + rd(days=1)] = v + " (Observed)"
+                holidays[k + rd(days=1)] = v + " (Observed)"
 
 
 class AO(Angola):
@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, FR, TH
 
+from holidays.calendars.easter import easter
 from holidays.constants import WEEKEND
 from holidays.constants import JAN, MAR, APR, MAY, JUN, JUL, AUG, OCT, NOV, DEC
 from holidays.holiday_base import HolidayBase
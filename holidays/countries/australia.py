@@ -13,23 +13,26 @@
 
 from datetime import date
 
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd, MO, SA, FR, WE, TU
-
+from holidays.calendars.easter import easter
 from holidays.constants import JAN, MAR, APR, MAY, JUN, AUG, SEP, OCT, NOV, DEC
-from holidays.constants import SAT, SUN, WEEKEND
-from holidays.holiday_base import HolidayBase
+from holidays.constants import MON, TUE, WED, FRI, SAT, SUN, WEEKEND
+from holidays.dateutils import (
+    nth_weekday,
+    weekday_on_or_after,
+    weekday_on_or_before,
+)
+from holidays.holiday_base import LayeredHolidayBase
 
 
-class Australia(HolidayBase):
+class Australia(LayeredHolidayBase):
     PROVINCES = ["ACT", "NSW", "NT", "QLD", "SA", "TAS", "VIC", "WA"]
 
     def __init__(self, **kwargs):
         self.country = "AU"
         self.prov = kwargs.pop("prov", None)
-        HolidayBase.__init__(self, **kwargs)
+        LayeredHolidayBase.__init__(self, **kwargs)
 
-    def _populate(self, year):
+    def _populate_national(self, year):
         # ACT:  Holidays Act 1958
         # NSW:  Public Holidays Act 2010
         # NT:   Public Holidays Act 2013
@@ -46,8 +49,31 @@ class Australia(HolidayBase):
         jan1 = date(year, JAN, 1)
         self[jan1] = name
         if self.observed and jan1.weekday() in WEEKEND:
-            self[jan1 + rd(weekday=MO)] = name + " (Observed)"
+            self[weekday_on_or_after(jan1, MON)] = name + " (Observed)"
+
+        # Easter
+        self[weekday_on_or_before(easter(year), FRI)] = "Good Friday"
+        self[weekday_on_or_after(easter(year), MON)] = "Easter Monday"
+
+        # Anzac Day
+        if year > 1920:
+            self[date(year, APR, 25)] = "Anzac Day"
+
+        # Christmas Day
+        name = "Christmas Day"
+        dec25 = date(year, DEC, 25)
+        self[dec25] = name
+        if self.observed and dec25.weekday() in WEEKEND:
+            self[date(year, DEC, 27)] = name + " (Observed)"
+
+        # Boxing Day
+        name = "Boxing Day"
+        dec26 = date(year, DEC, 26)
+        self[dec26] = name
+        if self.observed and dec26.weekday() in WEEKEND:
+            self[date(year, DEC, 28)] = name + " (Observed)"
 
+    def _populate_subdivision(self, year):
         # Australia Day
         jan26 = date(year, JAN, 26)
         if year >= 1935:
@@ -57,7 +83,7 @@ class Australia(HolidayBase):
                 name = "Australia Day"
             self[jan26] = name
             if self.observed and year >= 1946 and jan26.weekday() in WEEKEND:
-                self[jan26 + rd(weekday=MO)] = name + " (Observed)"
+                self[weekday_on_or_after(jan26, MON)] = name + " (Observed)"
         elif year >= 1888 and self.prov != "SA":
             name = "Anniversary Day"
             self[jan26] = name
@@ -67,9 +93,9 @@ class Australia(HolidayBase):
             name = "Adelaide Cup"
             if year >= 2006:
                 # subject to proclamation ?!?!
-                self[date(year, MAR, 1) + rd(weekday=MO(+2))] = name
+                self[nth_weekday(year, MAR, MON, 2)] = name
             else:
-                self[date(year, MAR, 1) + rd(weekday=MO(+3))] = name
+                self[nth_weekday(year, MAR, MON, 3)] = name
 
         # Canberra Day
         # Info from https://www.timeanddate.com/holidays/australia/canberra-day
@@ -79,36 +105,34 @@ class Australia(HolidayBase):
             if year >= 1913 and year <= 1957:
                 self[date(year, MAR, 12)] = name
             elif year >= 1958 and year <= 2007:
-                self[date(year, MAR, 1) + rd(weekday=MO(+3))] = name
+                self[nth_weekday(year, MAR, MON, 3)] = name
             elif year >= 2008 and year != 2012:
-                self[date(year, MAR, 1) + rd(weekday=MO(+2))] = name
+                self[nth_weekday(year, MAR, MON, 2)] = name
             elif year == 2012:
                 self[date(year, MAR, 12)] = name
 
         # Easter
-        self[easter(year) + rd(weekday=FR(-1))] = "Good Friday"
         if self.prov in ("ACT", "NSW", "NT", "QLD", "SA", "VIC"):
-            self[easter(year) + rd(weekday=SA(-1))] = "Easter Saturday"
+            self._add_before_national(
+                weekday_on_or_before(easter(year), SAT), "Easter Saturday"
+            )
         if self.prov in ("ACT", "NSW", "QLD", "VIC"):
-            self[easter(year)] = "Easter Sunday"
-        self[easter(year) + rd(weekday=MO)] = "Easter Monday"
+            self._add_before_national(easter(year), "Easter Sunday")
 
         # Anzac Day
-        if year > 1920:
+        if year > 1920 and self.observed:
             name = "Anzac Day"
             apr25 = date(year, APR, 25)
-            self[apr25] = name
-            if self.observed:
-                if apr25.weekday() == SAT and self.prov in ("WA", "NT"):
-                    self[apr25 + rd(weekday=MO)] = name + " (Observed)"
-                elif apr25.weekday() == SUN and self.prov in (
-                    "ACT",
-                    "QLD",
-                    "SA",
-                    "WA",
-                    "NT",
-                ):
-                    self[apr25 + rd(weekday=MO)] = name + " (Observed)"
+            if apr25.weekday() == SAT and self.prov in ("WA", "NT"):
+                self[weekday_on_or_after(apr25, MON)] = name + " (Observed)"
+            elif apr25.weekday() == SUN and self.prov in (
+                "ACT",
+                "QLD",
+                "SA",
+                "WA",
+                "NT",
+            ):
+                self[weekday_on_or_after(apr25, MON)] = name + " (Observed)"
 
         # Western Australia Day
         if self.prov == "WA" and year > 1832:
@@ -116,7 +140,7 @@ class Australia(HolidayBase):
                 name = "Western Australia Day"
             else:
                 name = "Foundation Day"
-            self[date(year, JUN, 1) + rd(weekday=MO(+1))] = name
+            self[nth_weekday(year, JUN, MON, 1)] = name
 
         # Sovereign's Birthday
         if year >= 1952:
@@ -129,16 +153,16 @@ class Australia(HolidayBase):
                 if year == 2012:
                     self[date(year, JUN, 11)] = "Queen's Diamond Jubilee"
                 if year < 2016 and year != 2012:
-                    dt = date(year, JUN, 1) + rd(weekday=MO(+2))
+                    dt = nth_weekday(year, JUN, MON, 2)
                     self[dt] = name
                 else:
-                    dt = date(year, OCT, 1) + rd(weekday=MO)
+                    dt = nth_weekday(year, OCT, MON, 1)
                     self[dt] = name
             elif self.prov == "WA":
                 # by proclamation ?!?!
-                self[date(year, OCT, 1) + rd(weekday=MO(-1))] = name
+                self[weekday_on_or_before(date(year, OCT, 1), MON)] = name
             elif self.prov in ("NSW", "VIC", "ACT", "SA", "NT", "TAS"):
-                dt = date(year, JUN, 1) + rd(weekday=MO(+2))
+                dt = nth_weekday(year, JUN, MON, 2)
                 self[dt] = name
         elif year > 1911:
             self[date(year, JUN, 3)] = name  # George V
@@ -148,39 +172,39 @@ class Australia(HolidayBase):
         # Picnic Day
         if self.prov == "NT":
             name = "Picnic Day"
-            self[date(year, AUG, 1) + rd(weekday=MO)] = name
+            self[nth_weekday(year, AUG, MON, 1)] = name
 
         # Bank Holiday
         if self.prov == "NSW":
             if year >= 1912:
                 name = "Bank Holiday"
-                self[date(year, 8, 1) + rd(weekday=MO)] = name
+                self[nth_weekday(year, 8, MON, 1)] = name
 
         # Labour Day
         name = "Labour Day"
         if self.prov in ("NSW", "ACT", "SA"):
-            self[date(year, OCT, 1) + rd(weekday=MO)] = name
+            self[nth_weekday(year, OCT, MON, 1)] = name
         elif self.prov == "WA":
-            self[date(year, MAR, 1) + rd(weekday=MO)] = name
+            self[nth_weekday(year, MAR, MON, 1)] = name
         elif self.prov == "VIC":
-            self[date(year, MAR, 1) + rd(weekday=MO(+2))] = name
+            self[nth_weekday(year, MAR, MON, 2)] = name
         elif self.prov == "QLD":
             if 2013 <= year <= 2015:
-                self[date(year, OCT, 1) + rd(weekday=MO)] = name
+                self[nth_weekday(year, OCT, MON, 1)] = name
             else:
-                self[date(year, MAY, 1) + rd(weekday=MO)] = name
+                self[nth_weekday(year, MAY, MON, 1)] = name
         elif self.prov == "NT":
             name = "May Day"
-            self[date(year, MAY, 1) + rd(weekday=MO)] = name
+            self[nth_weekday(year, MAY, MON, 1)] = name
         elif self.prov == "TAS":
             name = "Eight Hours Day"
-            self[date(year, MAR, 1) + rd(weekday=MO(+2))] = name
+            self[nth_weekday(year, MAR, MON, 2)] = name
 
         # Family & Community Day
         if self.prov == "ACT":
             name = "Family & Community Day"
             if 2007 <= year <= 2009:
-                self[date(year, NOV, 1) + rd(weekday=TU)] = name
+                self[nth_weekday(year, NOV, TUE, 1)] = name
             elif year == 2010:
                 # first Monday of the September/October school holidays
                 # moved to the second Monday if this falls on Labour day
@@ -206,7 +230,7 @@ class Australia(HolidayBase):
         if self.prov == "ACT":
             name = "Reconciliation Day"
             if year >= 2018:
-                self[date(year, 5, 27) + rd(weekday=MO)] = name
+                self[weekday_on_or_after(date(year, 5, 27), MON)] = name
 
         if self.prov == "VIC":
             # Grand Final Day
@@ -214,10 +238,12 @@ class Australia(HolidayBase):
                 # Rescheduled due to COVID-19
                 self[date(year, OCT, 23)] = "Grand Final Day"
             elif year >= 2015:
-                self[date(year, SEP, 24) + rd(weekday=FR)] = "Grand Final Day"
+                self[
+                    weekday_on_or_after(date(year, SEP, 24), FRI)
+                ] = "Grand Final Day"
 
             # Melbourne Cup
-            self[date(year, NOV, 1) + rd(weekday=TU)] = "Melbourne Cup"
+            self[nth_weekday(year, NOV, TUE, 1)] = "Melbourne Cup"
 
         # The Royal Queensland Show (Ekka)
         # The Show starts on the first Friday of August - providing this is
@@ -229,25 +255,22 @@ class Australia(HolidayBase):
                 self[date(year, AUG, 14)] = name
             else:
                 self[
-                    date(year, AUG, 5) + rd(weekday=FR) + rd(weekday=WE)
+                    weekday_on_or_after(
+                        weekday_on_or_after(date(year, AUG, 5), FRI), WED
+                    )
                 ] = name
 
-        # Christmas Day
-        name = "Christmas Day"
-        dec25 = date(year, DEC, 25)
-        self[dec25] = name
-        if self.observed and dec25.weekday() in WEEKEND:
-            self[date(year, DEC, 27)] = name + " (Observed)"
-
         # Boxing Day
         if self.prov == "SA":
-            name = "Proclamation Day"
-        else:
             name = "Boxing Day"
-        dec26 = date(year, DEC, 26)
-        self[dec26] = name
-        if self.observed and dec26.weekday() in WEEKEND:
-            self[date(year, DEC, 28)] = name + " (Observed)"
+            self._replace_national(
+                date(year, DEC, 26), name, "Proclamation Day"
+            )
+            self._replace_national(
+                date(year, DEC, 28),
+                name + " (Observed)",
+                "Proclamation Day (Observed)",
+            )
 
 
 class AU(Australia):
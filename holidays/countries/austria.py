@@ -11,41 +11,35 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date
-
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd, MO
-
 from holidays.constants import JAN, MAY, AUG, OCT, NOV, DEC
-from holidays.holiday_base import HolidayBase
+from holidays.rules import Easter, Fixed, RuleHolidayBase
 
 
-class Austria(HolidayBase):
+class Austria(RuleHolidayBase):
     PROVINCES = ["1", "2", "3", "4", "5", "6", "7", "8", "9"]
 
+    RULES = (
+        # public holidays
+        Fixed("Neujahr", JAN, 1),
+        Fixed("Heilige Drei Könige", JAN, 6),
+        Easter("Ostermontag", days=1),
+        Fixed("Staatsfeiertag", MAY, 1),
+        Easter("Christi Himmelfahrt", days=39),
+        Easter("Pfingstmontag", days=50),
+        Easter("Fronleichnam", days=60),
+        Fixed("Mariä Himmelfahrt", AUG, 15),
+        Fixed("Nationalfeiertag", NOV, 12, start_year=1919, end_year=1934),
+        Fixed("Nationalfeiertag", OCT, 26, start_year=1967),
+        Fixed("Allerheiligen", NOV, 1),
+        Fixed("Mariä Empfängnis", DEC, 8),
+        Fixed("Christtag", DEC, 25),
+        Fixed("Stefanitag", DEC, 26),
+    )
+
     def __init__(self, **kwargs):
         self.country = "AT"
         self.prov = kwargs.pop("prov", kwargs.pop("state", "9"))
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
-        # public holidays
-        self[date(year, JAN, 1)] = "Neujahr"
-        self[date(year, JAN, 6)] = "Heilige Drei Könige"
-        self[easter(year) + rd(weekday=MO)] = "Ostermontag"
-        self[date(year, MAY, 1)] = "Staatsfeiertag"
-        self[easter(year) + rd(days=39)] = "Christi Himmelfahrt"
-        self[easter(year) + rd(days=50)] = "Pfingstmontag"
-        self[easter(year) + rd(days=60)] = "Fronleichnam"
-        self[date(year, AUG, 15)] = "Mariä Himmelfahrt"
-        if 1919 <= year <= 1934:
-            self[date(year, NOV, 12)] = "Nationalfeiertag"
-        if year >= 1967:
-            self[date(year, OCT, 26)] = "Nationalfeiertag"
-        self[date(year, NOV, 1)] = "Allerheiligen"
-        self[date(year, DEC, 8)] = "Mariä Empfängnis"
-        self[date(year, DEC, 25)] = "Christtag"
-        self[date(year, DEC, 26)] = "Stefanitag"
+        RuleHolidayBase.__init__(self, **kwargs)
 
 
 class AT(Austria):
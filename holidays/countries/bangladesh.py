@@ -13,6 +13,7 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from holidays.calendars import hindu
 from holidays.constants import FEB, MAR, APR, MAY, AUG, DEC
 from holidays.holiday_base import HolidayBase
 
@@ -44,6 +45,10 @@ class Bangladesh(HolidayBase):
         # 1st May
         self[date(year, MAY, 1)] = "May Day"
 
+        # Buddha Purnima, tabulated from 1901 to 2100
+        if hindu.START_YEAR <= year <= hindu.END_YEAR:
+            self[hindu.buddha_purnima(year)] = "Buddha Purnima"
+
         # 15th AUG
         self[date(year, AUG, 15)] = "National Mourning Day"
 
@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter, EASTER_ORTHODOX
 from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.easter import easter, EASTER_ORTHODOX
 from holidays.constants import JAN, MAR, MAY, JUL, NOV, DEC
 from holidays.holiday_base import HolidayBase
 
@@ -11,63 +11,46 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date
-
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
-
 from holidays.constants import JAN, MAY, JUL, AUG, NOV, DEC
-from holidays.holiday_base import HolidayBase
+from holidays.rules import Easter, Fixed, RuleHolidayBase
 
 
-class Belgium(HolidayBase):
+class Belgium(RuleHolidayBase):
     """
     https://www.belgium.be/nl/over_belgie/land/belgie_in_een_notendop/feestdagen
     https://nl.wikipedia.org/wiki/Feestdagen_in_Belgi%C3%AB
     """
 
-    def __init__(self, **kwargs):
-        self.country = "BE"
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
+    RULES = (
         # New years
-        self[date(year, JAN, 1)] = "Nieuwjaarsdag"
-
-        easter_date = easter(year)
-
+        Fixed("Nieuwjaarsdag", JAN, 1),
         # Easter
-        self[easter_date] = "Pasen"
-
+        Easter("Pasen"),
         # Second easter day
-        self[easter_date + rd(days=1)] = "Paasmaandag"
-
+        Easter("Paasmaandag", days=1),
         # Ascension day
-        self[easter_date + rd(days=39)] = "O.L.H. Hemelvaart"
-
+        Easter("O.L.H. Hemelvaart", days=39),
         # Pentecost
-        self[easter_date + rd(days=49)] = "Pinksteren"
-
+        Easter("Pinksteren", days=49),
         # Pentecost monday
-        self[easter_date + rd(days=50)] = "Pinkstermaandag"
-
+        Easter("Pinkstermaandag", days=50),
         # International Workers' Day
-        self[date(year, MAY, 1)] = "Dag van de Arbeid"
-
+        Fixed("Dag van de Arbeid", MAY, 1),
         # Belgian National Day
-        self[date(year, JUL, 21)] = "Nationale feestdag"
-
+        Fixed("Nationale feestdag", JUL, 21),
         # Assumption of Mary
-        self[date(year, AUG, 15)] = "O.L.V. Hemelvaart"
-
+        Fixed("O.L.V. Hemelvaart", AUG, 15),
         # All Saints' Day
-        self[date(year, NOV, 1)] = "Allerheiligen"
-
+        Fixed("Allerheiligen", NOV, 1),
         # Armistice Day
-        self[date(year, NOV, 11)] = "Wapenstilstand"
-
+        Fixed("Wapenstilstand", NOV, 11),
         # First christmas
-        self[date(year, DEC, 25)] = "Kerstmis"
+        Fixed("Kerstmis", DEC, 25),
+    )
+
+    def __init__(self, **kwargs):
+        self.country = "BE"
+        RuleHolidayBase.__init__(self, **kwargs)
 
 
 class BE(Belgium):
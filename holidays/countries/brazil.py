@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, TU
 
+from holidays.calendars.easter import easter
 from holidays.constants import (
     JAN,
     MAR,
@@ -29,10 +29,10 @@ from holidays.constants import (
     NOV,
     DEC,
 )
-from holidays.holiday_base import HolidayBase
+from holidays.holiday_base import LayeredHolidayBase
 
 
-class Brazil(HolidayBase):
+class Brazil(LayeredHolidayBase):
     """
     https://pt.wikipedia.org/wiki/Feriados_no_Brasil
     """
@@ -69,9 +69,9 @@ class Brazil(HolidayBase):
 
     def __init__(self, **kwargs):
         self.country = "BR"
-        HolidayBase.__init__(self, **kwargs)
+        LayeredHolidayBase.__init__(self, **kwargs)
 
-    def _populate(self, year):
+    def _populate_national(self, year):
         # New Year's Day
         self[date(year, JAN, 1)] = "Ano novo"
 
@@ -101,6 +101,7 @@ class Brazil(HolidayBase):
 
         self[quaresma - rd(weekday=TU(-1))] = "Carnaval"
 
+    def _populate_subdivision(self, year):
         if self.state == "AC":
             self[date(year, JAN, 23)] = "Dia do evangélico"
             self[date(year, JUN, 15)] = "Aniversário do Acre"
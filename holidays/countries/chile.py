@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, MO, FR, SA
 
+from holidays.calendars.easter import easter
 from holidays.constants import JAN, MAY, JUN, JUL, AUG, SEP, OCT, NOV, DEC
 from holidays.constants import TUE, THU, FRI, SAT, SUN
 from holidays.holiday_base import HolidayBase
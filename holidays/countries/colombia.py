@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, MO, TH, FR
 
+from holidays.calendars.easter import easter
 from holidays.constants import JAN, MAR, MAY, JUN, JUL, AUG, OCT, NOV, DEC
 from holidays.constants import MON, WEEKEND
 from holidays.holiday_base import HolidayBase
@@ -12,61 +12,54 @@
 #  License: MIT (see LICENSE file)
 
 import warnings
-from datetime import date
-
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, MAY, JUL, SEP, OCT, NOV, DEC
-from holidays.holiday_base import HolidayBase
+from holidays.rules import Easter, Fixed, RuleHolidayBase
 
 
-class Czechia(HolidayBase):
+class Czechia(RuleHolidayBase):
     # https://en.wikipedia.org/wiki/Public_holidays_in_the_Czech_Republic
 
+    RULES = (
+        Fixed("Nový rok", JAN, 1, end_year=1999),
+        Fixed(
+            "Den obnovy samostatného českého státu", JAN, 1, start_year=2000
+        ),
+        Easter("Velký pátek", days=-2, end_year=1951),
+        Easter("Velký pátek", days=-2, start_year=2016),
+        Easter("Velikonoční pondělí", days=1),
+        Fixed("Svátek práce", MAY, 1, start_year=1951),
+        Fixed(
+            "Den vítězství nad hitlerovským fašismem",
+            MAY,
+            9,
+            start_year=1947,
+            end_year=1991,
+        ),
+        Fixed("Den vítězství", MAY, 8, start_year=1992),
+        Fixed(
+            "Den slovanských věrozvěstů Cyrila a Metoděje",
+            JUL,
+            5,
+            start_year=1951,
+        ),
+        Fixed("Den upálení mistra Jana Husa", JUL, 6, start_year=1951),
+        Fixed("Den české státnosti", SEP, 28, start_year=2000),
+        Fixed(
+            "Den vzniku samostatného československého státu",
+            OCT,
+            28,
+            start_year=1951,
+        ),
+        Fixed("Den boje za svobodu a demokracii", NOV, 17, start_year=1990),
+        Fixed("Štědrý den", DEC, 24, start_year=1990),
+        Fixed("1. svátek vánoční", DEC, 25, start_year=1951),
+        Fixed("2. svátek vánoční", DEC, 26, start_year=1951),
+    )
+
     def __init__(self, **kwargs):
         self.country = "CZ"
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
-        self[date(year, JAN, 1)] = (
-            "Den obnovy samostatného českého" " státu"
-            if year >= 2000
-            else "Nový rok"
-        )
-
-        e = easter(year)
-        if year <= 1951 or year >= 2016:
-            self[e - rd(days=2)] = "Velký pátek"
-        self[e + rd(days=1)] = "Velikonoční pondělí"
-
-        if year >= 1951:
-            self[date(year, MAY, 1)] = "Svátek práce"
-        if year >= 1992:
-            self[date(year, MAY, 8)] = "Den vítězství"
-        elif year >= 1947:
-            self[date(year, MAY, 9)] = (
-                "Den vítězství nad hitlerovským" " fašismem"
-            )
-        if year >= 1951:
-            self[date(year, JUL, 5)] = (
-                "Den slovanských věrozvěstů " "Cyrila a Metoděje"
-            )
-            self[date(year, JUL, 6)] = "Den upálení mistra Jana Husa"
-        if year >= 2000:
-            self[date(year, SEP, 28)] = "Den české státnosti"
-        if year >= 1951:
-            self[date(year, OCT, 28)] = (
-                "Den vzniku samostatného " "československého státu"
-            )
-        if year >= 1990:
-            self[date(year, NOV, 17)] = "Den boje za svobodu a demokracii"
-
-        if year >= 1990:
-            self[date(year, DEC, 24)] = "Štědrý den"
-        if year >= 1951:
-            self[date(year, DEC, 25)] = "1. svátek vánoční"
-            self[date(year, DEC, 26)] = "2. svátek vánoční"
+        RuleHolidayBase.__init__(self, **kwargs)
 
 
 class CZ(Czechia):
@@ -11,36 +11,33 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date
-
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd, SU, TH, FR, MO
-
 from holidays.constants import JAN, DEC
-from holidays.holiday_base import HolidayBase
+from holidays.rules import Easter, Fixed, RuleHolidayBase
 
 
-class Denmark(HolidayBase):
+class Denmark(RuleHolidayBase):
     # https://en.wikipedia.org/wiki/Public_holidays_in_Denmark
 
+    RULES = (
+        # Public holidays
+        Fixed("Nytårsdag", JAN, 1),
+        Easter("Palmesøndag", days=-7),
+        Easter("Skærtorsdag", days=-3),
+        Easter("Langfredag", days=-2),
+        Easter("Påskedag"),
+        Easter("Anden påskedag", days=1),
+        # Fourth Friday after Easter
+        Easter("Store bededag", days=26),
+        Easter("Kristi himmelfartsdag", days=39),
+        Easter("Pinsedag", days=49),
+        Easter("Anden pinsedag", days=50),
+        Fixed("Juledag", DEC, 25),
+        Fixed("Anden juledag", DEC, 26),
+    )
+
     def __init__(self, **kwargs):
         self.country = "DK"
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
-        # Public holidays
-        self[date(year, JAN, 1)] = "Nytårsdag"
-        self[easter(year) + rd(weekday=SU(-2))] = "Palmesøndag"
-        self[easter(year) + rd(weekday=TH(-1))] = "Skærtorsdag"
-        self[easter(year) + rd(weekday=FR(-1))] = "Langfredag"
-        self[easter(year)] = "Påskedag"
-        self[easter(year) + rd(weekday=MO)] = "Anden påskedag"
-        self[easter(year) + rd(weekday=FR(+4))] = "Store bededag"
-        self[easter(year) + rd(days=39)] = "Kristi himmelfartsdag"
-        self[easter(year) + rd(days=49)] = "Pinsedag"
-        self[easter(year) + rd(days=50)] = "Anden pinsedag"
-        self[date(year, DEC, 25)] = "Juledag"
-        self[date(year, DEC, 26)] = "Anden juledag"
+        RuleHolidayBase.__init__(self, **kwargs)
 
 
 class DK(Denmark):
@@ -13,15 +13,13 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd
+from holidays.calendars.easter import easter
 from holidays.constants import FRI, SAT
 from holidays.constants import JAN, MAY, JUN
 from holidays.holiday_base import HolidayBase
 from holidays.utils import get_gre_date
 
-WEEKEND = (FRI, SAT)
-
 # Since Djibouti share most of it's holidays with other muslim countries,
 # this class is just a copy of Egypt's.
 
@@ -42,6 +40,8 @@ class Djibouti(HolidayBase):
     #  Python >= 3.6
     # is_weekend function is there, however not activated for accuracy.
 
+    WEEKENDS = ((None, (FRI, SAT)),)
+
     def __init__(self, **kwargs):
         self.country = "DJ"
         HolidayBase.__init__(self, **kwargs)
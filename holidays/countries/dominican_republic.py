@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, MO, FR
 
+from holidays.calendars.easter import easter
 from holidays.constants import JAN, FEB, MAY, JUN, AUG, SEP, NOV, DEC
 from holidays.holiday_base import HolidayBase
 
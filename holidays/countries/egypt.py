@@ -13,15 +13,13 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd
+from holidays.calendars.easter import easter
 from holidays.constants import FRI, SAT
 from holidays.constants import JAN, APR, MAY, JUN, JUL, OCT
 from holidays.holiday_base import HolidayBase
 from holidays.utils import get_gre_date
 
-WEEKEND = (FRI, SAT)
-
 
 class Egypt(HolidayBase):
 
@@ -38,6 +36,8 @@ class Egypt(HolidayBase):
     #  Python >= 3.6
     # is_weekend function is there, however not activated for accuracy.
 
+    WEEKENDS = ((None, (FRI, SAT)),)
+
     def __init__(self, **kwargs):
         self.country = "EG"
         HolidayBase.__init__(self, **kwargs)
@@ -11,58 +11,41 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date
-
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
-
 from holidays.constants import JAN, FEB, MAY, JUN, AUG, DEC
-from holidays.holiday_base import HolidayBase
-
-
-class Estonia(HolidayBase):
-    def __init__(self, **kwargs):
-        self.country = "EE"
-        HolidayBase.__init__(self, **kwargs)
+from holidays.rules import Easter, Fixed, RuleHolidayBase
 
-    def _populate(self, year):
-        e = easter(year)
 
+class Estonia(RuleHolidayBase):
+    RULES = (
         # New Year's Day
-        self[date(year, JAN, 1)] = "uusaasta"
-
+        Fixed("uusaasta", JAN, 1),
         # Independence Day, anniversary of the Republic of Estonia
-        self[date(year, FEB, 24)] = "iseseisvuspäev"
-
+        Fixed("iseseisvuspäev", FEB, 24),
         # Good Friday
-        self[e - rd(days=2)] = "suur reede"
-
+        Easter("suur reede", days=-2),
         # Easter Sunday
-        self[e] = "ülestõusmispühade 1. püha"
-
+        Easter("ülestõusmispühade 1. püha"),
         # Spring Day
-        self[date(year, MAY, 1)] = "kevadpüha"
-
+        Fixed("kevadpüha", MAY, 1),
         # Pentecost
-        self[e + rd(days=49)] = "nelipühade 1. püha"
-
+        Easter("nelipühade 1. püha", days=49),
         # Victory Day
-        self[date(year, JUN, 23)] = "võidupüha"
-
+        Fixed("võidupüha", JUN, 23),
         # Midsummer Day
-        self[date(year, JUN, 24)] = "jaanipäev"
-
+        Fixed("jaanipäev", JUN, 24),
         # Day of Restoration of Independence
-        self[date(year, AUG, 20)] = "taasiseseisvumispäev"
-
+        Fixed("taasiseseisvumispäev", AUG, 20),
         # Christmas Eve
-        self[date(year, DEC, 24)] = "jõululaupäev"
-
+        Fixed("jõululaupäev", DEC, 24),
         # Christmas Day
-        self[date(year, DEC, 25)] = "esimene jõulupüha"
-
+        Fixed("esimene jõulupüha", DEC, 25),
         # Boxing Day
-        self[date(year, DEC, 26)] = "teine jõulupüha"
+        Fixed("teine jõulupüha", DEC, 26),
+    )
+
+    def __init__(self, **kwargs):
+        self.country = "EE"
+        RuleHolidayBase.__init__(self, **kwargs)
 
 
 class EE(Estonia):
@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.easter import easter
 from holidays.constants import JAN, MAY, DEC
 from holidays.holiday_base import HolidayBase
 
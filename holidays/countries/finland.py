@@ -11,43 +11,36 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date
+from holidays.constants import JAN, MAY, JUN, OCT, DEC, FRI, SAT
+from holidays.rules import Easter, Fixed, RuleHolidayBase, Weekday
 
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd, SA, FR
 
-from holidays.constants import JAN, MAY, JUN, OCT, DEC
-from holidays.holiday_base import HolidayBase
-
-
-class Finland(HolidayBase):
+class Finland(RuleHolidayBase):
     # https://en.wikipedia.org/wiki/Public_holidays_in_Finland
 
-    def __init__(self, **kwargs):
-        self.country = "FI"
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
-        e = easter(year)
-
-        self[date(year, JAN, 1)] = "Uudenvuodenpäivä"
-        self[date(year, JAN, 6)] = "Loppiainen"
-        self[e - rd(days=2)] = "Pitkäperjantai"
-        self[e] = "Pääsiäispäivä"
-        self[e + rd(days=1)] = "2. pääsiäispäivä"
-        self[date(year, MAY, 1)] = "Vappu"
-        self[e + rd(days=39)] = "Helatorstai"
-        self[e + rd(days=49)] = "Helluntaipäivä"
-        self[date(year, JUN, 20) + rd(weekday=SA)] = "Juhannuspäivä"
-        self[date(year, OCT, 31) + rd(weekday=SA)] = "Pyhäinpäivä"
-        self[date(year, DEC, 6)] = "Itsenäisyyspäivä"
-        self[date(year, DEC, 25)] = "Joulupäivä"
-        self[date(year, DEC, 26)] = "Tapaninpäivä"
-
+    RULES = (
+        Fixed("Uudenvuodenpäivä", JAN, 1),
+        Fixed("Loppiainen", JAN, 6),
+        Easter("Pitkäperjantai", days=-2),
+        Easter("Pääsiäispäivä"),
+        Easter("2. pääsiäispäivä", days=1),
+        Fixed("Vappu", MAY, 1),
+        Easter("Helatorstai", days=39),
+        Easter("Helluntaipäivä", days=49),
+        Weekday("Juhannuspäivä", JUN, 20, SAT),
+        Weekday("Pyhäinpäivä", OCT, 31, SAT),
+        Fixed("Itsenäisyyspäivä", DEC, 6),
+        Fixed("Joulupäivä", DEC, 25),
+        Fixed("Tapaninpäivä", DEC, 26),
         # Juhannusaatto (Midsummer Eve) and Jouluaatto (Christmas Eve) are not
         # official holidays, but are de facto.
-        self[date(year, JUN, 19) + rd(weekday=FR)] = "Juhannusaatto"
-        self[date(year, DEC, 24)] = "Jouluaatto"
+        Weekday("Juhannusaatto", JUN, 19, FRI),
+        Fixed("Jouluaatto", DEC, 24),
+    )
+
+    def __init__(self, **kwargs):
+        self.country = "FI"
+        RuleHolidayBase.__init__(self, **kwargs)
 
 
 class FI(Finland):
@@ -11,16 +11,11 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date
+from holidays.constants import JAN, MAR, MAY, AUG, SEP, OCT, NOV, DEC, WED
+from holidays.rules import Easter, Fixed, RuleHolidayBase, Weekday
 
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd, WE
 
-from holidays.constants import JAN, MAR, MAY, AUG, SEP, OCT, NOV, DEC
-from holidays.holiday_base import HolidayBase
-
-
-class Germany(HolidayBase):
+class Germany(RuleHolidayBase):
     """Official holidays for Germany in its current form.
 
     This class doesn't return any holidays before 1990-10-03.
@@ -75,89 +70,104 @@ class Germany(HolidayBase):
         "TH",
     ]
 
-    def __init__(self, **kwargs):
-        self.country = "DE"
-        self.prov = kwargs.pop("prov", None)
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
-        if year <= 1989:
-            return
-
-        if year > 1990:
-
-            self[date(year, JAN, 1)] = "Neujahr"
-
-            if self.prov in ("BW", "BY", "BYP", "ST"):
-                self[date(year, JAN, 6)] = "Heilige Drei Könige"
-
-            self[easter(year) - rd(days=2)] = "Karfreitag"
-
-            if self.prov == "BB":
-                # will always be a Sunday and we have no "observed" rule so
-                # this is pretty pointless but it's nonetheless an official
-                # holiday by law
-                self[easter(year)] = "Ostersonntag"
-
-            self[easter(year) + rd(days=1)] = "Ostermontag"
-
-            self[date(year, MAY, 1)] = "Erster Mai"
-
-            if self.prov == "BE" and year == 2020:
-                self[date(year, MAY, 8)] = (
-                    "75. Jahrestag der Befreiung vom Nationalsozialismus "
-                    "und der Beendigung des Zweiten Weltkriegs in Europa"
-                )
-
-            self[easter(year) + rd(days=39)] = "Christi Himmelfahrt"
-
-            if self.prov == "BB":
-                # will always be a Sunday and we have no "observed" rule so
-                # this is pretty pointless but it's nonetheless an official
-                # holiday by law
-                self[easter(year) + rd(days=49)] = "Pfingstsonntag"
-
-            self[easter(year) + rd(days=50)] = "Pfingstmontag"
-
-            if self.prov in ("BW", "BY", "BYP", "HE", "NW", "RP", "SL"):
-                self[easter(year) + rd(days=60)] = "Fronleichnam"
-
-            if self.prov in ("BY", "SL"):
-                self[date(year, AUG, 15)] = "Mariä Himmelfahrt"
-
-        self[date(year, OCT, 3)] = "Tag der Deutschen Einheit"
-
-        if self.prov in ("BB", "MV", "SN", "ST", "TH"):
-            self[date(year, OCT, 31)] = "Reformationstag"
-
-        if self.prov in ("HB", "SH", "NI", "HH") and year >= 2018:
-            self[date(year, OCT, 31)] = "Reformationstag"
-
+    RULES = (
+        Fixed("Neujahr", JAN, 1, start_year=1991),
+        Fixed(
+            "Heilige Drei Könige",
+            JAN,
+            6,
+            start_year=1991,
+            subdivisions=("BW", "BY", "BYP", "ST"),
+        ),
+        Easter("Karfreitag", days=-2, start_year=1991),
+        # will always be a Sunday and we have no "observed" rule so this is
+        # pretty pointless but it's nonetheless an official holiday by law
+        Easter("Ostersonntag", start_year=1991, subdivisions=("BB",)),
+        Easter("Ostermontag", days=1, start_year=1991),
+        Fixed("Erster Mai", MAY, 1, start_year=1991),
+        Fixed(
+            "75. Jahrestag der Befreiung vom Nationalsozialismus "
+            "und der Beendigung des Zweiten Weltkriegs in Europa",
+            MAY,
+            8,
+            start_year=2020,
+            end_year=2020,
+            subdivisions=("BE",),
+        ),
+        Easter("Christi Himmelfahrt", days=39, start_year=1991),
+        # will always be a Sunday and we have no "observed" rule so this is
+        # pretty pointless but it's nonetheless an official holiday by law
+        Easter(
+            "Pfingstsonntag", days=49, start_year=1991, subdivisions=("BB",)
+        ),
+        Easter("Pfingstmontag", days=50, start_year=1991),
+        Easter(
+            "Fronleichnam",
+            days=60,
+            start_year=1991,
+            subdivisions=("BW", "BY", "BYP", "HE", "NW", "RP", "SL"),
+        ),
+        Fixed(
+            "Mariä Himmelfahrt",
+            AUG,
+            15,
+            start_year=1991,
+            subdivisions=("BY", "SL"),
+        ),
+        Fixed("Tag der Deutschen Einheit", OCT, 3, start_year=1990),
+        Fixed(
+            "Reformationstag",
+            OCT,
+            31,
+            start_year=1990,
+            subdivisions=("BB", "MV", "SN", "ST", "TH"),
+        ),
+        Fixed(
+            "Reformationstag",
+            OCT,
+            31,
+            start_year=2018,
+            subdivisions=("HB", "SH", "NI", "HH"),
+        ),
         # in 2017 all states got the Reformationstag (500th anniversary of
         # Luther's thesis)
-        if year == 2017:
-            self[date(year, OCT, 31)] = "Reformationstag"
+        Fixed("Reformationstag", OCT, 31, start_year=2017, end_year=2017),
+        Fixed(
+            "Allerheiligen",
+            NOV,
+            1,
+            start_year=1990,
+            subdivisions=("BW", "BY", "BYP", "NW", "RP", "SL"),
+        ),
+        # the last wednesday before year-11-23
+        Weekday(
+            "Buß- und Bettag", NOV, 22, WED, -1, start_year=1990, end_year=1994
+        ),
+        Weekday(
+            "Buß- und Bettag",
+            NOV,
+            22,
+            WED,
+            -1,
+            start_year=1995,
+            subdivisions=("SN",),
+        ),
+        Fixed("Weltkindertag", SEP, 20, start_year=2019, subdivisions=("TH",)),
+        Fixed(
+            "Internationaler Frauentag",
+            MAR,
+            8,
+            start_year=2019,
+            subdivisions=("BE",),
+        ),
+        Fixed("Erster Weihnachtstag", DEC, 25, start_year=1990),
+        Fixed("Zweiter Weihnachtstag", DEC, 26, start_year=1990),
+    )
 
-        if self.prov in ("BW", "BY", "BYP", "NW", "RP", "SL"):
-            self[date(year, NOV, 1)] = "Allerheiligen"
-
-        if year <= 1994 or self.prov == "SN":
-            # can be calculated as "last wednesday before year-11-23" which is
-            # why we need to go back two wednesdays if year-11-23 happens to be
-            # a wednesday
-            base_data = date(year, NOV, 23)
-            weekday_delta = WE(-2) if base_data.weekday() == 2 else WE(-1)
-            self[base_data + rd(weekday=weekday_delta)] = "Buß- und Bettag"
-
-        if year >= 2019:
-            if self.prov == "TH":
-                self[date(year, SEP, 20)] = "Weltkindertag"
-
-            if self.prov == "BE":
-                self[date(year, MAR, 8)] = "Internationaler Frauentag"
-
-        self[date(year, DEC, 25)] = "Erster Weihnachtstag"
-        self[date(year, DEC, 26)] = "Zweiter Weihnachtstag"
+    def __init__(self, **kwargs):
+        self.country = "DE"
+        self.prov = kwargs.pop("prov", None)
+        RuleHolidayBase.__init__(self, **kwargs)
 
 
 class DE(Germany):
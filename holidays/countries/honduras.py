@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, TH, FR, SA, SU
 
+from holidays.calendars.easter import easter
 from holidays.constants import JAN, FEB, MAR, APR, MAY, SEP, OCT, DEC
 from holidays.holiday_base import HolidayBase
 
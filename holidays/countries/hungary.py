@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, FR
 
+from holidays.calendars.easter import easter
 from holidays.constants import JAN, MAR, APR, MAY, AUG, OCT, NOV, DEC
 from holidays.constants import MON, TUE, THU, WEEKEND
 from holidays.holiday_base import HolidayBase
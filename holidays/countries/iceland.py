@@ -11,43 +11,39 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date
+from holidays.constants import JAN, APR, MAY, JUN, AUG, DEC, MON, THU
+from holidays.rules import Easter, Fixed, NthWeekday, RuleHolidayBase, Weekday
 
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd, FR, TH, MO
 
-from holidays.constants import JAN, APR, MAY, JUN, AUG, DEC
-from holidays.holiday_base import HolidayBase
-
-
-class Iceland(HolidayBase):
+class Iceland(RuleHolidayBase):
     # https://en.wikipedia.org/wiki/Public_holidays_in_Iceland
     # https://www.officeholidays.com/countries/iceland/index.php
-    def __init__(self, **kwargs):
-        self.country = "IS"
-        HolidayBase.__init__(self, **kwargs)
 
-    def _populate(self, year):
+    RULES = (
         # Public holidays
-        self[date(year, JAN, 1)] = "Nýársdagur"
-        self[easter(year) - rd(days=3)] = "Skírdagur"
-        self[easter(year) + rd(weekday=FR(-1))] = "Föstudagurinn langi"
-        self[easter(year)] = "Páskadagur"
-        self[easter(year) + rd(days=1)] = "Annar í páskum"
-        self[date(year, APR, 19) + rd(weekday=TH(+1))] = "Sumardagurinn fyrsti"
-        self[date(year, MAY, 1)] = "Verkalýðsdagurinn"
-        self[easter(year) + rd(days=39)] = "Uppstigningardagur"
-        self[easter(year) + rd(days=49)] = "Hvítasunnudagur"
-        self[easter(year) + rd(days=50)] = "Annar í hvítasunnu"
-        self[date(year, JUN, 17)] = "Þjóðhátíðardagurinn"
+        Fixed("Nýársdagur", JAN, 1),
+        Easter("Skírdagur", days=-3),
+        Easter("Föstudagurinn langi", days=-2),
+        Easter("Páskadagur"),
+        Easter("Annar í páskum", days=1),
+        # First Thursday after April 18th
+        Weekday("Sumardagurinn fyrsti", APR, 19, THU),
+        Fixed("Verkalýðsdagurinn", MAY, 1),
+        Easter("Uppstigningardagur", days=39),
+        Easter("Hvítasunnudagur", days=49),
+        Easter("Annar í hvítasunnu", days=50),
+        Fixed("Þjóðhátíðardagurinn", JUN, 17),
         # First Monday of August
-        self[
-            date(year, AUG, 1) + rd(weekday=MO(+1))
-        ] = "Frídagur verslunarmanna"
-        self[date(year, DEC, 24)] = "Aðfangadagur"
-        self[date(year, DEC, 25)] = "Jóladagur"
-        self[date(year, DEC, 26)] = "Annar í jólum"
-        self[date(year, DEC, 31)] = "Gamlársdagur"
+        NthWeekday("Frídagur verslunarmanna", AUG, MON, 1),
+        Fixed("Aðfangadagur", DEC, 24),
+        Fixed("Jóladagur", DEC, 25),
+        Fixed("Annar í jólum", DEC, 26),
+        Fixed("Gamlársdagur", DEC, 31),
+    )
+
+    def __init__(self, **kwargs):
+        self.country = "IS"
+        RuleHolidayBase.__init__(self, **kwargs)
 
 
 class IS(Iceland):
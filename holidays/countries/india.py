@@ -13,11 +13,12 @@
 
 from datetime import date
 
+from holidays.calendars import hindu
 from holidays.constants import JAN, MAR, APR, MAY, JUN, AUG, OCT, NOV, DEC
-from holidays.holiday_base import HolidayBase
+from holidays.holiday_base import LayeredHolidayBase
 
 
-class India(HolidayBase):
+class India(LayeredHolidayBase):
     # https://en.wikipedia.org/wiki/Public_holidays_in_India
     # https://www.calendarlabs.com/holidays/india/
     # https://slusi.dacnet.nic.in/watershedatlas/list_of_state_abbreviation.htm
@@ -45,9 +46,9 @@ class India(HolidayBase):
 
     def __init__(self, **kwargs):
         self.country = "IN"
-        HolidayBase.__init__(self, **kwargs)
+        LayeredHolidayBase.__init__(self, **kwargs)
 
-    def _populate(self, year):
+    def _populate_national(self, year):
         # Pongal/ Makar Sankranti
         self[date(year, JAN, 14)] = "Makar Sankranti / Pongal"
 
@@ -68,6 +69,15 @@ class India(HolidayBase):
         # Christmas
         self[date(year, DEC, 25)] = "Christmas"
 
+        # Lunisolar festivals, tabulated from 1901 to 2100
+        if hindu.START_YEAR <= year <= hindu.END_YEAR:
+            # Holi
+            self[hindu.holi(year)] = "Holi"
+
+            # Diwali
+            self[hindu.diwali(year)] = "Diwali"
+
+    def _populate_subdivision(self, year):
         # GJ: Gujarat
         if self.prov == "GJ":
             self[date(year, JAN, 14)] = "Uttarayan"
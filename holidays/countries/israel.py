@@ -12,125 +12,121 @@
 #  License: MIT (see LICENSE file)
 
 
-from convertdate import gregorian, hebrew
-from convertdate.holidays import (
-    hanukkah,
-    lag_baomer,
-    passover,
-    purim,
-    rosh_hashanah,
-    shavuot,
-    sukkot,
-    yom_kippur,
-)
-from datetime import date
-from dateutil.relativedelta import relativedelta as rd
+from datetime import timedelta
 
+from holidays.calendars import hebrew
+from holidays.constants import FRI, SAT
 from holidays.holiday_base import HolidayBase
 
 
 class Israel(HolidayBase):
+    WEEKENDS = ((None, (FRI, SAT)),)
+
     def __init__(self, **kwargs):
         self.country = "IL"
 
         HolidayBase.__init__(self, **kwargs)
 
     def _populate(self, year):
+        # Spring holidays are fixed offsets from Passover (Nisan 15), autumn
+        # ones from Rosh Hashanah (Tishri 1).
+        passover_dt = hebrew.to_gregorian_year(year, hebrew.NISAN, 15)
+        rosh_hashanah_dt = hebrew.to_gregorian_year(year, hebrew.TISHRI, 1)
+
         # Passover
         name = "Passover I"
-        year, month, day = passover(year, eve=True)
-        passover_start_dt = date(year, month, day)
+        passover_start_dt = passover_dt - timedelta(days=1)
         self[passover_start_dt] = name + " - Eve"
-        self[passover_start_dt + rd(days=1)] = name
+        self[passover_dt] = name
 
         name = "Passover"
         for offset in range(2, 6):
-            self[passover_start_dt + rd(days=offset)] = name + " - Chol HaMoed"
+            self[passover_start_dt + timedelta(days=offset)] = (
+                name + " - Chol HaMoed"
+            )
 
         name = "Passover VII"
-        self[passover_start_dt + rd(days=6)] = name + " - Eve"
-        self[passover_start_dt + rd(days=7)] = name
+        self[passover_start_dt + timedelta(days=6)] = name + " - Eve"
+        self[passover_start_dt + timedelta(days=7)] = name
 
-        # Memorial Day
+        # Memorial Day (Iyyar 4, the day after Iyyar 3)
         name = "Memorial Day"
-        year, month, day = gregorian.from_jd(
-            hebrew.to_jd_gregorianyear(year, hebrew.IYYAR, 3)
-        )
-        self[date(year, month, day) + rd(days=1)] = name
+        iyyar_3_dt = passover_dt + timedelta(days=18)
+        self[iyyar_3_dt + timedelta(days=1)] = name
 
         observed_delta = 0
         if self.observed:
-            day_in_week = date(year, month, day).weekday()
+            day_in_week = iyyar_3_dt.weekday()
             if day_in_week in (2, 3):
                 observed_delta = -(day_in_week - 1)
             elif 2004 <= year and day_in_week == 5:
                 observed_delta = 1
 
             if observed_delta != 0:
-                self[date(year, month, day) + rd(days=observed_delta + 1)] = (
+                self[iyyar_3_dt + timedelta(days=observed_delta + 1)] = (
                     name + " (Observed)"
                 )
 
         # Independence Day
         name = "Independence Day"
-        self[date(year, month, day) + rd(days=2)] = name
+        self[iyyar_3_dt + timedelta(days=2)] = name
 
         if self.observed and observed_delta != 0:
-            self[date(year, month, day) + rd(days=observed_delta + 2)] = (
+            self[iyyar_3_dt + timedelta(days=observed_delta + 2)] = (
                 name + " (Observed)"
             )
 
-        # Lag Baomer
+        # Lag Baomer (Iyyar 18)
         name = "Lag B'Omer"
-        year, month, day = lag_baomer(year, eve=False)
-        self[date(year, month, day)] = name
+        self[passover_dt + timedelta(days=33)] = name
 
-        # Shavuot
+        # Shavuot (Sivan 6)
         name = "Shavuot"
-        year, month, day = shavuot(year, eve=True)
-        self[date(year, month, day)] = name + " - Eve"
-        self[date(year, month, day) + rd(days=1)] = name
+        shavuot_dt = passover_dt + timedelta(days=50)
+        self[shavuot_dt - timedelta(days=1)] = name + " - Eve"
+        self[shavuot_dt] = name
 
         # Rosh Hashana
         name = "Rosh Hashanah"
-        year, month, day = rosh_hashanah(year, eve=True)
-        self[date(year, month, day)] = name + " - Eve"
-        self[date(year, month, day) + rd(days=1)] = name
-        self[date(year, month, day) + rd(days=2)] = name
+        self[rosh_hashanah_dt - timedelta(days=1)] = name + " - Eve"
+        self[rosh_hashanah_dt] = name
+        self[rosh_hashanah_dt + timedelta(days=1)] = name
 
-        # Yom Kippur
+        # Yom Kippur (Tishri 10)
         name = "Yom Kippur"
-        year, month, day = yom_kippur(year, eve=True)
-        self[date(year, month, day)] = name + " - Eve"
-        self[date(year, month, day) + rd(days=1)] = name
+        yom_kippur_dt = rosh_hashanah_dt + timedelta(days=9)
+        self[yom_kippur_dt - timedelta(days=1)] = name + " - Eve"
+        self[yom_kippur_dt] = name
 
-        # Sukkot
+        # Sukkot (Tishri 15)
         name = "Sukkot I"
-        year, month, day = sukkot(year, eve=True)
-        sukkot_start_dt = date(year, month, day)
+        sukkot_start_dt = rosh_hashanah_dt + timedelta(days=13)
         self[sukkot_start_dt] = name + " - Eve"
-        self[sukkot_start_dt + rd(days=1)] = name
+        self[sukkot_start_dt + timedelta(days=1)] = name
 
         name = "Sukkot"
         for offset in range(2, 7):
-            self[sukkot_start_dt + rd(days=offset)] = name + " - Chol HaMoed"
+            self[sukkot_start_dt + timedelta(days=offset)] = (
+                name + " - Chol HaMoed"
+            )
 
         name = "Sukkot VII"
-        self[sukkot_start_dt + rd(days=7)] = name + " - Eve"
-        self[sukkot_start_dt + rd(days=8)] = name
+        self[sukkot_start_dt + timedelta(days=7)] = name + " - Eve"
+        self[sukkot_start_dt + timedelta(days=8)] = name
 
-        # Hanukkah
+        # Hanukkah (Kislev 25, depends on the length of the Hebrew year)
         name = "Hanukkah"
-        year, month, day = hanukkah(year, eve=False)
+        hanukkah_dt = hebrew.to_gregorian_year(year, hebrew.KISLEV, 25)
         for offset in range(8):
-            self[date(year, month, day) + rd(days=offset)] = name
+            self[hanukkah_dt + timedelta(days=offset)] = name
 
-        # Purim
+        # Purim (Adar 14, or Adar II 14 in leap years: always the 14th of
+        # the 29 day month before Nisan)
         name = "Purim"
-        year, month, day = purim(year, eve=True)
-        self[date(year, month, day)] = name + " - Eve"
-        self[date(year, month, day) + rd(days=1)] = name
-        self[date(year, month, day) + rd(days=2)] = "Shushan Purim"
+        purim_dt = passover_dt - timedelta(days=30)
+        self[purim_dt - timedelta(days=1)] = name + " - Eve"
+        self[purim_dt] = name
+        self[purim_dt + timedelta(days=1)] = "Shushan Purim"
 
 
 class IL(Israel):
@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, MO
 
+from holidays.calendars.easter import easter
 from holidays.constants import (
     JAN,
     FEB,
@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import FR, MO, SU, WE
 from dateutil.relativedelta import relativedelta as rd
+from holidays.calendars.easter import easter
 from holidays.constants import AUG, DEC, FEB, JAN, JUN, MAY, OCT, SUN, WEEKEND
 from holidays.holiday_base import HolidayBase
 
@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, FR, MO
 
+from holidays.calendars.easter import easter
 from holidays.constants import JAN, MAY, JUN, OCT, DEC
 from holidays.constants import SUN
 from holidays.holiday_base import HolidayBase
@@ -29,20 +29,23 @@ class Kenya(HolidayBase):
         HolidayBase.__init__(self, **kwargs)
 
     def _populate(self, year):
+        self._populate_apart(year, self._populate_holidays)
+
+    def _populate_holidays(self, year, holidays):
         # Public holidays
-        self[date(year, JAN, 1)] = "New Year's Day"
-        self[date(year, MAY, 1)] = "Labour Day"
-        self[date(year, JUN, 1)] = "Madaraka Day"
-        self[date(year, OCT, 20)] = "Mashujaa Day"
-        self[date(year, DEC, 12)] = "Jamhuri (Independence) Day"
-        self[date(year, DEC, 25)] = "Christmas Day"
-        self[date(year, DEC, 26)] = "Boxing Day"
-        for k, v in list(self.items()):
+        holidays[date(year, JAN, 1)] = "New Year's Day"
+        holidays[date(year, MAY, 1)] = "Labour Day"
+        holidays[date(year, JUN, 1)] = "Madaraka Day"
+        holidays[date(year, OCT, 20)] = "Mashujaa Day"
+        holidays[date(year, DEC, 12)] = "Jamhuri (Independence) Day"
+        holidays[date(year, DEC, 25)] = "Christmas Day"
+        holidays[date(year, DEC, 26)] = "Boxing Day"
+        for k, v in list(holidays.items()):
             if self.observed and k.weekday() == SUN:
-                self[k + rd(days=1)] = v + " (Observed)"
+                holidays[k + rd(days=1)] = v + " (Observed)"
 
-        self[easter(year) - rd(weekday=FR(-1))] = "Good Friday"
-        self[easter(year) + rd(weekday=MO(+1))] = "Easter Monday"
+        holidays[easter(year) - rd(weekday=FR(-1))] = "Good Friday"
+        holidays[easter(year) + rd(weekday=MO(+1))] = "Easter Monday"
 
 
 class KE(Kenya):
@@ -15,14 +15,11 @@ from datetime import date, datetime, timedelta
 
 from dateutil.relativedelta import relativedelta as rd, FR, SA, MO
 
+from holidays.calendars import korean
 from holidays.constants import JAN, MAR, APR, MAY, JUN, JUL, AUG, OCT, DEC
 from holidays.constants import MON, TUE, WED, THU, FRI, SAT, SUN
 from holidays.holiday_base import HolidayBase
 
-# Installation: pip install korean_lunar_calendar
-# URL: https://github.com/usingsky/korean_lunar_calendar_py/
-from korean_lunar_calendar import KoreanLunarCalendar
-
 
 class Korea(HolidayBase):
 
@@ -32,7 +29,6 @@ class Korea(HolidayBase):
 
     def __init__(self, **kwargs):
         self.country = "KR"
-        self.korean_cal = KoreanLunarCalendar()
         HolidayBase.__init__(self, **kwargs)
 
     def _populate(self, year):
@@ -60,21 +56,22 @@ class Korea(HolidayBase):
         second_day_lunar = "The second day of " + name
 
         dt = self.get_solar_date(year, 1, 1)
-        new_year_date = date(dt.year, dt.month, dt.day)
-        if self.observed and year >= 2015:
-            if new_year_date.weekday() in [TUE, WED, THU, FRI]:
-                self[new_year_date + rd(days=-1)] = preceding_day_lunar
-                self[new_year_date] = name
-                self[new_year_date + rd(days=+1)] = second_day_lunar
-            elif new_year_date.weekday() in [SAT, SUN, MON]:
+        if dt is not None:
+            new_year_date = date(dt.year, dt.month, dt.day)
+            if self.observed and year >= 2015:
+                if new_year_date.weekday() in [TUE, WED, THU, FRI]:
+                    self[new_year_date + rd(days=-1)] = preceding_day_lunar
+                    self[new_year_date] = name
+                    self[new_year_date + rd(days=+1)] = second_day_lunar
+                elif new_year_date.weekday() in [SAT, SUN, MON]:
+                    self[new_year_date + rd(days=-1)] = preceding_day_lunar
+                    self[new_year_date] = name
+                    self[new_year_date + rd(days=+1)] = second_day_lunar
+                    self[new_year_date + rd(days=+2)] = alt_holiday + name
+            else:
                 self[new_year_date + rd(days=-1)] = preceding_day_lunar
                 self[new_year_date] = name
                 self[new_year_date + rd(days=+1)] = second_day_lunar
-                self[new_year_date + rd(days=+2)] = alt_holiday + name
-        else:
-            self[new_year_date + rd(days=-1)] = preceding_day_lunar
-            self[new_year_date] = name
-            self[new_year_date + rd(days=+1)] = second_day_lunar
 
         # Independence Movement Day
         name = "Independence Movement Day"
@@ -93,8 +90,9 @@ class Korea(HolidayBase):
         # Birthday of the Buddha
         name = "Birthday of the Buddha"
         dt = self.get_solar_date(year, 4, 8)
-        buddha_date = date(dt.year, dt.month, dt.day)
-        self[buddha_date] = name
+        if dt is not None:
+            buddha_date = date(dt.year, dt.month, dt.day)
+            self[buddha_date] = name
 
         # Children's Day
         name = "Children's Day"
@@ -147,21 +145,22 @@ class Korea(HolidayBase):
         preceding_day_chuseok = "The day preceding of " + name
         second_day_chuseok = "The second day of " + name
         dt = self.get_solar_date(year, 8, 15)
-        new_year_date = date(dt.year, dt.month, dt.day)
-        if self.observed and year >= 2014:
-            if new_year_date.weekday() in [TUE, WED, THU, FRI]:
-                self[new_year_date + rd(days=-1)] = preceding_day_chuseok
-                self[new_year_date] = name
-                self[new_year_date + rd(days=+1)] = second_day_chuseok
-            elif new_year_date.weekday() in [SAT, SUN, MON]:
+        if dt is not None:
+            new_year_date = date(dt.year, dt.month, dt.day)
+            if self.observed and year >= 2014:
+                if new_year_date.weekday() in [TUE, WED, THU, FRI]:
+                    self[new_year_date + rd(days=-1)] = preceding_day_chuseok
+                    self[new_year_date] = name
+                    self[new_year_date + rd(days=+1)] = second_day_chuseok
+                elif new_year_date.weekday() in [SAT, SUN, MON]:
+                    self[new_year_date + rd(days=-1)] = preceding_day_chuseok
+                    self[new_year_date] = name
+                    self[new_year_date + rd(days=+1)] = second_day_chuseok
+                    self[new_year_date + rd(days=+2)] = alt_holiday + name
+            else:
                 self[new_year_date + rd(days=-1)] = preceding_day_chuseok
                 self[new_year_date] = name
                 self[new_year_date + rd(days=+1)] = second_day_chuseok
-                self[new_year_date + rd(days=+2)] = alt_holiday + name
-        else:
-            self[new_year_date + rd(days=-1)] = preceding_day_chuseok
-            self[new_year_date] = name
-            self[new_year_date + rd(days=+1)] = second_day_chuseok
 
         # National Foundation Day
         name = "National Foundation Day"
@@ -185,14 +184,13 @@ class Korea(HolidayBase):
             alt_date = date(2020, AUG, 17)
             self[alt_date] = name
 
-    # convert lunar calendar date to solar
+    # convert lunar calendar date to solar, None outside the lunar years
+    # of the table (whose lunar holidays are then left out)
     def get_solar_date(self, year, month, day):
-        self.korean_cal.setLunarDate(year, month, day, False)
-        return date(
-            self.korean_cal.solarYear,
-            self.korean_cal.solarMonth,
-            self.korean_cal.solarDay,
-        )
+        try:
+            return korean.lunar_to_gregorian(year, month, day)
+        except ValueError:
+            return None
 
     def first_lower(self, s):
         return s[0].lower() + s[1:]
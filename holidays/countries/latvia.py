@@ -14,9 +14,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, SU
 
+from holidays.calendars.easter import easter
 from holidays.holiday_base import HolidayBase
 
 
@@ -11,38 +11,33 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
-from datetime import date
-
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd, MO
-
 from holidays.constants import JAN, MAY, JUN, AUG, NOV, DEC
-from holidays.holiday_base import HolidayBase
+from holidays.rules import Easter, Fixed, RuleHolidayBase
 
 
-class Luxembourg(HolidayBase):
+class Luxembourg(RuleHolidayBase):
 
     # https://en.wikipedia.org/wiki/Public_holidays_in_Luxembourg
 
+    RULES = (
+        # Public holidays
+        Fixed("Neijoerschdag", JAN, 1),
+        Easter("Ouschterméindeg", days=1),
+        Fixed("Dag vun der Aarbecht", MAY, 1),
+        # Europe Day: not in legislation yet, but introduced starting 2019
+        Fixed("Europadag", MAY, 9, start_year=2019),
+        Easter("Christi Himmelfaart", days=39),
+        Easter("Péngschtméindeg", days=50),
+        Fixed("Nationalfeierdag", JUN, 23),
+        Fixed("Léiffrawëschdag", AUG, 15),
+        Fixed("Allerhellgen", NOV, 1),
+        Fixed("Chrëschtdag", DEC, 25),
+        Fixed("Stiefesdag", DEC, 26),
+    )
+
     def __init__(self, **kwargs):
         self.country = "LU"
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
-        # Public holidays
-        self[date(year, JAN, 1)] = "Neijoerschdag"
-        self[easter(year) + rd(weekday=MO)] = "Ouschterméindeg"
-        self[date(year, MAY, 1)] = "Dag vun der Aarbecht"
-        if year >= 2019:
-            # Europe Day: not in legislation yet, but introduced starting 2019
-            self[date(year, MAY, 9)] = "Europadag"
-        self[easter(year) + rd(days=39)] = "Christi Himmelfaart"
-        self[easter(year) + rd(days=50)] = "Péngschtméindeg"
-        self[date(year, JUN, 23)] = "Nationalfeierdag"
-        self[date(year, AUG, 15)] = "Léiffrawëschdag"
-        self[date(year, NOV, 1)] = "Allerhellgen"
-        self[date(year, DEC, 25)] = "Chrëschtdag"
-        self[date(year, DEC, 26)] = "Stiefesdag"
+        RuleHolidayBase.__init__(self, **kwargs)
 
 
 class LU(Luxembourg):
@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd
 
+from holidays.calendars.easter import easter
 from holidays.constants import TUE, SAT, SUN
 from holidays.constants import JAN, FEB, MAR, APR, MAY, JUL, SEP, OCT, NOV, DEC
 from holidays.holiday_base import HolidayBase
@@ -29,31 +29,34 @@ class Malawi(HolidayBase):
         HolidayBase.__init__(self, **kwargs)
 
     def _populate(self, year):
+        self._populate_apart(year, self._populate_holidays)
+
+    def _populate_holidays(self, year, holidays):
         # Observed since 2000
         if year > 1999:
-            self[date(year, 1, 1)] = "New Year's Day"
+            holidays[date(year, 1, 1)] = "New Year's Day"
 
             e = easter(year)
             good_friday = e - rd(days=2)
             easter_monday = e + rd(days=1)
-            self[good_friday] = "Good Friday"
-            self[easter_monday] = "Easter Monday"
+            holidays[good_friday] = "Good Friday"
+            holidays[easter_monday] = "Easter Monday"
 
-            self[date(year, JAN, 15)] = "John Chilembwe Day"
-            self[date(year, MAR, 3)] = "Martyrs Day"
-            self[date(year, MAY, 1)] = "Labour Day"
-            self[date(year, MAY, 14)] = "Kamuzu Day"
-            self[date(year, JUL, 6)] = "Independence Day"
-            self[date(year, OCT, 15)] = "Mother's Day"
-            self[date(year, DEC, 25)] = "Christmas Day"
-            self[date(year, DEC, 26)] = "Boxing Day"
+            holidays[date(year, JAN, 15)] = "John Chilembwe Day"
+            holidays[date(year, MAR, 3)] = "Martyrs Day"
+            holidays[date(year, MAY, 1)] = "Labour Day"
+            holidays[date(year, MAY, 14)] = "Kamuzu Day"
+            holidays[date(year, JUL, 6)] = "Independence Day"
+            holidays[date(year, OCT, 15)] = "Mother's Day"
+            holidays[date(year, DEC, 25)] = "Christmas Day"
+            holidays[date(year, DEC, 26)] = "Boxing Day"
 
-        for k, v in list(self.items()):
+        for k, v in list(holidays.items()):
             if self.observed and year > 1994:
                 if k.weekday() == SUN:
-                    self[k + rd(days=1)] = v + " (Observed)"
+                    holidays[k + rd(days=1)] = v + " (Observed)"
                 elif k.weekday() == SAT:
-                    self[k + rd(days=2)] = v + " (Observed)"
+                    holidays[k + rd(days=2)] = v + " (Observed)"
 
 
 class MW(Malawi):
@@ -14,13 +14,10 @@
 from datetime import date
 
 from dateutil.relativedelta import relativedelta as rd
-from holidays.constants import SAT, SUN
 from holidays.constants import JAN, MAR, MAY, JUL, AUG, NOV
 from holidays.holiday_base import HolidayBase
 from holidays.utils import get_gre_date
 
-WEEKEND = (SAT, SUN)
-
 
 class Morocco(HolidayBase):
     """
@@ -13,10 +13,10 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd
 
 
+from holidays.calendars.easter import easter
 from holidays.constants import TUE, THU, SUN
 from holidays.constants import FEB, APR, MAY, JUN, SEP, OCT, NOV, DEC
 from holidays.holiday_base import HolidayBase
@@ -28,35 +28,37 @@ class Mozambique(HolidayBase):
         HolidayBase.__init__(self, **kwargs)
 
     def _populate(self, year):
+        self._populate_apart(year, self._populate_holidays)
 
+    def _populate_holidays(self, year, holidays):
         if year > 1974:
-            self[date(year, 1, 1)] = "Ano novo"
+            holidays[date(year, 1, 1)] = "Ano novo"
             e = easter(year)
             good_friday = e - rd(days=2)
-            self[good_friday] = "Sexta-feira Santa"
+            holidays[good_friday] = "Sexta-feira Santa"
 
             # carnival is the Tuesday before Ash Wednesday
             # which is 40 days before easter excluding sundays
             carnival = e - rd(days=46)
             while carnival.weekday() != TUE:
                 carnival = carnival - rd(days=1)
-            self[carnival] = "Carnaval"
+            holidays[carnival] = "Carnaval"
 
-            self[date(year, FEB, 3)] = "Dia dos Heróis Moçambicanos"
-            self[date(year, APR, 7)] = "Dia da Mulher Moçambicana"
-            self[date(year, MAY, 1)] = "Dia Mundial do Trabalho"
-            self[date(year, JUN, 25)] = "Dia da Independência Nacional"
-            self[date(year, SEP, 7)] = "Dia da Vitória"
-            self[date(year, SEP, 25)] = "Dia das Forças Armadas"
-            self[date(year, OCT, 4)] = "Dia da Paz e Reconciliação"
-            self[date(year, DEC, 25)] = "Dia de Natal e da Família"
+            holidays[date(year, FEB, 3)] = "Dia dos Heróis Moçambicanos"
+            holidays[date(year, APR, 7)] = "Dia da Mulher Moçambicana"
+            holidays[date(year, MAY, 1)] = "Dia Mundial do Trabalho"
+            holidays[date(year, JUN, 25)] = "Dia da Independência Nacional"
+            holidays[date(year, SEP, 7)] = "Dia da Vitória"
+            holidays[date(year, SEP, 25)] = "Dia das Forças Armadas"
+            holidays[date(year, OCT, 4)] = "Dia da Paz e Reconciliação"
+            holidays[date(year, DEC, 25)] = "Dia de Natal e da Família"
 
             #  whenever a public holiday falls on a Sunday,
             # it rolls over to the following Monday
-            for k, v in list(self.items()):
+            for k, v in list(holidays.items()):
                 if self.observed and year > 1974:
                     if k.weekday() == SUN:
-                        self[k + rd(days=1)] = v + " (PONTE)"
+                        holidays[k + rd(days=1)] = v + " (PONTE)"
 
 
 class MZ(Mozambique):
@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, FR
 
+from holidays.calendars.easter import easter
 from holidays.constants import JAN, APR, MAY, AUG, DEC
 from holidays.constants import SUN
 from holidays.holiday_base import HolidayBase
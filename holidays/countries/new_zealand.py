@@ -13,11 +13,15 @@
 
 from datetime import date
 
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd, MO, FR, WE, TU
-
+from holidays.calendars.easter import easter
 from holidays.constants import JAN, FEB, MAR, APR, JUN, SEP, OCT, NOV, DEC
-from holidays.constants import TUE, WED, THU, WEEKEND
+from holidays.constants import MON, TUE, WED, THU, FRI, WEEKEND
+from holidays.dateutils import (
+    add_days,
+    nth_weekday,
+    weekday_on_or_after,
+    weekday_on_or_before,
+)
 from holidays.holiday_base import HolidayBase
 
 
@@ -77,11 +81,11 @@ class NewZealand(HolidayBase):
             feb6 = date(year, FEB, 6)
             self[feb6] = name
             if self.observed and year >= 2014 and feb6.weekday() in WEEKEND:
-                self[feb6 + rd(weekday=MO)] = name + " (Observed)"
+                self[weekday_on_or_after(feb6, MON)] = name + " (Observed)"
 
         # Easter
-        self[easter(year) + rd(weekday=FR(-1))] = "Good Friday"
-        self[easter(year) + rd(weekday=MO)] = "Easter Monday"
+        self[weekday_on_or_before(easter(year), FRI)] = "Good Friday"
+        self[weekday_on_or_after(easter(year), MON)] = "Easter Monday"
 
         # Anzac Day
         if year > 1920:
@@ -89,7 +93,7 @@ class NewZealand(HolidayBase):
             apr25 = date(year, APR, 25)
             self[apr25] = name
             if self.observed and year >= 2014 and apr25.weekday() in WEEKEND:
-                self[apr25 + rd(weekday=MO)] = name + " (Observed)"
+                self[weekday_on_or_after(apr25, MON)] = name + " (Observed)"
 
         # Sovereign's Birthday
         if year >= 1952:
@@ -99,7 +103,7 @@ class NewZealand(HolidayBase):
         if year == 1952:
             self[date(year, JUN, 2)] = name  # Elizabeth II
         elif year > 1937:
-            self[date(year, JUN, 1) + rd(weekday=MO(+1))] = name  # EII & GVI
+            self[nth_weekday(year, JUN, MON, 1)] = name  # EII & GVI
         elif year == 1937:
             self[date(year, JUN, 9)] = name  # George VI
         elif year == 1936:
@@ -113,9 +117,9 @@ class NewZealand(HolidayBase):
         # Labour Day
         name = "Labour Day"
         if year >= 1910:
-            self[date(year, OCT, 1) + rd(weekday=MO(+4))] = name
+            self[nth_weekday(year, OCT, MON, 4)] = name
         elif year > 1899:
-            self[date(year, OCT, 1) + rd(weekday=WE(+2))] = name
+            self[nth_weekday(year, OCT, WED, 2)] = name
 
         # Christmas Day
         name = "Christmas Day"
@@ -140,48 +144,50 @@ class NewZealand(HolidayBase):
                 name = "Auckland Anniversary Day"
                 dt = date(year, JAN, 29)
             if dt.weekday() in (TUE, WED, THU):
-                self[dt + rd(weekday=MO(-1))] = name
+                self[weekday_on_or_before(dt, MON)] = name
             else:
-                self[dt + rd(weekday=MO)] = name
+                self[weekday_on_or_after(dt, MON)] = name
 
         elif self.prov in ("TKI", "Taranaki", "New Plymouth"):
             name = "Taranaki Anniversary Day"
-            self[date(year, MAR, 1) + rd(weekday=MO(+2))] = name
+            self[nth_weekday(year, MAR, MON, 2)] = name
 
         elif self.prov in ("HKB", "Hawke's Bay"):
             name = "Hawke's Bay Anniversary Day"
-            labour_day = date(year, OCT, 1) + rd(weekday=MO(+4))
-            self[labour_day + rd(weekday=FR(-1))] = name
+            labour_day = nth_weekday(year, OCT, MON, 4)
+            self[weekday_on_or_before(labour_day, FRI)] = name
 
         elif self.prov in ("WGN", "Wellington"):
             name = "Wellington Anniversary Day"
             jan22 = date(year, JAN, 22)
             if jan22.weekday() in (TUE, WED, THU):
-                self[jan22 + rd(weekday=MO(-1))] = name
+                self[weekday_on_or_before(jan22, MON)] = name
             else:
-                self[jan22 + rd(weekday=MO)] = name
+                self[weekday_on_or_after(jan22, MON)] = name
 
         elif self.prov in ("MBH", "Marlborough"):
             name = "Marlborough Anniversary Day"
-            labour_day = date(year, OCT, 1) + rd(weekday=MO(+4))
-            self[labour_day + rd(weeks=1)] = name
+            labour_day = nth_weekday(year, OCT, MON, 4)
+            self[add_days(labour_day, 7)] = name
 
         elif self.prov in ("NSN", "Nelson"):
             name = "Nelson Anniversary Day"
             feb1 = date(year, FEB, 1)
             if feb1.weekday() in (TUE, WED, THU):
-                self[feb1 + rd(weekday=MO(-1))] = name
+                self[weekday_on_or_before(feb1, MON)] = name
             else:
-                self[feb1 + rd(weekday=MO)] = name
+                self[weekday_on_or_after(feb1, MON)] = name
 
         elif self.prov in ("CAN", "Canterbury"):
             name = "Canterbury Anniversary Day"
-            showday = date(year, NOV, 1) + rd(weekday=TU) + rd(weekday=FR(+2))
+            showday = weekday_on_or_after(
+                nth_weekday(year, NOV, TUE, 1), FRI, 2
+            )
             self[showday] = name
 
         elif self.prov in ("STC", "South Canterbury"):
             name = "South Canterbury Anniversary Day"
-            dominion_day = date(year, SEP, 1) + rd(weekday=MO(4))
+            dominion_day = nth_weekday(year, SEP, MON, 4)
             self[dominion_day] = name
 
         elif self.prov in ("WTL", "Westland"):
@@ -191,40 +197,42 @@ class NewZealand(HolidayBase):
             if year == 2005:  # special case?!?!
                 self[date(year, DEC, 5)] = name
             elif dec1.weekday() in (TUE, WED, THU):
-                self[dec1 + rd(weekday=MO(-1))] = name
+                self[weekday_on_or_before(dec1, MON)] = name
             else:
-                self[dec1 + rd(weekday=MO)] = name
+                self[weekday_on_or_after(dec1, MON)] = name
 
         elif self.prov in ("OTA", "Otago"):
             name = "Otago Anniversary Day"
             mar23 = date(year, MAR, 23)
             # there is no easily determined single day of local observance?!?!
             if mar23.weekday() in (TUE, WED, THU):
-                dt = mar23 + rd(weekday=MO(-1))
+                dt = weekday_on_or_before(mar23, MON)
             else:
-                dt = mar23 + rd(weekday=MO)
-            if dt == easter(year) + rd(weekday=MO):  # Avoid Easter Monday
-                dt += rd(days=1)
+                dt = weekday_on_or_after(mar23, MON)
+            if dt == weekday_on_or_after(
+                easter(year), MON
+            ):  # Avoid Easter Monday
+                dt = add_days(dt, 1)
             self[dt] = name
 
         elif self.prov in ("STL", "Southland"):
             name = "Southland Anniversary Day"
             jan17 = date(year, JAN, 17)
             if year > 2011:
-                self[easter(year) + rd(weekday=TU)] = name
+                self[weekday_on_or_after(easter(year), TUE)] = name
             else:
                 if jan17.weekday() in (TUE, WED, THU):
-                    self[jan17 + rd(weekday=MO(-1))] = name
+                    self[weekday_on_or_before(jan17, MON)] = name
                 else:
-                    self[jan17 + rd(weekday=MO)] = name
+                    self[weekday_on_or_after(jan17, MON)] = name
 
         elif self.prov in ("CIT", "Chatham Islands"):
             name = "Chatham Islands Anniversary Day"
             nov30 = date(year, NOV, 30)
             if nov30.weekday() in (TUE, WED, THU):
-                self[nov30 + rd(weekday=MO(-1))] = name
+                self[weekday_on_or_before(nov30, MON)] = name
             else:
-                self[nov30 + rd(weekday=MO)] = name
+                self[weekday_on_or_after(nov30, MON)] = name
 
 
 class NZ(NewZealand):
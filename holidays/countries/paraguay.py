@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, MO, WE, TH, FR
 
+from holidays.calendars.easter import easter
 from holidays.constants import JAN, MAR, MAY, JUN, AUG, SEP, DEC
 from holidays.constants import WED, WEEKEND
 from holidays.holiday_base import HolidayBase
@@ -12,47 +12,40 @@
 #  License: MIT (see LICENSE file)
 
 import warnings
-from datetime import date
-
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, MAY, AUG, NOV, DEC
-from holidays.holiday_base import HolidayBase
+from holidays.rules import Easter, Fixed, RuleHolidayBase
 
 
-class Poland(HolidayBase):
+class Poland(RuleHolidayBase):
     # https://pl.wikipedia.org/wiki/Dni_wolne_od_pracy_w_Polsce
 
+    RULES = (
+        Fixed("Nowy Rok", JAN, 1),
+        Fixed("Święto Trzech Króli", JAN, 6, start_year=2011),
+        Easter("Niedziela Wielkanocna"),
+        Easter("Poniedziałek Wielkanocny", days=1),
+        Fixed("Święto Państwowe", MAY, 1, start_year=1950),
+        Fixed("Święto Narodowe Trzeciego Maja", MAY, 3, start_year=1919),
+        Easter("Zielone Świątki", days=49),
+        Easter("Dzień Bożego Ciała", days=60),
+        Fixed("Wniebowzięcie Najświętszej Marii Panny", AUG, 15),
+        Fixed("Uroczystość Wszystkich świętych", NOV, 1),
+        Fixed(
+            "Narodowe Święto Niepodległości",
+            NOV,
+            11,
+            start_year=1937,
+            end_year=1945,
+        ),
+        Fixed("Narodowe Święto Niepodległości", NOV, 11, start_year=1989),
+        Fixed("Boże Narodzenie (pierwszy dzień)", DEC, 25),
+        Fixed("Boże Narodzenie (drugi dzień)", DEC, 26),
+    )
+
     def __init__(self, **kwargs):
         self.country = "PL"
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
-        self[date(year, JAN, 1)] = "Nowy Rok"
-        if year >= 2011:
-            self[date(year, JAN, 6)] = "Święto Trzech Króli"
-
-        e = easter(year)
-        self[e] = "Niedziela Wielkanocna"
-        self[e + rd(days=1)] = "Poniedziałek Wielkanocny"
-
-        if year >= 1950:
-            self[date(year, MAY, 1)] = "Święto Państwowe"
-        if year >= 1919:
-            self[date(year, MAY, 3)] = "Święto Narodowe Trzeciego Maja"
-
-        self[e + rd(days=49)] = "Zielone Świątki"
-        self[e + rd(days=60)] = "Dzień Bożego Ciała"
-
-        self[date(year, AUG, 15)] = "Wniebowzięcie Najświętszej Marii Panny"
-
-        self[date(year, NOV, 1)] = "Uroczystość Wszystkich świętych"
-        if (1937 <= year <= 1945) or year >= 1989:
-            self[date(year, NOV, 11)] = "Narodowe Święto Niepodległości"
-
-        self[date(year, DEC, 25)] = "Boże Narodzenie (pierwszy dzień)"
-        self[date(year, DEC, 26)] = "Boże Narodzenie (drugi dzień)"
+        RuleHolidayBase.__init__(self, **kwargs)
 
 
 class PL(Poland):
@@ -14,14 +14,11 @@
 from datetime import date
 
 from dateutil.relativedelta import relativedelta as rd
-from holidays.constants import FRI, SAT
+from holidays.constants import THU, FRI, SAT
 from holidays.constants import SEP
 from holidays.holiday_base import HolidayBase
 from holidays.utils import get_gre_date
 
-# Weekend used to be THU, FRI before June 28th, 2013
-WEEKEND = (FRI, SAT)
-
 
 class SaudiArabia(HolidayBase):
 
@@ -39,6 +36,9 @@ class SaudiArabia(HolidayBase):
     Python >= 3.6
     """
 
+    # The weekend used to be THU, FRI before June 28th, 2013
+    WEEKENDS = ((None, (THU, FRI)), (date(2013, 6, 28), (FRI, SAT)))
+
     def __init__(self, **kwargs):
         self.country = "SA"
         HolidayBase.__init__(self, **kwargs)
@@ -57,15 +57,15 @@ class SaudiArabia(HolidayBase):
             self[hijri_date + rd(days=3)] = holiday_name
             self[hijri_date + rd(days=4)] = holiday_name
             if self.observed:
-                if (hijri_date + rd(days=1)).weekday() in WEEKEND:
+                if self.is_weekend(hijri_date + rd(days=1)):
                     self[hijri_date + rd(days=5)] = holiday_name + observed_str
-                if (hijri_date + rd(days=2)).weekday() in WEEKEND:
+                if self.is_weekend(hijri_date + rd(days=2)):
                     self[hijri_date + rd(days=5)] = holiday_name + observed_str
                     self[hijri_date + rd(days=6)] = holiday_name + observed_str
-                if (hijri_date + rd(days=3)).weekday() in WEEKEND:
+                if self.is_weekend(hijri_date + rd(days=3)):
                     self[hijri_date + rd(days=5)] = holiday_name + observed_str
                     self[hijri_date + rd(days=6)] = holiday_name + observed_str
-                if (hijri_date + rd(days=4)).weekday() in WEEKEND:
+                if self.is_weekend(hijri_date + rd(days=4)):
                     self[hijri_date + rd(days=6)] = holiday_name + observed_str
 
         # Arafat Day & Eid al-Adha
@@ -78,15 +78,15 @@ class SaudiArabia(HolidayBase):
             self[hijri_date + rd(days=3)] = holiday_name
 
             if self.observed:
-                if hijri_date.weekday() in WEEKEND:
+                if self.is_weekend(hijri_date):
                     self[hijri_date + rd(days=4)] = holiday_name + observed_str
-                if (hijri_date + rd(days=1)).weekday() in WEEKEND:
+                if self.is_weekend(hijri_date + rd(days=1)):
                     self[hijri_date + rd(days=4)] = holiday_name + observed_str
                     self[hijri_date + rd(days=5)] = holiday_name + observed_str
-                if (hijri_date + rd(days=2)).weekday() in WEEKEND:
+                if self.is_weekend(hijri_date + rd(days=2)):
                     self[hijri_date + rd(days=4)] = holiday_name + observed_str
                     self[hijri_date + rd(days=5)] = holiday_name + observed_str
-                if (hijri_date + rd(days=3)).weekday() in WEEKEND:
+                if self.is_weekend(hijri_date + rd(days=3)):
                     self[hijri_date + rd(days=5)] = holiday_name + observed_str
 
         # National Day holiday (started at the year 2005).
@@ -12,63 +12,49 @@
 #  License: MIT (see LICENSE file)
 
 import warnings
-from datetime import date
-
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd
 
 from holidays.constants import JAN, MAY, JUL, AUG, SEP, OCT, NOV, DEC
-from holidays.holiday_base import HolidayBase
+from holidays.rules import Easter, Fixed, RuleHolidayBase
 
 
-class Slovakia(HolidayBase):
+class Slovakia(RuleHolidayBase):
     # https://sk.wikipedia.org/wiki/Sviatok
     # https://www.slov-lex.sk/pravne-predpisy/SK/ZZ/1993/241/20181011.html
 
-    def __init__(self, **kwargs):
-        self.country = "SK"
-        HolidayBase.__init__(self, **kwargs)
-
-    def _populate(self, year):
-        self[date(year, JAN, 1)] = "Deň vzniku Slovenskej republiky"
-        self[date(year, JAN, 6)] = (
+    RULES = (
+        Fixed("Deň vzniku Slovenskej republiky", JAN, 1),
+        Fixed(
             "Zjavenie Pána (Traja králi a"
             " vianočnýsviatok pravoslávnych"
-            " kresťanov)"
-        )
-
-        e = easter(year)
-        self[e - rd(days=2)] = "Veľký piatok"
-        self[e + rd(days=1)] = "Veľkonočný pondelok"
-
-        self[date(year, MAY, 1)] = "Sviatok práce"
-
-        if year >= 1997:
-            self[date(year, MAY, 8)] = "Deň víťazstva nad fašizmom"
-
-        self[date(year, JUL, 5)] = "Sviatok svätého Cyrila a svätého Metoda"
+            " kresťanov)",
+            JAN,
+            6,
+        ),
+        Easter("Veľký piatok", days=-2),
+        Easter("Veľkonočný pondelok", days=1),
+        Fixed("Sviatok práce", MAY, 1),
+        Fixed("Deň víťazstva nad fašizmom", MAY, 8, start_year=1997),
+        Fixed("Sviatok svätého Cyrila a svätého Metoda", JUL, 5),
+        Fixed("Výročie Slovenského národného povstania", AUG, 29),
+        Fixed("Deň Ústavy Slovenskej republiky", SEP, 1),
+        Fixed("Sedembolestná Panna Mária", SEP, 15),
+        Fixed(
+            "100. výročie prijatia Deklarácie slovenského národa",
+            OCT,
+            30,
+            start_year=2018,
+            end_year=2018,
+        ),
+        Fixed("Sviatok Všetkých svätých", NOV, 1),
+        Fixed("Deň boja za slobodu a demokraciu", NOV, 17, start_year=2001),
+        Fixed("Štedrý deň", DEC, 24),
+        Fixed("Prvý sviatok vianočný", DEC, 25),
+        Fixed("Druhý sviatok vianočný", DEC, 26),
+    )
 
-        self[date(year, AUG, 29)] = (
-            "Výročie Slovenského národného" " povstania"
-        )
-
-        self[date(year, SEP, 1)] = "Deň Ústavy Slovenskej republiky"
-
-        self[date(year, SEP, 15)] = "Sedembolestná Panna Mária"
-        if year == 2018:
-            self[date(year, OCT, 30)] = (
-                "100. výročie prijatia" " Deklarácie slovenského národa"
-            )
-        self[date(year, NOV, 1)] = "Sviatok Všetkých svätých"
-
-        if year >= 2001:
-            self[date(year, NOV, 17)] = "Deň boja za slobodu a demokraciu"
-
-        self[date(year, DEC, 24)] = "Štedrý deň"
-
-        self[date(year, DEC, 25)] = "Prvý sviatok vianočný"
-
-        self[date(year, DEC, 26)] = "Druhý sviatok vianočný"
+    def __init__(self, **kwargs):
+        self.country = "SK"
+        RuleHolidayBase.__init__(self, **kwargs)
 
 
 class SK(Slovakia):
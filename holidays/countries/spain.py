@@ -13,8 +13,8 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, TH, FR, MO
+from holidays.calendars.easter import easter
 from holidays.constants import (
     JAN,
     FEB,
@@ -30,10 +30,10 @@ from holidays.constants import (
     DEC,
 )
 from holidays.constants import SUN
-from holidays.holiday_base import HolidayBase
+from holidays.holiday_base import LayeredHolidayBase
 
 
-class Spain(HolidayBase):
+class Spain(LayeredHolidayBase):
     PROVINCES = [
         "AN",
         "AR",
@@ -58,7 +58,7 @@ class Spain(HolidayBase):
     def __init__(self, **kwargs):
         self.country = "ES"
         self.prov = kwargs.pop("prov", kwargs.pop("state", ""))
-        HolidayBase.__init__(self, **kwargs)
+        LayeredHolidayBase.__init__(self, **kwargs)
 
     def _is_observed(self, date_holiday, name_holiday):
         if self.observed and date_holiday.weekday() == SUN:
@@ -66,9 +66,20 @@ class Spain(HolidayBase):
         else:
             self[date_holiday] = name_holiday
 
-    def _populate(self, year):
+    def _populate_national(self, year):
         self._is_observed(date(year, JAN, 1), "Año nuevo")
         self._is_observed(date(year, JAN, 6), "Epifanía del Señor")
+        self._is_observed(date(year, MAY, 1), "Día del Trabajador")
+        self._is_observed(date(year, AUG, 15), "Asunción de la Virgen")
+        self._is_observed(date(year, OCT, 12), "Día de la Hispanidad")
+        self._is_observed(date(year, NOV, 1), "Todos los Santos")
+        self._is_observed(
+            date(year, DEC, 6), "Día de la Constitución " "Española"
+        )
+        self._is_observed(date(year, DEC, 8), "La Inmaculada Concepción")
+        self._is_observed(date(year, DEC, 25), "Navidad")
+
+    def _populate_subdivision(self, year):
 
         if (
             year < 2015
@@ -120,17 +131,8 @@ class Spain(HolidayBase):
             self[easter(year) + rd(weeks=-1, weekday=FR)] = "Viernes Santo"
         if self.prov and self.prov in ["CT", "PV", "NC", "VC", "IB", "CM"]:
             self[easter(year) + rd(weekday=MO)] = "Lunes de Pascua"
-        self._is_observed(date(year, MAY, 1), "Día del Trabajador")
         if self.prov and self.prov in ["CT", "GA", "VC"]:
             self._is_observed(date(year, JUN, 24), "San Juan")
-        self._is_observed(date(year, AUG, 15), "Asunción de la Virgen")
-        self._is_observed(date(year, OCT, 12), "Día de la Hispanidad")
-        self._is_observed(date(year, NOV, 1), "Todos los Santos")
-        self._is_observed(
-            date(year, DEC, 6), "Día de la Constitución " "Española"
-        )
-        self._is_observed(date(year, DEC, 8), "La Inmaculada Concepción")
-        self._is_observed(date(year, DEC, 25), "Navidad")
         if self.prov and self.prov in ["CT", "IB"]:
             self._is_observed(date(year, DEC, 26), "San Esteban")
         # Provinces festive day
@@ -13,9 +13,9 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, FR, SA
 
+from holidays.calendars.easter import easter
 from holidays.constants import JAN, MAR, MAY, JUN, OCT, DEC
 from holidays.constants import MON, THU, FRI, SAT, SUN
 from holidays.holiday_base import HolidayBase
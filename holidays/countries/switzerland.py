@@ -13,14 +13,14 @@
 
 from datetime import date
 
-from dateutil.easter import easter
 from dateutil.relativedelta import relativedelta as rd, FR, TH, MO, SU
 
+from holidays.calendars.easter import easter
 from holidays.constants import JAN, MAR, APR, MAY, JUN, AUG, SEP, NOV, DEC
-from holidays.holiday_base import HolidayBase
+from holidays.holiday_base import LayeredHolidayBase
 
 
-class Switzerland(HolidayBase):
+class Switzerland(LayeredHolidayBase):
     PROVINCES = [
         "AG",
         "AR",
@@ -52,12 +52,31 @@ class Switzerland(HolidayBase):
 
     def __init__(self, **kwargs):
         self.country = "CH"
-        HolidayBase.__init__(self, **kwargs)
+        LayeredHolidayBase.__init__(self, **kwargs)
 
-    def _populate(self, year):
+    def _populate_national(self, year):
         # public holidays
         self[date(year, JAN, 1)] = "Neujahrestag"
 
+        # it's a Holiday on a Sunday
+        self[easter(year)] = "Ostern"
+
+        self[easter(year) - rd(days=2)] = "Karfreitag"
+        self[easter(year) + rd(weekday=MO)] = "Ostermontag"
+
+        self[easter(year) + rd(days=39)] = "Auffahrt"
+
+        # it's a Holiday on a Sunday
+        self[easter(year) + rd(days=49)] = "Pfingsten"
+
+        self[easter(year) + rd(days=50)] = "Pfingstmontag"
+
+        if year >= 1291:
+            self[date(year, AUG, 1)] = "Nationalfeiertag"
+
+        self[date(year, DEC, 25)] = "Weihnachten"
+
+    def _populate_subdivision(self, year):
         if self.prov in (
             "AG",
             "BE",
@@ -95,23 +114,15 @@ class Switzerland(HolidayBase):
             else:
                 self[date(year, APR, 8) + rd(weekday=TH)] = "Näfelser Fahrt"
 
-        # it's a Holiday on a Sunday
-        self[easter(year)] = "Ostern"
-
         # VS don't have easter
-        if self.prov != "VS":
-            self[easter(year) - rd(days=2)] = "Karfreitag"
-            self[easter(year) + rd(weekday=MO)] = "Ostermontag"
+        if self.prov == "VS":
+            self._replace_national(easter(year) - rd(days=2), "Karfreitag")
+            self._replace_national(
+                easter(year) + rd(weekday=MO), "Ostermontag"
+            )
 
         if self.prov in ("BL", "BS", "JU", "NE", "SH", "SO", "TG", "TI", "ZH"):
-            self[date(year, MAY, 1)] = "Tag der Arbeit"
-
-        self[easter(year) + rd(days=39)] = "Auffahrt"
-
-        # it's a Holiday on a Sunday
-        self[easter(year) + rd(days=49)] = "Pfingsten"
-
-        self[easter(year) + rd(days=50)] = "Pfingstmontag"
+            self._add_before_national(date(year, MAY, 1), "Tag der Arbeit")
 
         if self.prov in (
             "AI",
@@ -133,9 +144,6 @@ class Switzerland(HolidayBase):
         if self.prov == "TI":
             self[date(year, JUN, 29)] = "Peter und Paul"
 
-        if year >= 1291:
-            self[date(year, AUG, 1)] = "Nationalfeiertag"
-
         if self.prov in (
             "AI",
             "JU",
@@ -182,8 +190,6 @@ class Switzerland(HolidayBase):
         if self.prov in ("AI", "LU", "NW", "OW", "SZ", "TI", "UR", "VS", "ZG"):
             self[date(year, DEC, 8)] = "Mariä Empfängnis"
 
-        self[date(year, DEC, 25)] = "Weihnachten"
-
         if self.prov in (
             "AG",
             "AR",
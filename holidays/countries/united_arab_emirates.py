@@ -14,13 +14,12 @@
 from datetime import date
 
 from dateutil.relativedelta import relativedelta as rd
-from holidays.constants import FRI, SAT
-from holidays.constants import JAN, APR, MAY, JUN, JUL, AUG, SEP, NOV, DEC
+from holidays.announced import announced_dates
+from holidays.constants import THU, FRI, SAT, SUN
+from holidays.constants import JAN, NOV, DEC
 from holidays.holiday_base import HolidayBase
 from holidays.utils import get_gre_date
 
-WEEKEND = (FRI, SAT)
-
 
 class UnitedArabEmirates(HolidayBase):
 
@@ -47,6 +46,14 @@ class UnitedArabEmirates(HolidayBase):
     #  raised that this holiday is missing. hijri-converter requires
     #  Python >= 3.6
 
+    # The weekend moved from THU, FRI to FRI, SAT on September 1st, 2006
+    # and to SAT, SUN on January 1st, 2022.
+    WEEKENDS = (
+        (None, (THU, FRI)),
+        (date(2006, 9, 1), (FRI, SAT)),
+        (date(2022, 1, 1), (SAT, SUN)),
+    )
+
     def __init__(self, **kwargs):
         self.country = "AE"
         HolidayBase.__init__(self, **kwargs)
@@ -72,16 +79,12 @@ class UnitedArabEmirates(HolidayBase):
         # Date is announced each year. Usually stretches along 3 or 4 days,
         # in some instances prepending/appending a day or two
         # before/after the official holiday.
-        dates_obs = {
-            2017: [(JUN, 25)],
-            2018: [(JUN, 14)],
-            2019: [(JUN, 3)],
-            2020: [(MAY, 24)],
-        }
+        dates_obs = announced_dates(
+            "united_arab_emirates", "eid_al_fitr", year
+        )
         fitr = "Eid al-Fitr"
-        if year in dates_obs:
-            for date_obs in dates_obs[year]:
-                hol_date = date(year, *date_obs)
+        if dates_obs:
+            for hol_date in dates_obs:
                 self[hol_date] = fitr
                 self[hol_date + rd(days=1)] = "{} Holiday".format(fitr)
                 self[hol_date + rd(days=2)] = "{} Holiday".format(fitr)
@@ -97,17 +100,11 @@ class UnitedArabEmirates(HolidayBase):
                 ] = "{} Holiday* (*estimated)".format(fitr)
 
         # Arafat Day & Eid al-Adha
-        dates_obs = {
-            2017: [(AUG, 31)],
-            2018: [(AUG, 20)],
-            2019: [(AUG, 10)],
-            2020: [(JUL, 30)],
-        }
+        dates_obs = announced_dates("united_arab_emirates", "arafat_day", year)
         hajj = "Arafat (Hajj) Day"
         adha = "Eid al-Adha"
-        if year in dates_obs:
-            for date_obs in dates_obs[year]:
-                hol_date = date(year, *date_obs)
+        if dates_obs:
+            for hol_date in dates_obs:
                 self[hol_date] = hajj
                 self[hol_date + rd(days=1)] = adha
                 self[hol_date + rd(days=2)] = "{} Holiday".format(adha)
@@ -125,16 +122,12 @@ class UnitedArabEmirates(HolidayBase):
                 ] = "{} Holiday* (*estimated)".format(adha)
 
         # Islamic New Year - (hijari_year, 1, 1)
-        dates_obs = {
-            2017: [(SEP, 22)],
-            2018: [(SEP, 11)],
-            2019: [(AUG, 31)],
-            2020: [(AUG, 23)],
-        }
+        dates_obs = announced_dates(
+            "united_arab_emirates", "islamic_new_year", year
+        )
         new_hijri_year = "Al Hijra - Islamic New Year"
-        if year in dates_obs:
-            for date_obs in dates_obs[year]:
-                hol_date = date(year, *date_obs)
+        if dates_obs:
+            for hol_date in dates_obs:
                 self[hol_date] = new_hijri_year
         else:
             for date_obs in get_gre_date(year, 1, 1):
@@ -143,11 +136,12 @@ class UnitedArabEmirates(HolidayBase):
 
         # Leilat al-Miraj - The Prophet's ascension (hijari_year, 7, 27)
         if year <= 2018:  # starting from 2019 the UAE government removed this
-            dates_obs = {2017: [(APR, 23)], 2018: [(APR, 13)]}
+            dates_obs = announced_dates(
+                "united_arab_emirates", "leilat_al_miraj", year
+            )
             ascension = "Leilat al-Miraj - The Prophet's ascension"
-            if year in dates_obs:
-                for date_obs in dates_obs[year]:
-                    hol_date = date(year, *date_obs)
+            if dates_obs:
+                for hol_date in dates_obs:
                     self[hol_date] = ascension
             else:
                 for date_obs in get_gre_date(year, 7, 27):
@@ -156,15 +150,12 @@ class UnitedArabEmirates(HolidayBase):
 
         # Prophet Muhammad's Birthday - (hijari_year, 3, 12)
         if year <= 2019:  # starting from 2020 the UAE government removed this
-            dates_obs = {
-                2017: [(NOV, 30)],
-                2018: [(NOV, 19)],
-                2019: [(NOV, 9)],
-            }
+            dates_obs = announced_dates(
+                "united_arab_emirates", "mawlud_al_nabi", year
+            )
             mawlud = "Mawlud al-Nabi - Prophet Mohammad's Birthday"
-            if year in dates_obs:
-                for date_obs in dates_obs[year]:
-                    hol_date = date(year, *date_obs)
+            if dates_obs:
+                for hol_date in dates_obs:
                     self[hol_date] = mawlud
             else:
                 for date_obs in get_gre_date(year, 3, 12):
@@ -13,9 +13,7 @@
 
 from datetime import date
 
-from dateutil.easter import easter
-from dateutil.relativedelta import relativedelta as rd, MO, FR, TH, TU
-
+from holidays.calendars.easter import easter
 from holidays.constants import (
     JAN,
     FEB,
@@ -30,11 +28,18 @@ from holidays.constants import (
     NOV,
     DEC,
 )
-from holidays.constants import MON, WED, FRI, SAT, SUN, WEEKEND
-from holidays.holiday_base import HolidayBase
+from holidays.constants import MON, TUE, WED, THU, FRI, SAT, SUN, WEEKEND
+from holidays.dateutils import (
+    add_days,
+    last_weekday,
+    nth_weekday,
+    weekday_on_or_after,
+    weekday_on_or_before,
+)
+from holidays.holiday_base import LayeredHolidayBase
 
 
-class UnitedStates(HolidayBase):
+class UnitedStates(LayeredHolidayBase):
     # https://en.wikipedia.org/wiki/Public_holidays_in_the_United_States
 
     STATES = [
@@ -101,27 +106,91 @@ class UnitedStates(HolidayBase):
 
     def __init__(self, **kwargs):
         self.country = "US"
-        HolidayBase.__init__(self, **kwargs)
+        LayeredHolidayBase.__init__(self, **kwargs)
 
-    def _populate(self, year):
+    def _populate_national(self, year):
         # New Year's Day
         if year > 1870:
             name = "New Year's Day"
             self[date(year, JAN, 1)] = name
             if self.observed and date(year, JAN, 1).weekday() == SUN:
-                self[date(year, JAN, 1) + rd(days=+1)] = name + " (Observed)"
+                self[add_days(date(year, JAN, 1), 1)] = name + " (Observed)"
             elif self.observed and date(year, JAN, 1).weekday() == SAT:
                 # Add Dec 31st from the previous year without triggering
                 # the entire year to be added
                 expand = self.expand
                 self.expand = False
-                self[date(year, JAN, 1) + rd(days=-1)] = name + " (Observed)"
+                self[add_days(date(year, JAN, 1), -1)] = name + " (Observed)"
                 self.expand = expand
             # The next year's observed New Year's Day can be in this year
             # when it falls on a Friday (Jan 1st is a Saturday)
             if self.observed and date(year, DEC, 31).weekday() == FRI:
                 self[date(year, DEC, 31)] = name + " (Observed)"
 
+        # Martin Luther King Jr. Day
+        if year >= 1986:
+            self[nth_weekday(year, JAN, MON, 3)] = "Martin Luther King Jr. Day"
+
+        # Washington's Birthday
+        name = "Washington's Birthday"
+        if year > 1970:
+            self[nth_weekday(year, FEB, MON, 3)] = name
+        elif year >= 1879:
+            self[date(year, FEB, 22)] = name
+
+        # Memorial Day
+        if year > 1970:
+            self[last_weekday(year, MAY, MON)] = "Memorial Day"
+        elif year >= 1888:
+            self[date(year, MAY, 30)] = "Memorial Day"
+
+        # Independence Day
+        if year > 1870:
+            name = "Independence Day"
+            self[date(year, JUL, 4)] = name
+            if self.observed and date(year, JUL, 4).weekday() == SAT:
+                self[add_days(date(year, JUL, 4), -1)] = name + " (Observed)"
+            elif self.observed and date(year, JUL, 4).weekday() == SUN:
+                self[add_days(date(year, JUL, 4), 1)] = name + " (Observed)"
+
+        # Labor Day
+        if year >= 1894:
+            self[nth_weekday(year, SEP, MON, 1)] = "Labor Day"
+
+        # Columbus Day
+        if year >= 1970:
+            self[nth_weekday(year, OCT, MON, 2)] = "Columbus Day"
+        elif year >= 1937:
+            self[date(year, OCT, 12)] = "Columbus Day"
+
+        # Veterans Day
+        if year > 1953:
+            name = "Veterans Day"
+        else:
+            name = "Armistice Day"
+        if 1978 > year > 1970:
+            self[nth_weekday(year, OCT, MON, 4)] = name
+        elif year >= 1938:
+            self[date(year, NOV, 11)] = name
+            if self.observed and date(year, NOV, 11).weekday() == SAT:
+                self[add_days(date(year, NOV, 11), -1)] = name + " (Observed)"
+            elif self.observed and date(year, NOV, 11).weekday() == SUN:
+                self[add_days(date(year, NOV, 11), 1)] = name + " (Observed)"
+
+        # Thanksgiving
+        if year > 1870:
+            self[nth_weekday(year, NOV, THU, 4)] = "Thanksgiving"
+
+        # Christmas Day
+        if year > 1870:
+            name = "Christmas Day"
+            self[date(year, DEC, 25)] = "Christmas Day"
+            if self.observed and date(year, DEC, 25).weekday() == SAT:
+                self[add_days(date(year, DEC, 25), -1)] = name + " (Observed)"
+            elif self.observed and date(year, DEC, 25).weekday() == SUN:
+                self[add_days(date(year, DEC, 25), 1)] = name + " (Observed)"
+
+    def _populate_subdivision(self, year):
         # Epiphany
         if self.state == "PR":
             self[date(year, JAN, 6)] = "Epiphany"
@@ -133,28 +202,32 @@ class UnitedStates(HolidayBase):
         # Lee Jackson Day
         name = "Lee Jackson Day"
         if self.state == "VA" and year >= 2000:
-            dt = date(year, JAN, 1) + rd(weekday=MO(+3)) + rd(weekday=FR(-1))
-            self[dt] = name
+            dt = weekday_on_or_before(nth_weekday(year, JAN, MON, 3), FRI)
+            self._add_before_national(dt, name)
         elif self.state == "VA" and year >= 1983:
-            self[date(year, JAN, 1) + rd(weekday=MO(+3))] = name
+            self._add_before_national(nth_weekday(year, JAN, MON, 3), name)
         elif self.state == "VA" and year >= 1889:
-            self[date(year, JAN, 19)] = name
+            self._add_before_national(date(year, JAN, 19), name)
 
         # Inauguration Day
         if self.state in ("DC", "LA", "MD", "VA") and year >= 1789:
             name = "Inauguration Day"
             if (year - 1789) % 4 == 0 and year >= 1937:
-                self[date(year, JAN, 20)] = name
+                self._add_before_national(date(year, JAN, 20), name)
                 if date(year, JAN, 20).weekday() == SUN:
-                    self[date(year, JAN, 21)] = name + " (Observed)"
+                    self._add_before_national(
+                        date(year, JAN, 21), name + " (Observed)"
+                    )
             elif (year - 1789) % 4 == 0:
-                self[date(year, MAR, 4)] = name
+                self._add_before_national(date(year, MAR, 4), name)
                 if date(year, MAR, 4).weekday() == SUN:
-                    self[date(year, MAR, 5)] = name + " (Observed)"
+                    self._add_before_national(
+                        date(year, MAR, 5), name + " (Observed)"
+                    )
 
         # Martin Luther King Jr. Day
         if year >= 1986:
-            name = "Martin Luther King Jr. Day"
+            name = None
             if self.state == "AL":
                 name = "Robert E. Lee/Martin Luther King Birthday"
             elif (self.state == "MS") or (
@@ -170,7 +243,12 @@ class UnitedStates(HolidayBase):
                 name = "Robert E. Lee's Birthday"
             elif self.state == "ID" and year >= 2006:
                 name = "Martin Luther King Jr. - Idaho Human Rights Day"
-            self[date(year, JAN, 1) + rd(weekday=MO(+3))] = name
+            if name:
+                self._replace_national(
+                    nth_weekday(year, JAN, MON, 3),
+                    "Martin Luther King Jr. Day",
+                    name,
+                )
 
         # Lincoln's Birthday
         name = "Lincoln's Birthday"
@@ -190,40 +268,50 @@ class UnitedStates(HolidayBase):
             or (self.state == "NY" and year >= 2004)
             or (self.state == "WI" and year >= 1976)
         ):
-            self[date(year, FEB, 15)] = "Susan B. Anthony Day"
+            self._add_before_national(
+                date(year, FEB, 15), "Susan B. Anthony Day"
+            )
 
         # Washington's Birthday
         name = "Washington's Birthday"
-        if self.state == "AL":
-            name = "George Washington/Thomas Jefferson Birthday"
-        elif self.state == "AR":
-            name = "George Washington's Birthday and Daisy Gatson Bates Day"
-        elif self.state in ("PR", "VI"):
-            name = "Presidents' Day"
-        if self.state not in ("DE", "FL", "GA", "NM", "PR"):
-            if year > 1970:
-                self[date(year, FEB, 1) + rd(weekday=MO(+3))] = name
-            elif year >= 1879:
-                self[date(year, FEB, 22)] = name
-        elif self.state == "GA":
-            if date(year, DEC, 24).weekday() != WED:
-                self[date(year, DEC, 24)] = name
+        if year > 1970:
+            dt = nth_weekday(year, FEB, MON, 3)
+        elif year >= 1879:
+            dt = date(year, FEB, 22)
+        else:
+            dt = None
+        if self.state in ("DE", "FL", "GA", "NM", "PR"):
+            if dt:
+                self._replace_national(dt, name)
+            if self.state == "GA":
+                if date(year, DEC, 24).weekday() != WED:
+                    self._add_before_national(date(year, DEC, 24), name)
+                else:
+                    self._add_before_national(date(year, DEC, 26), name)
+            elif self.state == "PR":
+                self[nth_weekday(year, FEB, MON, 3)] = "Presidents' Day"
+        elif dt and self.state in ("AL", "AR", "VI"):
+            if self.state == "AL":
+                new_name = "George Washington/Thomas Jefferson Birthday"
+            elif self.state == "AR":
+                new_name = (
+                    "George Washington's Birthday and Daisy Gatson Bates Day"
+                )
             else:
-                self[date(year, DEC, 26)] = name
-        elif self.state in ("PR", "VI"):
-            self[date(year, FEB, 1) + rd(weekday=MO(+3))] = name
+                new_name = "Presidents' Day"
+            self._replace_national(dt, name, new_name)
 
         # Mardi Gras
         if self.state == "LA" and year >= 1857:
-            self[easter(year) + rd(days=-47)] = "Mardi Gras"
+            self[add_days(easter(year), -47)] = "Mardi Gras"
 
         # Guam Discovery Day
         if self.state == "GU" and year >= 1970:
-            self[date(year, MAR, 1) + rd(weekday=MO)] = "Guam Discovery Day"
+            self[nth_weekday(year, MAR, MON, 1)] = "Guam Discovery Day"
 
         # Casimir Pulaski Day
         if self.state == "IL" and year >= 1978:
-            self[date(year, MAR, 1) + rd(weekday=MO)] = "Casimir Pulaski Day"
+            self[nth_weekday(year, MAR, MON, 1)] = "Casimir Pulaski Day"
 
         # Texas Independence Day
         if self.state == "TX" and year >= 1874:
@@ -231,14 +319,14 @@ class UnitedStates(HolidayBase):
 
         # Town Meeting Day
         if self.state == "VT" and year >= 1800:
-            self[date(year, MAR, 1) + rd(weekday=TU)] = "Town Meeting Day"
+            self[nth_weekday(year, MAR, TUE, 1)] = "Town Meeting Day"
 
         # Evacuation Day
         if self.state == "MA" and year >= 1901:
             name = "Evacuation Day"
             self[date(year, MAR, 17)] = name
             if date(year, MAR, 17).weekday() in WEEKEND:
-                self[date(year, MAR, 17) + rd(weekday=MO)] = (
+                self[weekday_on_or_after(date(year, MAR, 17), MON)] = (
                     name + " (Observed)"
                 )
 
@@ -260,7 +348,7 @@ class UnitedStates(HolidayBase):
         # Steward's Day
         name = "Steward's Day"
         if self.state == "AK" and year >= 1955:
-            self[date(year, APR, 1) + rd(days=-1, weekday=MO(-1))] = name
+            self[last_weekday(year, MAR, MON)] = name
         elif self.state == "AK" and year >= 1918:
             self[date(year, MAR, 30)] = name
 
@@ -288,13 +376,13 @@ class UnitedStates(HolidayBase):
 
         # Patriots' Day
         if self.state in ("ME", "MA") and year >= 1969:
-            self[date(year, APR, 1) + rd(weekday=MO(+3))] = "Patriots' Day"
+            self[nth_weekday(year, APR, MON, 3)] = "Patriots' Day"
         elif self.state in ("ME", "MA") and year >= 1894:
             self[date(year, APR, 19)] = "Patriots' Day"
 
         # Holy Thursday
         if self.state == "VI":
-            self[easter(year) + rd(weekday=TH(-1))] = "Holy Thursday"
+            self[weekday_on_or_before(easter(year), THU)] = "Holy Thursday"
 
         # Good Friday
         if self.state in (
@@ -311,11 +399,11 @@ class UnitedStates(HolidayBase):
             "TX",
             "VI",
         ):
-            self[easter(year) + rd(weekday=FR(-1))] = "Good Friday"
+            self[weekday_on_or_before(easter(year), FRI)] = "Good Friday"
 
         # Easter Monday
         if self.state == "VI":
-            self[easter(year) + rd(weekday=MO)] = "Easter Monday"
+            self[weekday_on_or_after(easter(year), MON)] = "Easter Monday"
 
         # Confederate Memorial Day
         name = "Confederate Memorial Day"
@@ -325,7 +413,7 @@ class UnitedStates(HolidayBase):
             if self.state == "GA" and year == 2020:
                 self[date(year, APR, 10)] = name
             else:
-                self[date(year, APR, 1) + rd(weekday=MO(+4))] = name
+                self[nth_weekday(year, APR, MON, 4)] = name
         elif self.state == "TX" and year >= 1931:
             self[date(year, JAN, 19)] = name
 
@@ -335,7 +423,7 @@ class UnitedStates(HolidayBase):
 
         # Arbor Day
         if self.state == "NE" and year >= 1989:
-            self[date(year, APR, 30) + rd(weekday=FR(-1))] = "Arbor Day"
+            self[last_weekday(year, APR, FRI)] = "Arbor Day"
         elif self.state == "NE" and year >= 1875:
             self[date(year, APR, 22)] = "Arbor Day"
 
@@ -343,8 +431,8 @@ class UnitedStates(HolidayBase):
         if self.state == "IN" and (
             (year >= 2006 and year % 2 == 0) or year >= 2015
         ):
-            dt = date(year, MAY, 1) + rd(weekday=MO)
-            self[dt + rd(days=+1)] = "Primary Election Day"
+            dt = nth_weekday(year, MAY, MON, 1)
+            self[add_days(dt, 1)] = "Primary Election Day"
 
         # Truman Day
         if self.state == "MO" and year >= 1949:
@@ -355,16 +443,10 @@ class UnitedStates(HolidayBase):
             elif self.observed and date(year, MAY, 8).weekday() == SUN:
                 self[date(year, MAY, 10)] = name + " (Observed)"
 
-        # Memorial Day
-        if year > 1970:
-            self[date(year, MAY, 31) + rd(weekday=MO(-1))] = "Memorial Day"
-        elif year >= 1888:
-            self[date(year, MAY, 30)] = "Memorial Day"
-
         # Jefferson Davis Birthday
         name = "Jefferson Davis Birthday"
         if self.state == "AL" and year >= 1890:
-            self[date(year, JUN, 1) + rd(weekday=MO)] = name
+            self[nth_weekday(year, JUN, MON, 1)] = name
 
         # Kamehameha Day
         if self.state == "HI" and year >= 1872:
@@ -390,16 +472,7 @@ class UnitedStates(HolidayBase):
 
         # Emancipation Day in US Virgin Islands
         if self.state == "VI":
-            self[date(year, JUL, 3)] = "Emancipation Day"
-
-        # Independence Day
-        if year > 1870:
-            name = "Independence Day"
-            self[date(year, JUL, 4)] = name
-            if self.observed and date(year, JUL, 4).weekday() == SAT:
-                self[date(year, JUL, 4) + rd(days=-1)] = name + " (Observed)"
-            elif self.observed and date(year, JUL, 4).weekday() == SUN:
-                self[date(year, JUL, 4) + rd(days=+1)] = name + " (Observed)"
+            self._add_before_national(date(year, JUL, 3), "Emancipation Day")
 
         # Liberation Day (Guam)
         if self.state == "GU" and year >= 1945:
@@ -410,9 +483,9 @@ class UnitedStates(HolidayBase):
             name = "Pioneer Day"
             self[date(year, JUL, 24)] = name
             if self.observed and date(year, JUL, 24).weekday() == SAT:
-                self[date(year, JUL, 24) + rd(days=-1)] = name + " (Observed)"
+                self[add_days(date(year, JUL, 24), -1)] = name + " (Observed)"
             elif self.observed and date(year, JUL, 24).weekday() == SUN:
-                self[date(year, JUL, 24) + rd(days=+1)] = name + " (Observed)"
+                self[add_days(date(year, JUL, 24), 1)] = name + " (Observed)"
 
         # Constitution Day
         if self.state == "PR":
@@ -422,11 +495,11 @@ class UnitedStates(HolidayBase):
 
         # Victory Day
         if self.state == "RI" and year >= 1948:
-            self[date(year, AUG, 1) + rd(weekday=MO(+2))] = "Victory Day"
+            self[nth_weekday(year, AUG, MON, 2)] = "Victory Day"
 
         # Statehood Day (Hawaii)
         if self.state == "HI" and year >= 1959:
-            self[date(year, AUG, 1) + rd(weekday=FR(+3))] = "Statehood Day"
+            self[nth_weekday(year, AUG, FRI, 3)] = "Statehood Day"
 
         # Bennington Battle Day
         if self.state == "VT" and year >= 1778:
@@ -441,42 +514,43 @@ class UnitedStates(HolidayBase):
         if self.state == "TX" and year >= 1973:
             self[date(year, AUG, 27)] = "Lyndon Baines Johnson Day"
 
-        # Labor Day
-        if year >= 1894:
-            self[date(year, SEP, 1) + rd(weekday=MO)] = "Labor Day"
-
         # Columbus Day
-        if self.state not in ("AK", "AR", "DE", "FL", "HI", "NV"):
-            if self.state == "SD":
-                name = "Native American Day"
-            elif self.state == "VI":
-                name = "Columbus Day and Puerto Rico Friendship Day"
-            else:
-                name = "Columbus Day"
-            if year >= 1970:
-                self[date(year, OCT, 1) + rd(weekday=MO(+2))] = name
-            elif year >= 1937:
-                self[date(year, OCT, 12)] = name
+        if year >= 1970:
+            dt = nth_weekday(year, OCT, MON, 2)
+        elif year >= 1937:
+            dt = date(year, OCT, 12)
+        else:
+            dt = None
+        if dt and self.state in ("AK", "AR", "DE", "FL", "HI", "NV"):
+            self._replace_national(dt, "Columbus Day")
+        elif dt and self.state == "SD":
+            self._replace_national(dt, "Columbus Day", "Native American Day")
+        elif dt and self.state == "VI":
+            self._replace_national(
+                dt,
+                "Columbus Day",
+                "Columbus Day and Puerto Rico Friendship Day",
+            )
 
         # Alaska Day
         if self.state == "AK" and year >= 1867:
             name = "Alaska Day"
             self[date(year, OCT, 18)] = name
             if self.observed and date(year, OCT, 18).weekday() == SAT:
-                self[date(year, OCT, 18) + rd(days=-1)] = name + " (Observed)"
+                self[add_days(date(year, OCT, 18), -1)] = name + " (Observed)"
             elif self.observed and date(year, OCT, 18).weekday() == SUN:
-                self[date(year, OCT, 18) + rd(days=+1)] = name + " (Observed)"
+                self[add_days(date(year, OCT, 18), 1)] = name + " (Observed)"
 
         # Nevada Day
         if self.state == "NV" and year >= 1933:
             dt = date(year, OCT, 31)
             if year >= 2000:
-                dt += rd(weekday=FR(-1))
+                dt = last_weekday(year, OCT, FRI)
             self[dt] = "Nevada Day"
             if self.observed and dt.weekday() == SAT:
-                self[dt + rd(days=-1)] = "Nevada Day (Observed)"
+                self[add_days(dt, -1)] = "Nevada Day (Observed)"
             elif self.observed and dt.weekday() == SUN:
-                self[dt + rd(days=+1)] = "Nevada Day (Observed)"
+                self[add_days(dt, 1)] = "Nevada Day (Observed)"
 
         # Liberty Day
         if self.state == "VI":
@@ -489,37 +563,19 @@ class UnitedStates(HolidayBase):
             and year >= 2008
             and year % 2 == 0
         ) or (self.state in ("IN", "NY") and year >= 2015):
-            dt = date(year, NOV, 1) + rd(weekday=MO)
-            self[dt + rd(days=+1)] = "Election Day"
+            dt = nth_weekday(year, NOV, MON, 1)
+            self[add_days(dt, 1)] = "Election Day"
 
         # All Souls' Day
         if self.state == "GU":
             self[date(year, NOV, 2)] = "All Souls' Day"
 
-        # Veterans Day
-        if year > 1953:
-            name = "Veterans Day"
-        else:
-            name = "Armistice Day"
-        if 1978 > year > 1970:
-            self[date(year, OCT, 1) + rd(weekday=MO(+4))] = name
-        elif year >= 1938:
-            self[date(year, NOV, 11)] = name
-            if self.observed and date(year, NOV, 11).weekday() == SAT:
-                self[date(year, NOV, 11) + rd(days=-1)] = name + " (Observed)"
-            elif self.observed and date(year, NOV, 11).weekday() == SUN:
-                self[date(year, NOV, 11) + rd(days=+1)] = name + " (Observed)"
-
         # Discovery Day
         if self.state == "PR":
             self[date(year, NOV, 19)] = "Discovery Day"
             if self.observed and date(year, NOV, 19).weekday() == SUN:
                 self[date(year, NOV, 20)] = "Discovery Day (Observed)"
 
-        # Thanksgiving
-        if year > 1870:
-            self[date(year, NOV, 1) + rd(weekday=TH(+4))] = "Thanksgiving"
-
         # Day After Thanksgiving
         # Friday After Thanksgiving
         # Lincoln's Birthday
@@ -547,8 +603,8 @@ class UnitedStates(HolidayBase):
                 name = "Family Day"
             elif self.state == "NM":
                 name = "Presidents' Day"
-            dt = date(year, NOV, 1) + rd(weekday=TH(+4))
-            self[dt + rd(days=+1)] = name
+            dt = nth_weekday(year, NOV, THU, 4)
+            self[add_days(dt, 1)] = name
 
         # Robert E. Lee's Birthday
         if self.state == "GA" and year >= 1986:
@@ -556,7 +612,7 @@ class UnitedStates(HolidayBase):
                 name = "State Holiday"
             else:
                 name = "Robert E. Lee's Birthday"
-            self[date(year, NOV, 29) + rd(weekday=FR(-1))] = name
+            self[weekday_on_or_before(date(year, NOV, 29), FRI)] = name
 
         # Lady of Camarin Day
         if self.state == "GU":
@@ -570,23 +626,18 @@ class UnitedStates(HolidayBase):
             or (self.state == "WI" and year >= 2012)
         ):
             name = "Christmas Eve"
-            self[date(year, DEC, 24)] = name
+            self._add_before_national(date(year, DEC, 24), name)
             name = name + " (Observed)"
             # If on Friday, observed on Thursday
             if self.observed and date(year, DEC, 24).weekday() == FRI:
-                self[date(year, DEC, 24) + rd(days=-1)] = name
+                self._add_before_national(
+                    add_days(date(year, DEC, 24), -1), name
+                )
             # If on Saturday or Sunday, observed on Friday
             elif self.observed and date(year, DEC, 24).weekday() in WEEKEND:
-                self[date(year, DEC, 24) + rd(weekday=FR(-1))] = name
-
-        # Christmas Day
-        if year > 1870:
-            name = "Christmas Day"
-            self[date(year, DEC, 25)] = "Christmas Day"
-            if self.observed and date(year, DEC, 25).weekday() == SAT:
-                self[date(year, DEC, 25) + rd(days=-1)] = name + " (Observed)"
-            elif self.observed and date(year, DEC, 25).weekday() == SUN:
-                self[date(year, DEC, 25) + rd(days=+1)] = name + " (Observed)"
+                self._add_before_national(
+                    weekday_on_or_before(date(year, DEC, 24), FRI), name
+                )
 
         # Day After Christmas
         if self.state == "NC" and year >= 2013:
@@ -595,10 +646,10 @@ class UnitedStates(HolidayBase):
             name = name + " (Observed)"
             # If on Saturday or Sunday, observed on Monday
             if self.observed and date(year, DEC, 26).weekday() in WEEKEND:
-                self[date(year, DEC, 26) + rd(weekday=MO)] = name
+                self[weekday_on_or_after(date(year, DEC, 26), MON)] = name
             # If on Monday, observed on Tuesday
             elif self.observed and date(year, DEC, 26).weekday() == MON:
-                self[date(year, DEC, 26) + rd(days=+1)] = name
+                self[add_days(date(year, DEC, 26), 1)] = name
         elif self.state == "TX" and year >= 1981:
             self[date(year, DEC, 26)] = "Day After Christmas"
         elif self.state == "VI":
@@ -15,14 +15,11 @@ from datetime import date, datetime, timedelta
 
 from dateutil.relativedelta import relativedelta as rd, FR, SA, MO
 
+from holidays.calendars import korean
 from holidays.constants import JAN, APR, MAY, SEP
 from holidays.constants import SAT, SUN
 from holidays.holiday_base import HolidayBase
 
-# Installation: pip install korean_lunar_calendar
-# URL: https://github.com/usingsky/korean_lunar_calendar_py/
-from korean_lunar_calendar import KoreanLunarCalendar
-
 
 class Vietnam(HolidayBase):
 
@@ -32,7 +29,6 @@ class Vietnam(HolidayBase):
 
     def __init__(self, **kwargs):
         self.country = "VN"
-        self.korean_cal = KoreanLunarCalendar()
         HolidayBase.__init__(self, **kwargs)
 
     def _populate(self, year):
@@ -58,8 +54,8 @@ class Vietnam(HolidayBase):
             "Vietnamese New Year's Eve",  # index: -1
         ]
         dt = self.get_solar_date(year, 1, 1)
-        new_year_date = date(dt.year, dt.month, dt.day)
-        if self.observed:
+        if self.observed and dt is not None:
+            new_year_date = date(dt.year, dt.month, dt.day)
             for i in range(-1, 5, 1):
                 tet_day = new_year_date + rd(days=+i)
                 self[tet_day] = name[i]
@@ -69,8 +65,9 @@ class Vietnam(HolidayBase):
         if year >= 2007:
             name = "Hung Kings Commemoration Day"
             dt = self.get_solar_date(year, 3, 10)
-            king_hung_date = date(dt.year, dt.month, dt.day)
-            self[king_hung_date] = name
+            if dt is not None:
+                king_hung_date = date(dt.year, dt.month, dt.day)
+                self[king_hung_date] = name
         else:
             pass
 
@@ -89,14 +86,13 @@ class Vietnam(HolidayBase):
         independence_date = date(year, SEP, 2)
         self[independence_date] = name
 
-    # convert lunar calendar date to solar
+    # convert lunar calendar date to solar, None outside the lunar years
+    # of the table (whose lunar holidays are then left out)
     def get_solar_date(self, year, month, day):
-        self.korean_cal.setLunarDate(year, month, day, False)
-        return date(
-            self.korean_cal.solarYear,
-            self.korean_cal.solarMonth,
-            self.korean_cal.solarDay,
-        )
+        try:
+            return korean.lunar_to_gregorian(year, month, day)
+        except ValueError:
+            return None
 
 
 class VN(Vietnam):
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+"""Closed-form date arithmetic for populating holidays.
+
+These helpers cover the shifts country modules need most (a number of
+days, the nth weekday of a month, the next or previous given weekday)
+with plain ordinal arithmetic, avoiding the construction and
+normalization of a ``relativedelta`` on every call. Weekdays are the
+``MON`` ... ``SUN`` integers of :mod:`holidays.constants`.
+"""
+
+from datetime import date
+
+
+def add_days(dt, days):
+    """Return ``dt`` shifted by ``days`` days (negative to go back)."""
+    return date.fromordinal(dt.toordinal() + days)
+
+
+def weekday_on_or_after(dt, weekday, n=1):
+    """Return the ``n``-th ``weekday`` on or after ``dt``, like
+    ``dt + relativedelta(weekday=WD(+n))``."""
+    return date.fromordinal(
+        dt.toordinal() + (weekday - dt.weekday()) % 7 + (n - 1) * 7
+    )
+
+
+def weekday_on_or_before(dt, weekday, n=1):
+    """Return the ``n``-th ``weekday`` on or before ``dt``, like
+    ``dt + relativedelta(weekday=WD(-n))``."""
+    return date.fromordinal(
+        dt.toordinal() - (dt.weekday() - weekday) % 7 - (n - 1) * 7
+    )
+
+
+def nth_weekday(year, month, weekday, n):
+    """Return the ``n``-th ``weekday`` of ``month``; a negative ``n`` counts
+    from the end of the month, -1 being the last one."""
+    if n > 0:
+        return weekday_on_or_after(date(year, month, 1), weekday, n)
+    if month == 12:
+        last = date(year, 12, 31)
+    else:
+        last = date.fromordinal(date(year, month + 1, 1).toordinal() - 1)
+    return weekday_on_or_before(last, weekday, -n)
+
+
+def last_weekday(year, month, weekday):
+    """Return the last ``weekday`` of ``month``."""
+    return nth_weekday(year, month, weekday, -1)
@@ -11,14 +11,92 @@
 #  Website: https://github.com/dr-prodigy/python-holidays
 #  License: MIT (see LICENSE file)
 
+import copyreg
+import hashlib
+import json
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import ItemsView, KeysView, Mapping, ValuesView
 from datetime import timedelta, datetime, date
 
 import six
 from dateutil.parser import parse
 
+from holidays.constants import WEEKEND
 
-class HolidayBase(dict):
+
+def _to_date(key):
+    """Convert a date, datetime, timestamp or string key to a date."""
+    if isinstance(key, datetime):
+        return key.date()
+    elif isinstance(key, date):
+        return key
+    elif isinstance(key, int) or isinstance(key, float):
+        return datetime.utcfromtimestamp(key).date()
+    elif isinstance(key, six.string_types):
+        try:
+            return parse(key).date()
+        except (ValueError, OverflowError):
+            raise ValueError("Cannot parse date from string '%s'" % key)
+    raise TypeError("Cannot convert type '%s' to date." % type(key))
+
+
+class _HolidayMethods(object):
+    # The methods built on item access, shared by HolidayBase and
+    # HolidayOverlay; _entries() gives the (date, name) pairs without
+    # populating any year.
+    __slots__ = ()
+
+    def update(self, *args):
+        for arg in args:
+            if isinstance(arg, dict):
+                for key, value in list(arg.items()):
+                    self[key] = value
+            elif isinstance(arg, list):
+                for item in arg:
+                    self[item] = "Holiday"
+            else:
+                self[arg] = "Holiday"
+
+    def append(self, *args):
+        return self.update(*args)
+
+    def get_list(self, key):
+        return [h for h in self.get(key, "").split(", ") if h]
+
+    def get_named(self, name):
+        # find all dates matching provided name (accepting partial
+        # strings too, case insensitive), returning them in a list
+        # (without expanding to the years of matching observed days)
+        return [
+            key
+            for key, value in self._entries()
+            if name.lower() in value.lower()
+        ]
+
+    def pop_named(self, name):
+        to_pop = self.get_named(name)
+        if not to_pop:
+            raise KeyError(name)
+        for key in to_pop:
+            self.pop(key)
+        return to_pop
+
+
+class HolidayBase(_HolidayMethods, dict):
     PROVINCES = []
+    # The weekend days in effect from each date on (None for the first)
+    WEEKENDS = ((None, WEEKEND),)
+    _frozen = False
+    # Data derived from the holidays (per-year indexes, digests...) is kept
+    # in a slot, out of the instance __dict__ compared by __eq__ and pickled.
+    __slots__ = ("__dict__", "_cache")
+
+    def __new__(cls, *args, **kwargs):
+        self = dict.__new__(cls)
+        dict.__setattr__(self, "_cache", {})
+        return self
 
     def __init__(
         self, years=[], expand=True, observed=True, prov=None, state=None
@@ -33,10 +111,10 @@ class HolidayBase(dict):
         if not getattr(self, "prov", False):
             self.prov = prov
         self.state = state
-        for year in list(self.years):
-            self._populate(year)
+        self._populate_years(list(self.years))
 
     def __setattr__(self, key, value):
+        self._on_change()
         if key == "observed" and len(self) > 0:
             dict.__setattr__(self, key, value)
             if value is True:
@@ -55,25 +133,36 @@ class HolidayBase(dict):
             return dict.__setattr__(self, key, value)
 
     def __keytransform__(self, key):
-        if isinstance(key, datetime):
-            key = key.date()
-        elif isinstance(key, date):
-            key = key
-        elif isinstance(key, int) or isinstance(key, float):
-            key = datetime.utcfromtimestamp(key).date()
-        elif isinstance(key, six.string_types):
-            try:
-                key = parse(key).date()
-            except (ValueError, OverflowError):
-                raise ValueError("Cannot parse date from string '%s'" % key)
-        else:
-            raise TypeError("Cannot convert type '%s' to date." % type(key))
-
+        key = _to_date(key)
         if self.expand and key.year not in self.years:
             self.years.add(key.year)
             self._populate(key.year)
         return key
 
+    def _populate_years(self, years):
+        # Populate several years; subclasses that can compute a range of
+        # years at once override it
+        for year in years:
+            self._populate(year)
+
+    def _populate_apart(self, year, populate):
+        # Populate year with populate(year, holidays), which adds the
+        # holidays of the year to an empty holidays object merged into this
+        # calendar afterwards: observed and in lieu rules scanning
+        # holidays.items() only see that year, not every year populated so
+        # far, so populating N years does not take O(N^2) time.
+        holidays = HolidayBase(expand=False)
+        populate(year, holidays)
+        self.update(holidays)
+
+    def _add_years(self, years):
+        # Populate the given years, skipping those already generated
+        for year in years:
+            if year not in self.years:
+                self._on_change()
+                self.years.add(year)
+                self._populate(year)
+
     def __contains__(self, key):
         return dict.__contains__(self, self.__keytransform__(key))
 
@@ -106,15 +195,13 @@ class HolidayBase(dict):
             days_in_range = []
             for delta_days in range(0, date_diff.days, step):
                 day = start + timedelta(days=delta_days)
-                try:
-                    dict.__getitem__(self, day)
+                if self._lookup(day) is not None:
                     days_in_range.append(day)
-                except KeyError:
-                    pass
             return days_in_range
         return dict.__getitem__(self, self.__keytransform__(key))
 
     def __setitem__(self, key, value):
+        self._on_change()
         if key in self:
             if self.get(key).find(value) < 0 and value.find(self.get(key)) < 0:
                 value = "%s, %s" % (value, self.get(key))
@@ -122,54 +209,254 @@ class HolidayBase(dict):
                 value = self.get(key)
         return dict.__setitem__(self, self.__keytransform__(key), value)
 
-    def update(self, *args):
-        args = list(args)
-        for arg in args:
-            if isinstance(arg, dict):
-                for key, value in list(arg.items()):
-                    self[key] = value
-            elif isinstance(arg, list):
-                for item in arg:
-                    self[item] = "Holiday"
-            else:
-                self[arg] = "Holiday"
+    def _merge(self, items):
+        # Merge (date, name) pairs, combining names like __setitem__ does
+        # but without key conversion or expansion to the years of the dates
+        self._on_change()
+        for key, value in items:
+            existing = self._lookup(key)
+            if existing is not None:
+                if existing.find(value) < 0 and value.find(existing) < 0:
+                    value = "%s, %s" % (value, existing)
+                else:
+                    value = existing
+            self._store(key, value)
 
-    def append(self, *args):
-        return self.update(*args)
+    # Store the name of a converted date key; LayeredHolidayBase keeps its
+    # count of holidays up to date there
+    _store = dict.__setitem__
 
     def get(self, key, default=None):
         return dict.get(self, self.__keytransform__(key), default)
 
-    def get_list(self, key):
-        return [h for h in self.get(key, "").split(", ") if h]
-
-    def get_named(self, name):
-        # find all dates matching provided name (accepting partial
-        # strings too, case insensitive), returning them in a list
-        original_expand = self.expand
-        self.expand = False
-        matches = [key for key in self if name.lower() in self[key].lower()]
-        self.expand = original_expand
-        return matches
-
     def pop(self, key, default=None):
+        self._on_change()
         if default is None:
             return dict.pop(self, self.__keytransform__(key))
         return dict.pop(self, self.__keytransform__(key), default)
 
-    def pop_named(self, name):
-        to_pop = self.get_named(name)
-        if not to_pop:
-            raise KeyError(name)
-        for key in to_pop:
-            self.pop(key)
-        return to_pop
+    def freeze(self):
+        """Make the holidays read-only and stop expanding to new years.
+
+        Populate every needed year before freezing: dates of other years
+        are then reported as non holidays and any change raises TypeError.
+        """
+        self.expand = False
+        dict.__setattr__(self, "_frozen", True)
+        return self
+
+    def _on_change(self):
+        # Called before any change: rejects it if frozen and drops the
+        # per-year data derived from the current holidays.
+        if self._frozen:
+            raise TypeError("Holidays object is frozen")
+        if self._cache:
+            self._cache.clear()
+
+    def _lookup(self, key):
+        # The name of the date key, without populating its year
+        return dict.get(self, key)
+
+    def _entries(self):
+        # The (date, name) pairs, without populating any year
+        return dict.items(self)
+
+    def _year_entries(self, year):
+        """Return the sorted (date, name) pairs of ``year``."""
+        index = self._cache.get("years")
+        if index is None:
+            index = {}
+            for key, value in sorted(self._entries()):
+                index.setdefault(key.year, []).append((key, value))
+            self._cache["years"] = index
+        return index.get(year, [])
+
+    def _year_holidays(self, year):
+        # The (date, name) pairs of year: this calendar's own when it holds
+        # the year, with the dates it observes in the adjacent years it
+        # does not hold, else those of a copy populated for that year only.
+        # Kept until the holidays change, so that every sum holding this
+        # calendar merges the same per-year delta.
+        entries = self._cache.get(("delta", year))
+        if entries is not None:
+            return entries
+        if year in self.years:
+            entries = list(self._year_entries(year))
+            for other in (year - 1, year + 1):
+                if other not in self.years:
+                    entries.extend(self._year_entries(other))
+        else:
+            holidays = self._detached(year)
+            holidays._populate(year)
+            entries = list(holidays._entries())
+        self._cache[("delta", year)] = entries
+        return entries
+
+    def _year_bitmap(self, year):
+        # The holidays dated in year as a bitmap of their day of the year
+        # and a {day of the year: name} mapping
+        bitmap = self._cache.get(("bitmap", year))
+        if bitmap is None:
+            first = date(year, 1, 1).toordinal()
+            names = {
+                key.toordinal() - first: value
+                for key, value in self._year_holidays(year)
+                if key.year == year
+            }
+            mask = 0
+            for day in names:
+                mask |= 1 << day
+            bitmap = self._cache[("bitmap", year)] = (mask, names)
+        return bitmap
+
+    def weekend(self, key):
+        """Return the weekdays of the weekend in effect on the date ``key``."""
+        key = _to_date(key)
+        weekend = ()
+        for since, weekdays in self.WEEKENDS:
+            if since is not None and key < since:
+                break
+            weekend = weekdays
+        return weekend
+
+    def is_weekend(self, key):
+        key = _to_date(key)
+        return key.weekday() in self.weekend(key)
+
+    def is_workday(self, key):
+        """Return whether the date ``key`` is neither a weekend day nor a
+        holiday."""
+        key = _to_date(key)
+        offset = key.toordinal() - date(key.year, 1, 1).toordinal()
+        return bool(self._year_workdays(key.year) >> offset & 1)
+
+    def count_workdays(self, start, end):
+        """Return the number of workdays between ``start`` and ``end``
+        (inclusive)."""
+        start, end = _to_date(start), _to_date(end)
+        count = 0
+        for year in range(start.year, end.year + 1):
+            workdays = self._year_workdays(year)
+            first = date(year, 1, 1).toordinal()
+            if year == end.year:
+                workdays &= (2 << (end.toordinal() - first)) - 1
+            if year == start.year:
+                workdays >>= start.toordinal() - first
+            count += bin(workdays).count("1")
+        return count
+
+    def _year_workdays(self, year):
+        # The workdays of year as a bitmap of their day of the year, kept
+        # until the holidays change
+        workdays = self._cache.get(("workdays", year))
+        if workdays is not None:
+            return workdays
+        if self.expand:
+            self._add_years([year])
+        first = date(year, 1, 1).toordinal()
+        days = date(year, 12, 31).toordinal() - first + 1
+        weekends = 0
+        for i, (since, weekdays) in enumerate(self.WEEKENDS):
+            start = 0 if since is None else since.toordinal() - first
+            stop = days
+            if i + 1 < len(self.WEEKENDS):
+                stop = self.WEEKENDS[i + 1][0].toordinal() - first
+            start, stop = max(start, 0), min(stop, days)
+            for weekday in weekdays:
+                day = (
+                    start
+                    + (weekday - date.fromordinal(first + start).weekday()) % 7
+                )
+                while day < stop:
+                    weekends |= 1 << day
+                    day += 7
+        if year in self.years:
+            weekends |= self._year_bitmap(year)[0]
+        workdays = ((1 << days) - 1) & ~weekends
+        self._cache[("workdays", year)] = workdays
+        return workdays
+
+    def _detached(self, year, **attrs):
+        # An unpopulated, unfrozen copy of this calendar limited to year
+        holidays = type(self).__new__(type(self))
+        attrs = dict(self.__dict__, **attrs)
+        attrs.update(expand=False, years={year})
+        attrs.pop("_frozen", None)
+        holidays.__dict__.update(attrs)
+        return holidays
+
+    def _config(self):
+        return {
+            "class": "%s.%s"
+            % (self.__class__.__module__, self.__class__.__name__),
+            "country": getattr(self, "country", None),
+            "prov": self.prov,
+            "state": self.state,
+            "observed": self.observed,
+        }
+
+    def fingerprint(self, start, end):
+        """Return a stable digest of the configuration and the holidays
+        between ``start`` and ``end`` (inclusive).
+
+        Two calendars with the same fingerprint for a range hold the same
+        holidays in it, so it can be used as a cache key or HTTP ETag. The
+        digest of each whole year is cached until the holidays change.
+        """
+        start = _to_date(start)
+        end = _to_date(end)
+        if self.expand:
+            self._add_years(range(start.year, end.year + 1))
+        digest = hashlib.sha256(
+            json.dumps(self._config(), sort_keys=True).encode("utf-8")
+        )
+        for year in range(start.year, end.year + 1):
+            if start <= date(year, 1, 1) and date(year, 12, 31) <= end:
+                year_digest = self._cache.get(("digest", year))
+                if year_digest is None:
+                    year_digest = _digest(self._year_entries(year))
+                    self._cache[("digest", year)] = year_digest
+            else:
+                year_digest = _digest(
+                    (key, value)
+                    for key, value in self._year_entries(year)
+                    if start <= key <= end
+                )
+            digest.update(year_digest)
+        return digest.hexdigest()
+
+    def __delitem__(self, key):
+        self._on_change()
+        dict.__delitem__(self, key)
+
+    def clear(self):
+        self._on_change()
+        dict.clear(self)
+
+    def popitem(self):
+        self._on_change()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self._on_change()
+        return dict.setdefault(self, key, default)
+
+    def __ior__(self, other):
+        # Keep dict's |= (Python 3.9+) from bypassing update
+        self.update(other if isinstance(other, dict) else dict(other))
+        return self
 
     def __eq__(self, other):
-        return dict.__eq__(self, other) and self.__dict__ == other.__dict__
+        if isinstance(other, HolidayBase):
+            same = len(self) == len(other) and all(
+                other._lookup(key) == value for key, value in self._entries()
+            )
+        else:
+            same = dict.__eq__(self, other)
+        return same and self.__dict__ == other.__dict__
 
     def __ne__(self, other):
-        return dict.__ne__(self, other) or self.__dict__ != other.__dict__
+        return not self.__eq__(other)
 
     def __add__(self, other):
         if isinstance(other, int) and other == 0:
@@ -178,61 +465,673 @@ class HolidayBase(dict):
             return self
         elif not isinstance(other, HolidayBase):
             raise TypeError()
-        HolidaySum = createHolidaySum(self, other)
-        country = getattr(self, "country", None) or getattr(
-            other, "country", None
-        )
-        if self.country and other.country and self.country != other.country:
-            c1 = self.country
-            if not isinstance(c1, list):
-                c1 = [c1]
-            c2 = other.country
-            if not isinstance(c2, list):
-                c2 = [c2]
-            country = c1 + c2
-        prov = getattr(self, "prov", None) or getattr(other, "prov", None)
-        if self.prov and other.prov and self.prov != other.prov:
-            p1 = self.prov if isinstance(self.prov, list) else [self.prov]
-            p2 = other.prov if isinstance(other.prov, list) else [other.prov]
-            prov = p1 + p2
-        return HolidaySum(
-            years=(self.years | other.years),
-            expand=(self.expand or other.expand),
-            observed=(self.observed or other.observed),
-            country=country,
-            prov=prov,
-        )
+        return union(self, other)
 
     def __radd__(self, other):
         return self.__add__(other)
 
+    def intersection(self, other, years=None, names="merge"):
+        """Return the holidays of both calendars.
+
+        ``names`` selects the name of each date: ``"merge"`` combines both
+        names, ``"left"`` or ``"right"`` keeps the name of one calendar and
+        a callable receives both names and returns the one to use.
+        """
+        return HolidayOperation(self, other, "&", years=years, names=names)
+
+    def difference(self, other, years=None):
+        """Return the holidays of this calendar that are not in other."""
+        return HolidayOperation(self, other, "-", years=years)
+
+    def symmetric_difference(self, other, years=None):
+        """Return the holidays of exactly one of the calendars."""
+        return HolidayOperation(self, other, "^", years=years)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    def __xor__(self, other):
+        return self.symmetric_difference(other)
+
     def _populate(self, year):
         pass
 
+    @classmethod
+    def subdivision_matrix(cls, start, end, observed=True, subdivisions=None):
+        """Return a :class:`SubdivisionMatrix` of the holidays of every
+        subdivision between ``start`` and ``end`` (inclusive).
+
+        ``subdivisions`` restricts the matrix to some provinces or states;
+        a country without subdivisions has a single ``None`` column.
+        """
+        start, end = _to_date(start), _to_date(end)
+        if end < start:
+            raise ValueError("end must not be before start")
+        if subdivisions is None:
+            subdivisions = list(
+                cls.PROVINCES or getattr(cls, "STATES", None) or [None]
+            )
+        years = list(range(start.year, end.year + 1))
+        columns = cls._subdivision_holidays(subdivisions, years, observed)
+        return SubdivisionMatrix(start, end, subdivisions, columns)
+
+    @classmethod
+    def _subdivision_holidays(cls, subdivisions, years, observed):
+        # Return the {date: name} holidays of each subdivision in years;
+        # subdivisions with the very same holidays may share one dict
+        keyword = "prov" if cls.PROVINCES else "state"
+        columns = []
+        for subdivision in subdivisions:
+            kwargs = {keyword: subdivision} if subdivision else {}
+            columns.append(
+                dict(
+                    cls(years=years, expand=False, observed=observed, **kwargs)
+                )
+            )
+        return columns
+
     def __reduce__(self):
-        return super(HolidayBase, self).__reduce__()
+        # Pickle the configuration (instance __dict__) plus a packed
+        # payload of day offsets and name table indexes rather than one
+        # (date, str) pair per holiday: repeated names (observed days,
+        # multi-day festivals, many populated years) are stored only once.
+        names = []
+        name_ids = {}
+        ordinals = []
+        ids = []
+        for key, value in self._entries():
+            if value not in name_ids:
+                name_ids[value] = len(names)
+                names.append(value)
+            ordinals.append(key.toordinal())
+            ids.append(name_ids[value])
+        base = min(ordinals, default=0)
+        offsets = [ordinal - base for ordinal in ordinals]
+        return (
+            copyreg.__newobj__,
+            (self.__class__,),
+            (
+                self.__dict__.copy(),
+                base,
+                _pack(offsets),
+                _pack(ids),
+                names,
+            ),
+        )
+
+    def __setstate__(self, state):
+        attrs, base, offsets, ids, names = state
+        # Bypass __setattr__ so that restoring `observed` does not trigger
+        # a repopulation.
+        self.__dict__.update(attrs)
+        for offset, name_id in zip(offsets, ids):
+            dict.__setitem__(
+                self, date.fromordinal(base + offset), names[name_id]
+            )
+
+
+def _digest(entries):
+    digest = hashlib.sha256()
+    for key, value in entries:
+        digest.update(("%s\t%s\n" % (key.isoformat(), value)).encode("utf-8"))
+    return digest.digest()
+
+
+def _pack(values):
+    """Pack non-negative integers in the narrowest unsigned array type."""
+    top = max(values, default=0)
+    typecode = "B" if top < 1 << 8 else "H" if top < 1 << 16 else "I"
+    return array(typecode, values)
+
+
+class HolidaySum(HolidayBase):
+    """The union of several calendars, as built by ``h1 + h2`` or
+    :func:`union`.
+
+    Nested sums are flattened into a single list of member calendars. A
+    year is computed by merging the holidays of that year of each member,
+    which populates a member at most once per year and never modifies it.
+    """
+
+    def __init__(self, *calendars, country=None, **kwargs):
+        self.country = country
+        self.holidays = []
+        for h in calendars:
+            self.holidays.extend(getattr(h, "holidays", False) or [h])
+        HolidayBase.__init__(self, **kwargs)
+
+    def _populate(self, year):
+        for h in self.holidays[::-1]:
+            self._merge(h._year_holidays(year))
+
+
+def _sum_attr(value, other):
+    # The country (or prov) of the sum of two calendars: either one when
+    # they match, else the list of both
+    if value and other and value != other:
+        if not isinstance(value, list):
+            value = [value]
+        if not isinstance(other, list):
+            other = [other]
+        return value + other
+    return value or other
+
+
+def union(*calendars):
+    """Return a :class:`HolidaySum` of ``calendars`` in one step.
+
+    It is equivalent to ``calendars[0] + calendars[1] + ...`` but builds a
+    single flat sum instead of one intermediate sum per addition.
+    """
+    country = prov = None
+    for h in calendars:
+        if not isinstance(h, HolidayBase):
+            raise TypeError()
+        country = _sum_attr(country, getattr(h, "country", None))
+        prov = _sum_attr(prov, getattr(h, "prov", None))
+    return HolidaySum(
+        *calendars,
+        years=set().union(*(h.years for h in calendars)),
+        expand=any(h.expand for h in calendars),
+        observed=any(h.observed for h in calendars),
+        country=country,
+        prov=prov,
+    )
+
+
+def _merge_names(name, other):
+    # Combine two holiday names like HolidayBase._merge does
+    if name.find(other) >= 0:
+        return name
+    if other.find(name) >= 0:
+        return other
+    return "%s, %s" % (name, other)
+
+
+_OPERATIONS = {
+    "&": lambda mask, other: mask & other,
+    "-": lambda mask, other: mask & ~other,
+    "^": lambda mask, other: mask ^ other,
+}
+
+
+class HolidayOperation(HolidayBase):
+    """The intersection (``&``), difference (``-``) or symmetric difference
+    (``^``) of two calendars.
+
+    Like a sum, it holds the years of both calendars (or the given
+    ``years``) and expands to new years when either calendar does. Each
+    year is computed with a single operation on the bitmaps of the days of
+    that year of both calendars.
+    """
+
+    def __init__(self, left, right, operator, years=None, names="merge"):
+        if not isinstance(right, HolidayBase):
+            raise TypeError()
+        if operator not in _OPERATIONS:
+            raise ValueError("Unknown operator %r" % operator)
+        if names not in ("merge", "left", "right") and not callable(names):
+            raise ValueError("Unknown names %r" % names)
+        self.operands = [left, right]
+        self.operator = operator
+        self.names = names
+        country = getattr(left, "country", None)
+        prov = left.prov
+        if operator != "-":
+            country = _sum_attr(country, getattr(right, "country", None))
+            prov = _sum_attr(prov, right.prov)
+        self.country = country
+        HolidayBase.__init__(
+            self,
+            years=left.years | right.years if years is None else years,
+            expand=left.expand or right.expand,
+            observed=left.observed or right.observed,
+            prov=prov,
+        )
+
+    def _name(self, name, other):
+        if name is None:
+            return other
+        if other is None or self.operator == "-":
+            return name
+        if self.names == "merge":
+            return _merge_names(name, other)
+        if self.names == "left":
+            return name
+        if self.names == "right":
+            return other
+        return self.names(name, other)
+
+    def _populate(self, year):
+        left, right = self.operands
+        mask, names = left._year_bitmap(year)
+        other, other_names = right._year_bitmap(year)
+        mask = _OPERATIONS[self.operator](mask, other)
+        first = date(year, 1, 1).toordinal()
+        items = []
+        while mask:
+            low = mask & -mask
+            mask ^= low
+            day = low.bit_length() - 1
+            items.append(
+                (
+                    date.fromordinal(first + day),
+                    self._name(names.get(day), other_names.get(day)),
+                )
+            )
+        self._merge(items)
+
+
+class SubdivisionMatrix(object):
+    """The holidays of the subdivisions of a country between two dates.
+
+    ``dates`` lists every day from ``start`` to ``end`` and ``subdivisions``
+    the columns. ``matrix[i][j]`` is 1 when subdivision ``j`` has a holiday
+    on ``dates[i]`` (each row is a bytearray), and ``name_ids[i][j]`` is the
+    index of its name in ``names``, whose first entry, the empty string,
+    stands for no holiday.
+    """
+
+    def __init__(self, start, end, subdivisions, columns):
+        self.start = start
+        self.end = end
+        self.subdivisions = list(subdivisions)
+        self.names = [""]
+        days = end.toordinal() - start.toordinal() + 1
+        width = len(self.subdivisions)
+        self.matrix = [bytearray(width) for _ in range(days)]
+        self.name_ids = [array("I", bytes(4 * width)) for _ in range(days)]
+        name_ids = {}
+        first = start.toordinal()
+        # Subdivisions sharing the same holidays are filled together
+        shared = {}
+        for j, holidays in enumerate(columns):
+            shared.setdefault(id(holidays), (holidays, []))[1].append(j)
+        for holidays, indexes in shared.values():
+            for key, value in holidays.items():
+                i = key.toordinal() - first
+                if not 0 <= i < days:
+                    continue
+                name_id = name_ids.get(value)
+                if name_id is None:
+                    name_id = name_ids[value] = len(self.names)
+                    self.names.append(value)
+                row, ids = self.matrix[i], self.name_ids[i]
+                for j in indexes:
+                    row[j] = 1
+                    ids[j] = name_id
+
+    @property
+    def dates(self):
+        return [
+            date.fromordinal(ordinal)
+            for ordinal in range(
+                self.start.toordinal(), self.end.toordinal() + 1
+            )
+        ]
+
+    def _row(self, key):
+        i = _to_date(key).toordinal() - self.start.toordinal()
+        if not 0 <= i < len(self.matrix):
+            raise KeyError(key)
+        return i
+
+    def observing(self, key):
+        """Return the subdivisions with a holiday on the date ``key``."""
+        row = self.matrix[self._row(key)]
+        return [code for code, on in zip(self.subdivisions, row) if on]
+
+    def name(self, key, subdivision):
+        """Return the holiday name of ``subdivision`` on the date ``key``,
+        or None."""
+        ids = self.name_ids[self._row(key)]
+        return self.names[ids[self.subdivisions.index(subdivision)]] or None
+
+    def __repr__(self):
+        return "<SubdivisionMatrix %s-%s (%d subdivisions)>" % (
+            self.start,
+            self.end,
+            len(self.subdivisions),
+        )
+
+
+# National layers of LayeredHolidayBase classes, by (_populate_national,
+# observed, year), shared by every instance of the class. The least recently
+# used layers are dropped past _NATIONAL_LAYERS_SIZE; the calendars holding
+# them keep their own reference.
+_national_layers = OrderedDict()
+_national_layers_lock = threading.Lock()
+_NATIONAL_LAYERS_SIZE = 1024
+
+
+class _Entries(Mapping):
+    # A read-only view of the holidays of a calendar that does not populate
+    # any year, for the keys(), values() and items() of LayeredHolidayBase
+
+    __slots__ = ("holidays",)
+
+    def __init__(self, holidays):
+        self.holidays = holidays
+
+    def __getitem__(self, key):
+        value = self.holidays._lookup(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        return iter(self.holidays)
+
+    def __len__(self):
+        return len(self.holidays)
+
+
+class _EntriesItems(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return self._mapping.holidays._entries()
+
+
+class _EntriesValues(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self):
+        for _, value in self._mapping.holidays._entries():
+            yield value
+
+
+class LayeredHolidayBase(HolidayBase):
+    """A HolidayBase whose national holidays are shared by all its
+    subdivisions.
+
+    Subclasses implement ``_populate_national(year)``, the holidays of the
+    whole country, and ``_populate_subdivision(year)``, the holidays and
+    changes of ``prov`` (or ``state``). The national holidays of a year are
+    computed once per class and ``observed`` setting into a layer shared by
+    every instance: an instance only stores the holidays its subdivision
+    adds or changes, and looks the other dates up in the layers of its
+    years.
+    """
+
+    # The national layers by year, their dates outside their own year, the
+    # dates of the layers removed from this calendar and the number of
+    # holidays; kept out of the instance __dict__ like _cache.
+    __slots__ = ("_layers", "_spill", "_removed", "_size")
+
+    def __new__(cls, *args, **kwargs):
+        self = HolidayBase.__new__(cls, *args, **kwargs)
+        dict.__setattr__(self, "_layers", {})
+        dict.__setattr__(self, "_spill", {})
+        dict.__setattr__(self, "_removed", set())
+        dict.__setattr__(self, "_size", 0)
+        return self
+
+    def _populate(self, year):
+        layer = self._national_layer(year)
+        # Dates the calendar already holds (stored, removed or in the layer
+        # of a close year, for the dates observed in an adjacent year) get
+        # their combined name stored, as HolidayBase would
+        held = dict.keys(self) & layer.keys()
+        held.update(self._removed.intersection(layer))
+        for other in range(year - 2, year + 3):
+            if other in self._layers:
+                held.update(self._layers[other].keys() & layer.keys())
+        if held:
+            self._merge([(key, layer[key]) for key in held])
+        self._on_change()
+        self._layers[year] = layer
+        for key, value in layer.items():
+            if key.year != year:
+                self._spill.setdefault(key, value)
+        dict.__setattr__(self, "_size", self._size + len(layer) - len(held))
+        self._populate_subdivision(year)
+
+    def _national_layer(self, year):
+        populate = type(self)._populate_national
+        key = (populate, self.observed, year)
+        with _national_layers_lock:
+            layer = _national_layers.get(key)
+            if layer is not None:
+                _national_layers.move_to_end(key)
+                return layer
+        national = self._detached(year, prov=None, state=None)
+        populate(national, year)
+        layer = dict(national._entries())
+        with _national_layers_lock:
+            layer = _national_layers.setdefault(key, layer)
+            if len(_national_layers) > _NATIONAL_LAYERS_SIZE:
+                _national_layers.popitem(last=False)
+        return layer
+
+    @classmethod
+    def _subdivision_holidays(cls, subdivisions, years, observed):
+        # The national layers are merged once; each column only applies
+        # the holidays its subdivision adds, changes or removes, and the
+        # subdivisions without any share the national dict.
+        if cls._populate is not LayeredHolidayBase._populate:
+            return super(LayeredHolidayBase, cls)._subdivision_holidays(
+                subdivisions, years, observed
+            )
+        keyword = "prov" if cls.PROVINCES else "state"
+        national = None
+        columns = []
+        for subdivision in subdivisions:
+            kwargs = {keyword: subdivision} if subdivision else {}
+            calendar = cls(
+                years=years, expand=False, observed=observed, **kwargs
+            )
+            if national is None:
+                national = {}
+                for layer in calendar._layers.values():
+                    national.update(layer)
+            if not dict.__len__(calendar) and not calendar._removed:
+                columns.append(national)
+                continue
+            column = dict(national)
+            for key in calendar._removed:
+                column.pop(key, None)
+            column.update(dict.items(calendar))
+            columns.append(column)
+        return columns
+
+    def _populate_national(self, year):
+        pass
+
+    def _populate_subdivision(self, year):
+        pass
+
+    def _add_before_national(self, key, name):
+        # Add a subdivision holiday that comes before the national holiday
+        # of its date in the order the country lists its holidays: its name
+        # goes right after the national name, where __setitem__ would put
+        # it first.
+        key = self.__keytransform__(key)
+        existing = self._lookup(key)
+        national = self._layer_name(key)
+        if existing is None or national is None or national not in existing:
+            self[key] = name
+        elif existing.find(name) < 0 and name.find(existing) < 0:
+            self._on_change()
+            end = existing.index(national) + len(national)
+            self._store(
+                key, "%s, %s%s" % (existing[:end], name, existing[end:])
+            )
+
+    def _replace_national(self, key, name, new_name=None):
+        # Rename (or remove, without new_name) the national holiday name of
+        # the date key for this subdivision, keeping the other names.
+        names = (self._lookup(key) or "").split(", ")
+        if name not in names:
+            return
+        self._on_change()
+        if new_name is None:
+            names.remove(name)
+        else:
+            names[names.index(name)] = new_name
+        if names:
+            self._store(key, ", ".join(names))
+        else:
+            self._discard(key)
+
+    def _layer_name(self, key):
+        # The name of the date key in the national layers. The layer of a
+        # year also holds the dates it observes in the adjacent years, found
+        # in _spill; the combined name of dates in several layers is stored
+        # in the instance.
+        try:
+            layer = self._layers.get(key.year)
+        except AttributeError:
+            return None
+        if layer is not None and key in layer:
+            return layer[key]
+        return self._spill.get(key)
+
+    def _lookup(self, key):
+        value = dict.get(self, key)
+        if value is None and key not in self._removed:
+            value = self._layer_name(key)
+        return value
+
+    def _store(self, key, value):
+        if not dict.__contains__(self, key) and (
+            key in self._removed or self._layer_name(key) is None
+        ):
+            dict.__setattr__(self, "_size", self._size + 1)
+        dict.__setitem__(self, key, value)
+
+    def _entries(self):
+        seen = set()
+        for layer in list(self._layers.values()):
+            for key, value in layer.items():
+                if key not in seen and key not in self._removed:
+                    seen.add(key)
+                    yield key, dict.get(self, key, value)
+        for key, value in list(dict.items(self)):
+            if key not in seen:
+                yield key, value
+
+    def _discard(self, key):
+        # Remove the date key, which the calendar holds, hiding it if a
+        # national layer holds it
+        dict.pop(self, key, None)
+        if self._layer_name(key) is not None:
+            self._removed.add(key)
+        dict.__setattr__(self, "_size", self._size - 1)
+
+    def __contains__(self, key):
+        # The dates stored in the instance first, then the layer of their
+        # year and the dates observed out of the year of their layer
+        key = self.__keytransform__(key)
+        if dict.__contains__(self, key):
+            return True
+        layer = self._layers.get(key.year)
+        if (layer is not None and key in layer) or key in self._spill:
+            return key not in self._removed
+        return False
+
+    def __setitem__(self, key, value):
+        self._merge([(self.__keytransform__(key), value)])
+
+    def __setstate__(self, state):
+        HolidayBase.__setstate__(self, state)
+        dict.__setattr__(self, "_size", dict.__len__(self))
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return HolidayBase.__getitem__(self, key)
+        key = self.__keytransform__(key)
+        value = self._lookup(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = self._lookup(self.__keytransform__(key))
+        return default if value is None else value
+
+    def __iter__(self):
+        for key, _ in self._entries():
+            yield key
+
+    def __len__(self):
+        return self._size
+
+    def keys(self):
+        return KeysView(_Entries(self))
+
+    def values(self):
+        return _EntriesValues(_Entries(self))
+
+    def items(self):
+        return _EntriesItems(_Entries(self))
+
+    def copy(self):
+        return dict(self._entries())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def pop(self, key, default=None):
+        self._on_change()
+        key = self.__keytransform__(key)
+        value = self._lookup(key)
+        if value is None:
+            if default is None:
+                raise KeyError(key)
+            return default
+        self._discard(key)
+        return value
+
+    def __delitem__(self, key):
+        self._on_change()
+        if self._lookup(key) is None:
+            raise KeyError(key)
+        self._discard(key)
+
+    def clear(self):
+        self._on_change()
+        dict.clear(self)
+        self._layers.clear()
+        self._spill.clear()
+        self._removed.clear()
+        dict.__setattr__(self, "_size", 0)
+
+    def popitem(self):
+        self._on_change()
+        item = None
+        for item in self._entries():
+            pass
+        if item is None:
+            raise KeyError("popitem(): dictionary is empty")
+        self._discard(item[0])
+        return item
+
+    def setdefault(self, key, default=None):
+        self._on_change()
+        value = self._lookup(key)
+        if value is None:
+            self._store(key, default)
+            value = default
+        return value
 
 
 def createHolidaySum(h1, h2):
-    class HolidaySum(HolidayBase):
-        def __init__(self, country, **kwargs):
-            self.country = country
-            self.holidays = []
-            if getattr(h1, "holidays", False):
-                for h in h1.holidays:
-                    self.holidays.append(h)
-            else:
-                self.holidays.append(h1)
-            if getattr(h2, "holidays", False):
-                for h in h2.holidays:
-                    self.holidays.append(h)
-            else:
-                self.holidays.append(h2)
-            HolidayBase.__init__(self, **kwargs)
+    # Kept for backwards compatibility: returns a HolidaySum subclass summing
+    # h1 and h2, as it used to. Its instances are pickled as module level
+    # HolidaySum objects, which hold the same calendars.
+    class BoundHolidaySum(HolidaySum):
+        def __init__(self, country=None, **kwargs):
+            HolidaySum.__init__(self, h1, h2, country=country, **kwargs)
+
+        def __reduce__(self):
+            return (_new_sum, ()) + HolidaySum.__reduce__(self)[2:]
+
+    return BoundHolidaySum
 
-        def _populate(self, year):
-            for h in self.holidays[::-1]:
-                h._populate(year)
-                self.update(h)
 
-    return HolidaySum
+def _new_sum():
+    return HolidaySum.__new__(HolidaySum)
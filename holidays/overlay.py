@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import hashlib
+import json
+from collections.abc import MutableMapping
+from datetime import date
+from types import MethodType
+
+from holidays.holiday_base import (
+    HolidayBase,
+    _HolidayMethods,
+    _digest,
+    _to_date,
+)
+
+
+class HolidayOverlay(_HolidayMethods, MutableMapping):
+    """Holidays added to and removed from a base calendar, which is shared
+    rather than copied.
+
+    The base (a holiday object, ideally populated and frozen, or any
+    read-only mapping of dates to names such as a ``SharedHolidays`` view)
+    is never modified: the overlay only stores its own additions and
+    removals, so many overlays of one base cost the size of their edits.
+    Names added to a base holiday are combined with it as ``HolidayBase``
+    does. Other attributes (``country``, ``prov``, ``years``...) are those
+    of the base, but not its methods, which would ignore the edits. A
+    holiday object base is read as it is, without populating the years it
+    does not hold.
+    """
+
+    def __init__(self, base):
+        self.base = base
+        self.added = {}
+        self.removed = set()
+
+    def __getattr__(self, name):
+        if name == "base":
+            raise AttributeError(name)
+        value = getattr(self.base, name)
+        # The methods of the base would answer for its holidays without
+        # the edits of the overlay
+        if isinstance(value, MethodType):
+            raise AttributeError(
+                "%r object has no attribute %r"
+                % (self.__class__.__name__, name)
+            )
+        return value
+
+    def _in_base(self, key):
+        # Looking a date up in a holiday object would populate its year
+        if isinstance(self.base, HolidayBase):
+            return self.base._lookup(key) is not None
+        return key in self.base
+
+    def _base_name(self, key):
+        if key in self.removed:
+            return None
+        if isinstance(self.base, HolidayBase):
+            return self.base._lookup(key)
+        return self.base.get(key)
+
+    def __contains__(self, key):
+        key = _to_date(key)
+        return key in self.added or self._base_name(key) is not None
+
+    def __getitem__(self, key):
+        key = _to_date(key)
+        name = self.added.get(key)
+        existing = self._base_name(key)
+        if name is None:
+            if existing is None:
+                raise KeyError(key)
+            return existing
+        if existing is None or existing.find(name) >= 0:
+            return existing or name
+        if name.find(existing) >= 0:
+            return name
+        return "%s, %s" % (name, existing)
+
+    def __setitem__(self, key, value):
+        key = _to_date(key)
+        existing = self.added.get(key)
+        if existing is not None:
+            if existing.find(value) < 0 and value.find(existing) < 0:
+                value = "%s, %s" % (value, existing)
+            else:
+                value = existing
+        self.added[key] = value
+
+    def __delitem__(self, key):
+        key = _to_date(key)
+        if key not in self:
+            raise KeyError(key)
+        self.added.pop(key, None)
+        if self._in_base(key):
+            self.removed.add(key)
+
+    def __iter__(self):
+        for key in self.base:
+            if key not in self.removed:
+                yield key
+        for key in self.added:
+            if key in self.removed or not self._in_base(key):
+                yield key
+
+    def __len__(self):
+        # The base holidays less the removed ones, plus the added dates
+        # the base does not hold
+        length = len(self.base)
+        for key in self.removed:
+            if self._in_base(key):
+                length -= 1
+        for key in self.added:
+            if key in self.removed or not self._in_base(key):
+                length += 1
+        return length
+
+    def _entries(self):
+        return self.items()
+
+    def weekend(self, key):
+        return self.base.weekend(key)
+
+    def is_weekend(self, key):
+        return self.base.is_weekend(key)
+
+    def is_workday(self, key):
+        """Return whether the date ``key`` is neither a weekend day nor a
+        holiday of the overlay."""
+        key = _to_date(key)
+        return key not in self and not self.is_weekend(key)
+
+    def count_workdays(self, start, end):
+        """Return the number of workdays between ``start`` and ``end``
+        (inclusive)."""
+        start, end = _to_date(start), _to_date(end)
+        return sum(
+            self.is_workday(date.fromordinal(ordinal))
+            for ordinal in range(start.toordinal(), end.toordinal() + 1)
+        )
+
+    def fingerprint(self, start, end):
+        """Return a stable digest of the configuration of the base and the
+        holidays of the overlay between ``start`` and ``end`` (inclusive),
+        computed like ``HolidayBase.fingerprint``."""
+        start, end = _to_date(start), _to_date(end)
+        years = {year: [] for year in range(start.year, end.year + 1)}
+        for key, value in sorted(self.items()):
+            if start <= key <= end:
+                years[key.year].append((key, value))
+        digest = hashlib.sha256(
+            json.dumps(self.base._config(), sort_keys=True).encode("utf-8")
+        )
+        for year in sorted(years):
+            digest.update(_digest(years[year]))
+        return digest.hexdigest()
+
+    def reset(self):
+        """Drop every edit, back to the base holidays."""
+        self.added.clear()
+        self.removed.clear()
+
+    def __repr__(self):
+        return "<HolidayOverlay of %r (%d added, %d removed)>" % (
+            self.base.__class__.__name__,
+            len(self.added),
+            len(self.removed),
+        )
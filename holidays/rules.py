@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+"""Declarative holiday rules.
+
+A country can describe its holidays as a list of rules instead of
+imperative ``_populate(year)`` code::
+
+    class Iceland(RuleHolidayBase):
+        RULES = (
+            Fixed("Nýársdagur", JAN, 1),
+            Easter("Annar í páskum", days=1),
+            NthWeekday("Frídagur verslunarmanna", AUG, MON, 1),
+            ...
+        )
+
+Each rule computes its dates for a whole range of years in one pass, and
+:func:`evaluate` combines them, so populating many years costs little more
+than populating one.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from functools import lru_cache
+
+from holidays.calendars import chinese
+from holidays.calendars.easter import EASTER_WESTERN, easter_range
+from holidays.holiday_base import HolidayBase
+from holidays.utils import get_gre_dates
+
+
+class Rule(object):
+    """A holiday falling on one date per year, computed by subclasses.
+
+    :param name:
+        The name of the holiday.
+
+    :param start_year:
+        The first year the holiday exists, if any.
+
+    :param end_year:
+        The last year the holiday exists, if any.
+
+    :param subdivisions:
+        The provinces or states the holiday is limited to. The default,
+        None, means the whole country.
+
+    :param observed:
+        A {weekday: days} mapping: when observed days are requested and the
+        holiday falls on one of these weekdays, ``observed_name`` is added
+        ``days`` days later (or earlier, if negative).
+
+    :param observed_name:
+        The format of the observed day name, given the holiday name.
+    """
+
+    def __init__(
+        self,
+        name,
+        start_year=None,
+        end_year=None,
+        subdivisions=None,
+        observed=None,
+        observed_name="%s (Observed)",
+    ):
+        self.name = name
+        self.start_year = start_year
+        self.end_year = end_year
+        self.subdivisions = subdivisions
+        self.observed = observed
+        self.observed_name = observed_name
+        # The years and dates of the last evaluation: calendars of every
+        # subdivision are usually built for the same years in a row.
+        self._last = ((), [])
+
+    def applies_to(self, subdivision):
+        return self.subdivisions is None or subdivision in self.subdivisions
+
+    def filter_years(self, years):
+        """Return the items of the sorted ``years`` the holiday exists in."""
+        start = 0
+        stop = len(years)
+        if self.start_year is not None:
+            start = bisect_left(years, self.start_year)
+        if self.end_year is not None:
+            stop = bisect_right(years, self.end_year)
+        if start == 0 and stop == len(years):
+            return years
+        return years[start:stop]
+
+    def dates(self, years):
+        """Return the dates of the holiday in the sorted ``years``."""
+        last_years, dates = self._last
+        if years != last_years:
+            dates = self._dates(years)
+            self._last = (years, dates)
+        return dates
+
+    def _dates(self, years):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return "<%s %r>" % (self.__class__.__name__, self.name)
+
+
+class Fixed(Rule):
+    """A holiday on the same month and day every year."""
+
+    def __init__(self, name, month, day, **kwargs):
+        super(Fixed, self).__init__(name, **kwargs)
+        self.month = month
+        self.day = day
+
+    def _dates(self, years):
+        month, day = self.month, self.day
+        return [date(year, month, day) for year in years]
+
+
+class Weekday(Rule):
+    """A holiday on the ``n``-th ``weekday`` on or after ``month`` and
+    ``day``, or on or before them when ``n`` is negative."""
+
+    def __init__(self, name, month, day, weekday, n=1, **kwargs):
+        super(Weekday, self).__init__(name, **kwargs)
+        self.month = month
+        self.day = day
+        self.weekday = weekday
+        self.n = n
+
+    def _dates(self, years):
+        month, day, weekday, n = self.month, self.day, self.weekday, self.n
+        # date.weekday() is (ordinal + 6) % 7
+        ordinals = (date(year, month, day).toordinal() for year in years)
+        if n > 0:
+            return [
+                date.fromordinal(o + (weekday - o - 6) % 7 + (n - 1) * 7)
+                for o in ordinals
+            ]
+        return [
+            date.fromordinal(o - (o + 6 - weekday) % 7 + (n + 1) * 7)
+            for o in ordinals
+        ]
+
+
+class NthWeekday(Rule):
+    """A holiday on the ``n``-th ``weekday`` of ``month``; a negative ``n``
+    counts from the end of the month, -1 being the last one."""
+
+    def __init__(self, name, month, weekday, n, **kwargs):
+        super(NthWeekday, self).__init__(name, **kwargs)
+        self.month = month
+        self.weekday = weekday
+        self.n = n
+
+    def _dates(self, years):
+        month, weekday, n = self.month, self.weekday, self.n
+        if n > 0:
+            firsts = (date(year, month, 1).toordinal() for year in years)
+            return [
+                date.fromordinal(o + (weekday - o - 6) % 7 + (n - 1) * 7)
+                for o in firsts
+            ]
+        if month == 12:
+            lasts = (date(year, 12, 31).toordinal() for year in years)
+        else:
+            lasts = (
+                date(year, month + 1, 1).toordinal() - 1 for year in years
+            )
+        return [
+            date.fromordinal(o - (o + 6 - weekday) % 7 + (n + 1) * 7)
+            for o in lasts
+        ]
+
+
+class Easter(Rule):
+    """A holiday ``days`` days after Easter Sunday (before, if negative),
+    computed with the given :mod:`dateutil.easter` method."""
+
+    def __init__(self, name, days=0, method=EASTER_WESTERN, **kwargs):
+        super(Easter, self).__init__(name, **kwargs)
+        self.days = days
+        self.method = method
+
+    def _dates(self, years):
+        dates = easter_range(years, self.method)
+        if not self.days:
+            return dates
+        delta = timedelta(days=self.days)
+        return [dt + delta for dt in dates]
+
+
+class Lunar(Rule):
+    """A holiday on a day of the Chinese lunisolar calendar; ``day`` may be
+    zero or negative to count back from the 1st of ``month``."""
+
+    def __init__(self, name, month, day, **kwargs):
+        super(Lunar, self).__init__(name, **kwargs)
+        self.month = month
+        self.day = day
+
+    def _dates(self, years):
+        return chinese.lunar_to_gregorian_range(years, self.month, self.day)
+
+
+class Hijri(Rule):
+    """A holiday on a day of the Hijri calendar, which can occur zero, one
+    or two times in a Gregorian year."""
+
+    def __init__(self, name, month, day, **kwargs):
+        super(Hijri, self).__init__(name, **kwargs)
+        self.month = month
+        self.day = day
+
+    def _dates(self, years):
+        gre_dates = get_gre_dates(years, self.month, self.day)
+        return [dt for year in years for dt in gre_dates[year]]
+
+
+def _combine(holidays, items):
+    # Assign (date, name) items like HolidayBase.__setitem__ does
+    for key, value in items:
+        existing = holidays.get(key)
+        if existing is not None:
+            if existing.find(value) < 0 and value.find(existing) < 0:
+                value = "%s, %s" % (value, existing)
+            else:
+                value = existing
+        holidays[key] = value
+
+
+def evaluate(rules, years, subdivision=None, observed=True):
+    """Return the {date: name} holidays of ``rules`` in ``years``.
+
+    Rules are evaluated in order, each one for all the years at once, so
+    the names of a date shared by several holidays come in the same order
+    as when assigning them year by year.
+    """
+    holidays = {}
+    _evaluate(holidays, rules, sorted(set(years)), subdivision, observed)
+    return holidays
+
+
+def _evaluate(holidays, rules, years, subdivision, observed):
+    # Add the holidays of rules to holidays, for the sorted years
+    if not years:
+        return
+    for rule in rules:
+        if not rule.applies_to(subdivision):
+            continue
+        rule_years = rule.filter_years(years)
+        if not rule_years:
+            continue
+        dates = rule.dates(rule_years)
+        rule_holidays = dict.fromkeys(dates, rule.name)
+        if observed and rule.observed:
+            shifts = rule.observed
+            observed_name = rule.observed_name % rule.name
+            rule_holidays = [(dt, rule.name) for dt in dates]
+            for dt in dates:
+                days = shifts.get(dt.weekday())
+                if days:
+                    rule_holidays.append(
+                        (dt + timedelta(days=days), observed_name)
+                    )
+            _combine(holidays, rule_holidays)
+        elif holidays.keys().isdisjoint(rule_holidays):
+            holidays.update(rule_holidays)
+        else:
+            _combine(holidays, rule_holidays.items())
+
+
+@lru_cache(maxsize=None)
+def _layers(rules):
+    # The rules of the whole country, and those of some subdivisions only
+    return (
+        tuple(rule for rule in rules if rule.subdivisions is None),
+        tuple(rule for rule in rules if rule.subdivisions is not None),
+    )
+
+
+@lru_cache(maxsize=256)
+def _national_holidays(rules, years, observed):
+    # Shared by the calendars of every subdivision: never modified
+    return evaluate(_layers(rules)[0], years, observed=observed)
+
+
+class RuleHolidayBase(HolidayBase):
+    """A HolidayBase populated from the ``RULES`` of its class.
+
+    The holidays of a subdivision are the rules without ``subdivisions``
+    plus the rules listing ``prov`` (or ``state``); the former are evaluated
+    once and shared by the calendars of every subdivision. Several missing
+    years are computed in one pass, so building a range of years at once,
+    as ``years=``, :meth:`fingerprint` or :func:`holidays.precompute` do,
+    is much faster than one year at a time.
+    """
+
+    RULES = ()
+
+    def _populate(self, year):
+        self._merge_rule_holidays([year])
+
+    def _populate_years(self, years):
+        # Subclasses extending _populate need it called year by year
+        if type(self)._populate is not RuleHolidayBase._populate:
+            return HolidayBase._populate_years(self, years)
+        self._merge_rule_holidays(years)
+
+    @classmethod
+    def _rule_holidays(cls, years, subdivision, observed):
+        # The shared national holidays, copied and completed only when
+        # some subdivision rules apply
+        holidays = _national_holidays(cls.RULES, years, observed)
+        rules = [
+            rule
+            for rule in _layers(cls.RULES)[1]
+            if rule.applies_to(subdivision)
+        ]
+        if rules:
+            holidays = dict(holidays)
+            _evaluate(holidays, rules, years, subdivision, observed)
+        return holidays
+
+    @classmethod
+    def _subdivision_holidays(cls, subdivisions, years, observed):
+        if cls._populate is not RuleHolidayBase._populate:
+            return super(RuleHolidayBase, cls)._subdivision_holidays(
+                subdivisions, years, observed
+            )
+        years = tuple(sorted(set(years)))
+        return [
+            cls._rule_holidays(years, subdivision, observed)
+            for subdivision in subdivisions
+        ]
+
+    def _merge_rule_holidays(self, years):
+        years = tuple(sorted(set(years)))
+        holidays = self._rule_holidays(
+            years, self.prov or self.state, self.observed
+        )
+        if dict.keys(self).isdisjoint(holidays):
+            self._on_change()
+            dict.update(self, holidays)
+        else:
+            self._merge(holidays.items())
+
+    def _add_years(self, years):
+        years = [year for year in set(years) if year not in self.years]
+        if years:
+            self._on_change()
+            self.years.update(years)
+            self._populate_years(years)
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import json
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from datetime import date
+
+from holidays.holiday_base import _to_date
+
+# Segment layout (all integers in native byte order):
+#   magic (4 bytes) | header length (uint32) | JSON header | padding |
+#   ordinals (int32, sorted per calendar) | name ids (uint32) | bitmaps
+# The JSON header holds the calendar table, the name table and the section
+# offsets, so attaching only parses a few kilobytes and maps the rest.
+_MAGIC = b"HOLS"
+_VERSION = 1
+_PREFIX = struct.Struct("=4sI")
+
+
+def _calendar_key(calendar):
+    subdivision = getattr(calendar, "prov", None) or getattr(
+        calendar, "state", None
+    )
+    if subdivision:
+        return "%s-%s" % (calendar.country, subdivision)
+    return str(getattr(calendar, "country", None))
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+class SharedHolidays(Mapping):
+    """Read-only view of one calendar published in a shared memory segment.
+
+    Only the published years are available: dates outside them are never
+    added, as if the calendar had been created with ``expand=False``.
+    """
+
+    def __init__(self, tables, index, meta):
+        self._tables = tables
+        self._start = meta["start"]
+        self._stop = meta["stop"]
+        self._bitmap = index * tables.bitmap_size
+        self.key = meta["key"]
+        self.country = meta["country"]
+        self.prov = meta["prov"]
+        self.state = meta["state"]
+        self.observed = meta["observed"]
+        self.years = set(tables.years)
+        self.expand = False
+
+    def _find(self, ordinal):
+        ordinals = self._tables.ordinals
+        i = bisect_left(ordinals, ordinal, self._start, self._stop)
+        if i < self._stop and ordinals[i] == ordinal:
+            return i
+        return -1
+
+    def __contains__(self, key):
+        ordinal = _to_date(key).toordinal()
+        tables = self._tables
+        day = ordinal - tables.first_ordinal
+        if 0 <= day < tables.days:
+            byte = tables.bitmaps[self._bitmap + (day >> 3)]
+            return bool(byte >> (day & 7) & 1)
+        return self._find(ordinal) >= 0
+
+    def __getitem__(self, key):
+        i = self._find(_to_date(key).toordinal())
+        if i < 0:
+            raise KeyError(key)
+        return self._tables.names[self._tables.name_ids[i]]
+
+    def __iter__(self):
+        ordinals = self._tables.ordinals
+        for i in range(self._start, self._stop):
+            yield date.fromordinal(ordinals[i])
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def get_list(self, key):
+        return [h for h in self.get(key, "").split(", ") if h]
+
+    def __repr__(self):
+        return "<SharedHolidays %s (%d holidays)>" % (self.key, len(self))
+
+
+class SharedCalendars(Mapping):
+    """A set of populated calendars stored in one shared memory segment.
+
+    The parent process publishes the calendars once with :meth:`publish`;
+    worker processes call :meth:`attach` with the segment name and get
+    read-only :class:`SharedHolidays` views backed by the same memory, so N
+    workers cost one copy of the holiday tables.
+    """
+
+    def __init__(self, shm, owner=False):
+        self.shm = shm
+        self.owner = owner
+        self._views = []
+        buf = self._view(shm.buf.toreadonly())
+        magic, length = _PREFIX.unpack_from(buf)
+        if magic != _MAGIC:
+            raise ValueError("%s is not a holidays segment" % shm.name)
+        start = _PREFIX.size
+        header = json.loads(bytes(buf[start : start + length]))
+        if header["version"] != _VERSION:
+            raise ValueError(
+                "Unsupported holidays segment version %s" % header["version"]
+            )
+        self.years = range(header["first_year"], header["last_year"] + 1)
+        self.first_ordinal = date(header["first_year"], 1, 1).toordinal()
+        self.days = (
+            date(header["last_year"], 12, 31).toordinal()
+            - self.first_ordinal
+            + 1
+        )
+        self.bitmap_size = (self.days + 7) >> 3
+        self.names = header["names"]
+        offsets = header["offsets"]
+        entries = header["entries"]
+        self.ordinals = self._section(buf, offsets["ordinals"], entries, "i")
+        self.name_ids = self._section(buf, offsets["name_ids"], entries, "I")
+        self.bitmaps = buf[
+            offsets["bitmaps"] : offsets["bitmaps"]
+            + self.bitmap_size * len(header["calendars"])
+        ]
+        self._views.append(self.bitmaps)
+        self._calendars = {
+            meta["key"]: SharedHolidays(self, i, meta)
+            for i, meta in enumerate(header["calendars"])
+        }
+
+    def _view(self, view):
+        self._views.append(view)
+        return view
+
+    def _section(self, buf, offset, count, typecode):
+        raw = self._view(buf[offset : offset + 4 * count])
+        return self._view(raw.cast(typecode))
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @classmethod
+    def publish(cls, calendars, years, name=None):
+        """Populate ``calendars`` for ``years`` and publish them.
+
+        ``calendars`` is either a mapping of keys to holiday objects or an
+        iterable of holiday objects, keyed as ``"US"`` or ``"US-CA"``.
+        """
+        from multiprocessing.shared_memory import SharedMemory
+
+        if not isinstance(calendars, Mapping):
+            calendars = {_calendar_key(cal): cal for cal in calendars}
+        years = sorted(set(years))
+        if not years:
+            raise ValueError("At least one year must be published.")
+        first_ordinal = date(years[0], 1, 1).toordinal()
+        days = date(years[-1], 12, 31).toordinal() - first_ordinal + 1
+        bitmap_size = (days + 7) >> 3
+
+        names = []
+        name_index = {}
+        ordinals = array("i")
+        name_ids = array("I")
+        bitmaps = bytearray(bitmap_size * len(calendars))
+        metas = []
+        for i, (key, cal) in enumerate(calendars.items()):
+            cal._add_years(years)
+            start = len(ordinals)
+            for day, value in sorted(cal._entries()):
+                if value not in name_index:
+                    name_index[value] = len(names)
+                    names.append(value)
+                ordinal = day.toordinal()
+                ordinals.append(ordinal)
+                name_ids.append(name_index[value])
+                offset = ordinal - first_ordinal
+                if 0 <= offset < days:
+                    bitmaps[i * bitmap_size + (offset >> 3)] |= 1 << (
+                        offset & 7
+                    )
+            metas.append(
+                {
+                    "key": key,
+                    "country": getattr(cal, "country", None),
+                    "prov": getattr(cal, "prov", None),
+                    "state": getattr(cal, "state", None),
+                    "observed": cal.observed,
+                    "start": start,
+                    "stop": len(ordinals),
+                }
+            )
+
+        # Section offsets depend on the header length, which in turn
+        # contains them: reserve room for the offsets before encoding.
+        header = {
+            "version": _VERSION,
+            "first_year": years[0],
+            "last_year": years[-1],
+            "calendars": metas,
+            "names": names,
+            "entries": len(ordinals),
+            "offsets": {"ordinals": 0, "name_ids": 0, "bitmaps": 0},
+        }
+        reserved = len(json.dumps(header).encode("utf-8")) + 64
+        base = _align(_PREFIX.size + reserved)
+        name_ids_offset = _align(base + 4 * len(ordinals))
+        header["offsets"] = {
+            "ordinals": base,
+            "name_ids": name_ids_offset,
+            "bitmaps": _align(name_ids_offset + 4 * len(name_ids)),
+        }
+        encoded = json.dumps(header).encode("utf-8")
+        size = header["offsets"]["bitmaps"] + len(bitmaps)
+
+        shm = SharedMemory(name=name, create=True, size=size)
+        buf = shm.buf
+        _PREFIX.pack_into(buf, 0, _MAGIC, len(encoded))
+        buf[_PREFIX.size : _PREFIX.size + len(encoded)] = encoded
+        for section, data in (
+            ("ordinals", ordinals.tobytes()),
+            ("name_ids", name_ids.tobytes()),
+            ("bitmaps", bytes(bitmaps)),
+        ):
+            offset = header["offsets"][section]
+            buf[offset : offset + len(data)] = data
+        del buf
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """Attach read-only to calendars published under ``name``."""
+        from multiprocessing.shared_memory import SharedMemory
+
+        try:
+            shm = SharedMemory(name=name, track=False)
+        except TypeError:
+            # Before Python 3.13 attaching also registers the segment with
+            # the resource tracker; workers started by the publishing
+            # process share its tracker, so the segment is not unlinked
+            # when they exit.
+            shm = SharedMemory(name=name)
+        return cls(shm)
+
+    def __getitem__(self, key):
+        return self._calendars[key]
+
+    def __iter__(self):
+        return iter(self._calendars)
+
+    def __len__(self):
+        return len(self._calendars)
+
+    def close(self):
+        """Release the views and detach from the segment."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self.shm.close()
+
+    def unlink(self):
+        """Destroy the segment; only the publishing process should call it."""
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        if self.owner:
+            self.unlink()
@@ -12,9 +12,22 @@
 #  License: MIT (see LICENSE file)
 
 import inspect
+import warnings
 import holidays
 from datetime import date
-from hijri_converter import convert
+
+from holidays.calendars import hijri
+from holidays.holiday_base import _to_date
+
+
+def _deprecated(name, replacement):
+    # Warn that name is deprecated in favour of replacement, on behalf of
+    # the caller of the deprecated function
+    warnings.warn(
+        "%s is deprecated, use %s instead." % (name, replacement),
+        DeprecationWarning,
+        stacklevel=3,
+    )
 
 
 def list_supported_countries():
@@ -47,18 +60,344 @@ def CountryHoliday(
     return country_holiday
 
 
+def _country_classes():
+    """Return {name: class} for each distinct country calendar.
+
+    Aliases (e.g. ``US`` and ``USA`` for ``UnitedStates``) and deprecated
+    names are skipped: classes generating the same country with the same
+    rules are grouped and only the most general one is kept.
+    """
+    groups = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for name, cls in inspect.getmembers(
+            holidays.countries, inspect.isclass
+        ):
+            key = (cls().country, cls._populate)
+            groups.setdefault(key, []).append((len(cls.__mro__), name, cls))
+    return dict(min(group)[1:] for group in groups.values())
+
+
+def _subdivisions(cls):
+    """Return the subdivision keyword and codes of a country class."""
+    if cls.PROVINCES:
+        return "prov", cls.PROVINCES
+    return "state", getattr(cls, "STATES", [])
+
+
+def _calendar_specs(countries, subdivisions):
+    """Return the (country, subdivision, class) of each calendar to build.
+
+    ``countries`` is a list of class names (default: every distinct
+    country) and ``subdivisions`` is ``"all"``, ``None`` or a list of codes;
+    the national (default) calendar comes first, with subdivision None.
+    """
+    if countries is None:
+        classes = _country_classes()
+    else:
+        classes = {}
+        for country in countries:
+            cls = getattr(holidays.countries, country, None)
+            if not inspect.isclass(cls):
+                raise KeyError("Country %s not available" % country)
+            classes[country] = cls
+    specs = []
+    for country, cls in classes.items():
+        codes = _subdivisions(cls)[1]
+        if subdivisions is None:
+            codes = []
+        elif subdivisions != "all":
+            codes = [code for code in subdivisions if code in codes]
+        specs.append((country, None, cls))
+        specs.extend((country, code, cls) for code in codes)
+    return specs
+
+
+def _build_calendar(cls, subdivision, years, observed):
+    kwargs = {"years": years, "observed": observed}
+    if subdivision is not None:
+        kwargs[_subdivisions(cls)[0]] = subdivision
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return cls(**kwargs)
+
+
+# Raised by the calendars for years outside their lunar or Hijri tables
+_OUT_OF_RANGE = (ValueError, OverflowError, NotImplementedError)
+
+
+def _covered_years(cls, years, observed):
+    """Return the years of ``years`` that ``cls`` can populate."""
+    covered = []
+    for year in years:
+        try:
+            _build_calendar(cls, None, year, observed)
+        except _OUT_OF_RANGE:
+            continue
+        covered.append(year)
+    return covered
+
+
+def _years(years):
+    if years is None:
+        this_year = date.today().year
+        years = range(this_year - 1, this_year + 2)
+    return sorted(set([years] if isinstance(years, int) else years))
+
+
+def warmup(countries=None, years=None, subdivisions="all", observed=True):
+    """Build, populate and freeze holiday objects up front.
+
+    Meant to be called in a parent process before forking workers: lazy
+    population would otherwise repeat the work (and write to the shared
+    pages) in every child. ``countries`` is a list of names accepted by
+    :func:`CountryHoliday` (default: every supported country), ``years``
+    defaults to the current, previous and next year and ``subdivisions``
+    is ``"all"``, ``None`` (national calendars only) or a list of codes.
+
+    Returns a dict of frozen holiday objects keyed by ``(country,
+    subdivision)``, subdivision being ``None`` for the default calendar.
+    Calling ``gc.freeze()`` afterwards also keeps the garbage collector
+    from touching the shared pages.
+    """
+    years = _years(years)
+    calendars = {}
+    for country, subdivision, cls in _calendar_specs(countries, subdivisions):
+        calendar = _build_calendar(cls, subdivision, years, observed)
+        calendars[country, subdivision] = calendar.freeze()
+    return calendars
+
+
+def _precompute_shard(shard):
+    country, subdivision, years, observed = shard
+    cls = getattr(holidays.countries, country)
+    return _build_calendar(cls, subdivision, years, observed)
+
+
+def precompute(
+    countries=None,
+    years=None,
+    subdivisions="all",
+    observed=True,
+    processes=None,
+    chunk_years=25,
+    output="calendars",
+):
+    """Populate many calendars over many years in worker processes.
+
+    The work is split into (country, subdivision, years chunk) shards run
+    by a ``ProcessPoolExecutor`` with ``processes`` workers (``processes=0``
+    runs them in this process). Shards are generated and merged in a fixed
+    order, so the result does not depend on scheduling.
+    ``countries``, ``years`` and ``subdivisions`` are as for
+    :func:`warmup`.
+
+    With ``output="calendars"`` a dict of holiday objects keyed by
+    ``(country, subdivision)`` is returned; with ``output="rows"`` a sorted
+    list of ``(country, subdivision, date, name)`` tuples ready for export.
+    """
+    if output not in ("calendars", "rows"):
+        raise ValueError("Unknown output '%s'" % output)
+    years = _years(years)
+    keys = []
+    shards = []
+    for country, subdivision, cls in _calendar_specs(countries, subdivisions):
+        for i in range(0, len(years), chunk_years):
+            chunk = years[i : i + chunk_years]
+            keys.append((country, subdivision))
+            shards.append((cls.__name__, subdivision, chunk, observed))
+
+    if processes == 0:
+        results = map(_precompute_shard, shards)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(max_workers=processes)
+        results = executor.map(_precompute_shard, shards)
+
+    calendars = {}
+    try:
+        for key, calendar in zip(keys, results):
+            if key not in calendars:
+                calendars[key] = calendar
+            else:
+                calendars[key].years.update(calendar.years)
+                calendars[key]._merge(calendar._entries())
+    finally:
+        if processes != 0:
+            executor.shutdown()
+
+    if output == "rows":
+        return sorted(
+            (
+                (country, subdivision, day, name)
+                for (country, subdivision), calendar in calendars.items()
+                for day, name in calendar._entries()
+            ),
+            key=lambda row: (row[0], row[1] or "", row[2]),
+        )
+    return calendars
+
+
+# Inverted indexes of the holidays of every country, by (year,
+# subdivisions, observed): {date: countries with a holiday on that date}
+_countries_index = {}
+
+
+def _entry_key(entry):
+    if isinstance(entry, tuple):
+        return entry[0], entry[1] or ""
+    return entry, ""
+
+
+def _countries_on_year(year, subdivisions, observed):
+    key = (year, subdivisions, observed)
+    index = _countries_index.get(key)
+    if index is None:
+        # The adjacent years are populated too, for the dates they observe
+        # in this one (e.g. New Year's Day observed on December 31st)
+        years = [year - 1, year, year + 1]
+        found = {}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for country, cls in _country_classes().items():
+                codes = [None]
+                if subdivisions:
+                    codes.extend(dict.fromkeys(_subdivisions(cls)[1]))
+                try:
+                    columns = cls._subdivision_holidays(codes, years, observed)
+                except _OUT_OF_RANGE:
+                    # Past the end of its tables a country is skipped, and
+                    # only the neighbour years it covers are populated
+                    covered = _covered_years(cls, years, observed)
+                    if year not in covered:
+                        continue
+                    columns = cls._subdivision_holidays(
+                        codes, covered, observed
+                    )
+                for code, calendar in zip(codes, columns):
+                    entry = (country, code) if subdivisions else country
+                    for day in calendar:
+                        if day.year == year:
+                            found.setdefault(day, []).append(entry)
+        index = _countries_index[key] = {
+            day: tuple(sorted(entries, key=_entry_key))
+            for day, entries in found.items()
+        }
+    return index
+
+
+def countries_on(day, subdivisions=False, observed=True):
+    """Return the countries with a holiday on ``day``.
+
+    Countries are named as in :func:`warmup`. With ``subdivisions=True``
+    the result lists ``(country, subdivision)`` pairs, subdivision being
+    ``None`` for the default calendar. The holidays of every country are
+    indexed by date once per year, so later calls are dictionary lookups.
+    Countries whose calendar does not cover the year (e.g. Korea after
+    2050) are left out.
+    """
+    day = _to_date(day)
+    return _countries_on_year(day.year, subdivisions, observed).get(day, ())
+
+
+def countries_between(start, end, subdivisions=False, observed=True):
+    """Return ``{date: countries}`` for the dates between ``start`` and
+    ``end`` (inclusive) that are a holiday somewhere, as
+    :func:`countries_on` does for a single date.
+    """
+    start, end = _to_date(start), _to_date(end)
+    result = {}
+    for year in range(start.year, end.year + 1):
+        index = _countries_on_year(year, subdivisions, observed)
+        for day in sorted(index):
+            if start <= day <= end:
+                result[day] = index[day]
+    return result
+
+
+def lookup_many(dates, countries, subdivisions=None, observed=True):
+    """Return the holiday name (or None) of each row of a table.
+
+    Row ``i`` is the date ``dates[i]`` in the country ``countries[i]`` and
+    the subdivision ``subdivisions[i]`` (``None`` for the national
+    calendar). ``countries`` and ``subdivisions`` may also be a single
+    value for all the rows. Rows are grouped by calendar: each calendar is
+    built once for all the years of its rows, looked up for all its dates
+    at once and the names are returned in the order of the rows.
+    """
+    parsed = {}
+    days = []
+    for key in dates:
+        day = parsed.get(key)
+        if day is None:
+            day = parsed[key] = _to_date(key)
+        days.append(day)
+    if countries is None or isinstance(countries, str):
+        countries = [countries] * len(days)
+    if subdivisions is None or isinstance(subdivisions, str):
+        subdivisions = [subdivisions] * len(days)
+    if not len(countries) == len(subdivisions) == len(days):
+        raise ValueError("dates, countries and subdivisions differ in length")
+
+    groups = {}
+    for i, key in enumerate(zip(countries, subdivisions)):
+        groups.setdefault(key, []).append(i)
+    names = [None] * len(days)
+    for (country, subdivision), rows in groups.items():
+        cls = getattr(holidays.countries, str(country), None)
+        if not inspect.isclass(cls):
+            raise KeyError("Country %s not available" % country)
+        # The adjacent years are populated for the dates they observe
+        years = {days[i].year for i in rows}
+        adjacent = {year + step for year in years for step in (-1, 1)}
+        try:
+            calendar = _build_calendar(
+                cls, subdivision, years | adjacent, observed
+            )
+        except _OUT_OF_RANGE:
+            # Only the adjacent years the calendar covers are added; the
+            # years of the rows themselves still raise when not covered
+            adjacent = _covered_years(cls, adjacent - years, observed)
+            calendar = _build_calendar(
+                cls, subdivision, years.union(adjacent), observed
+            )
+        found = map(calendar._lookup, [days[i] for i in rows])
+        for i, name in zip(rows, found):
+            names[i] = name
+    return names
+
+
 def get_gre_date(year, Hmonth, Hday):
     """
     Returns the gregorian dates within the gregorian year 'year'
     of all instances of islamic calendar 'Hmonth' and 'Hday'.
-    Defaults to using the hijri-converter library if it is installed
-    otherwise it uses the less-precise convertdate one (which is a
-    requirement).
+    Dates are looked up in a table of Umm al-Qura month starts built
+    with the hijri-converter library on first use.
     """
-    Hyear = convert.Gregorian(year, 1, 1).to_hijri().datetuple()[0]
-    gres = [
-        convert.Hijri(y, Hmonth, Hday).to_gregorian()
-        for y in range(Hyear - 1, Hyear + 2)
-    ]
-    gre_dates = [date(*gre.datetuple()) for gre in gres if gre.year == year]
+    Hyear = hijri.hijri_year(date(year, 1, 1))
+    gre_dates = []
+    for y in range(Hyear - 1, Hyear + 2):
+        gre_date = hijri.to_gregorian(y, Hmonth, Hday)
+        if gre_date.year == year:
+            gre_dates.append(gre_date)
+    return gre_dates
+
+
+def get_gre_dates(years, Hmonth, Hday):
+    """
+    Returns a dict mapping each gregorian year of 'years' to the list of
+    gregorian dates of islamic calendar 'Hmonth' and 'Hday' within it, as
+    get_gre_date would, converting each islamic year only once.
+    """
+    years = sorted(set(years))
+    gre_dates = {year: [] for year in years}
+    if not years:
+        return gre_dates
+    first = hijri.hijri_year(date(years[0], 1, 1))
+    last = hijri.hijri_year(date(years[-1], 1, 1))
+    for y in range(first - 1, last + 2):
+        gre_date = hijri.to_gregorian(y, Hmonth, Hday)
+        if gre_date.year in gre_dates:
+            gre_dates[gre_date.year].append(gre_date)
     return gre_dates
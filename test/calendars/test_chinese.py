@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+import unittest
+
+from datetime import date
+
+from holidays.calendars import chinese
+
+
+class TestChinese(unittest.TestCase):
+    def test_lunar_new_year(self):
+        self.assertEqual(
+            chinese.lunar_to_gregorian(1901, 1, 1), date(1901, 2, 19)
+        )
+        self.assertEqual(
+            chinese.lunar_to_gregorian(2020, 1, 1), date(2020, 1, 25)
+        )
+        self.assertEqual(
+            chinese.lunar_to_gregorian(2099, 1, 1), date(2099, 1, 21)
+        )
+
+    def test_leap_month(self):
+        # 2020 has a leap 4th month: the Tuen Ng Festival (5th month) is
+        # two lunar months after the Birthday of the Buddha.
+        self.assertEqual(chinese.get_leap_month(2020), 4)
+        self.assertEqual(chinese.get_leap_month(2021), 0x0F)
+        self.assertEqual(
+            chinese.lunar_to_gregorian(2020, 4, 8), date(2020, 4, 30)
+        )
+        self.assertEqual(
+            chinese.lunar_to_gregorian(2020, 5, 5), date(2020, 6, 25)
+        )
+        self.assertEqual(chinese.lunar_year_days(2020), 384)
+        self.assertEqual(
+            [chinese.lunar_month_days(2020, m) for m in range(1, 14)],
+            [29, 30, 30, 30, 29, 30, 29, 29, 30, 29, 30, 29, 30],
+        )
+        self.assertEqual(chinese.lunar_year_days(2021), 354)
+
+    def test_day_offsets(self):
+        self.assertEqual(
+            chinese.lunar_to_gregorian(2021, 1, 0), date(2021, 2, 11)
+        )
+        self.assertEqual(
+            chinese.lunar_to_gregorian(2021, 8, 15), date(2021, 9, 21)
+        )
+        self.assertEqual(
+            chinese.lunar_to_gregorian(2021, 10, -1), date(2021, 11, 3)
+        )
+
+    def test_range(self):
+        years = range(chinese.START_YEAR, chinese.END_YEAR + 1)
+        self.assertEqual(
+            chinese.lunar_to_gregorian_range(years, 8, 15),
+            [chinese.lunar_to_gregorian(year, 8, 15) for year in years],
+        )
+        self.assertEqual(chinese.lunar_to_gregorian_range([], 1, 1), [])
+
+    def test_out_of_range(self):
+        self.assertRaises(
+            ValueError, lambda: chinese.lunar_to_gregorian(1900, 1, 1)
+        )
+        self.assertRaises(
+            ValueError, lambda: chinese.lunar_to_gregorian(2100, 1, 1)
+        )
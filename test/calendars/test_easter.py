@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+import unittest
+
+from datetime import date
+
+from dateutil import easter as dateutil_easter
+
+from holidays.calendars import easter
+
+
+class TestEaster(unittest.TestCase):
+    def test_easter(self):
+        self.assertEqual(easter.easter(2021), date(2021, 4, 4))
+        self.assertEqual(
+            easter.easter(2021, easter.EASTER_ORTHODOX), date(2021, 5, 2)
+        )
+        self.assertEqual(
+            easter.easter(2021, easter.EASTER_JULIAN), date(2021, 4, 19)
+        )
+        self.assertIs(easter.easter(2021), easter.easter(2021))
+        self.assertRaises(ValueError, lambda: easter.easter(2021, 4))
+
+    def test_easter_range(self):
+        years = range(1583, 2400)
+        for method in (
+            easter.EASTER_WESTERN,
+            easter.EASTER_ORTHODOX,
+            easter.EASTER_JULIAN,
+        ):
+            self.assertEqual(
+                easter.easter_range(years, method),
+                [dateutil_easter.easter(year, method) for year in years],
+            )
+        self.assertEqual(easter.easter_range([]), [])
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+import unittest
+
+from convertdate import gregorian
+from convertdate import hebrew as convertdate_hebrew
+from datetime import date
+
+from holidays.calendars import hebrew
+
+
+class TestHebrew(unittest.TestCase):
+    def test_to_gregorian(self):
+        self.assertEqual(
+            hebrew.to_gregorian(5781, hebrew.TISHRI, 1), date(2020, 9, 19)
+        )
+        self.assertEqual(
+            hebrew.to_gregorian(5781, hebrew.NISAN, 15), date(2021, 3, 28)
+        )
+        self.assertEqual(
+            hebrew.to_gregorian(5782, hebrew.VEADAR, 14), date(2022, 3, 17)
+        )
+        self.assertRaises(ValueError, lambda: hebrew.to_gregorian(5782, 14, 1))
+
+    def test_year_length(self):
+        self.assertEqual(hebrew.year_length(5781), 353)
+        self.assertEqual(hebrew.year_length(5782), 384)
+        self.assertTrue(hebrew.leap(5782))
+        self.assertFalse(hebrew.leap(5781))
+
+    def test_to_gregorian_year(self):
+        # Kislev 25 of the Hebrew year starting in the Gregorian year
+        self.assertEqual(
+            hebrew.to_gregorian_year(2020, hebrew.KISLEV, 25),
+            date(2020, 12, 11),
+        )
+        self.assertEqual(
+            hebrew.to_gregorian_year(2020, hebrew.NISAN, 15),
+            date(2020, 4, 9),
+        )
+
+    def test_convertdate(self):
+        for year in range(1800, 2200):
+            for month, day in (
+                (hebrew.NISAN, 15),
+                (hebrew.IYYAR, 3),
+                (hebrew.SIVAN, 6),
+                (hebrew.TISHRI, 1),
+                (hebrew.KISLEV, 25),
+                (hebrew.ADAR, 14),
+                (hebrew.VEADAR, 14),
+            ):
+                jd = convertdate_hebrew.to_jd_gregorianyear(year, month, day)
+                self.assertEqual(
+                    hebrew.to_gregorian_year(year, month, day),
+                    date(*gregorian.from_jd(jd)),
+                )
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+import unittest
+
+from datetime import date
+
+from holidays.calendars import hijri
+from holidays.utils import get_gre_date, get_gre_dates
+
+
+class TestHijri(unittest.TestCase):
+    def test_to_gregorian(self):
+        self.assertEqual(hijri.to_gregorian(1441, 10, 1), date(2020, 5, 24))
+        self.assertEqual(hijri.to_gregorian(1441, 12, 10), date(2020, 7, 31))
+        self.assertEqual(hijri.to_gregorian(1343, 1, 1), date(1924, 8, 1))
+        self.assertEqual(hijri.to_gregorian(1500, 12, 30), date(2077, 11, 16))
+        self.assertRaises(ValueError, lambda: hijri.to_gregorian(1441, 13, 1))
+        # Dhu al-Hijjah 1441 only has 29 days
+        self.assertRaises(ValueError, lambda: hijri.to_gregorian(1441, 12, 30))
+        self.assertRaises(
+            OverflowError, lambda: hijri.to_gregorian(1342, 1, 1)
+        )
+        self.assertRaises(
+            OverflowError, lambda: hijri.to_gregorian(1501, 1, 1)
+        )
+
+    def test_hijri_year(self):
+        self.assertEqual(hijri.hijri_year(date(2020, 1, 1)), 1441)
+        self.assertEqual(hijri.hijri_year(date(2020, 8, 20)), 1442)
+        self.assertRaises(
+            OverflowError, lambda: hijri.hijri_year(date(1924, 7, 31))
+        )
+        self.assertRaises(
+            OverflowError, lambda: hijri.hijri_year(date(2077, 11, 17))
+        )
+
+    def test_get_gre_date(self):
+        # Eid al-Fitr twice in 2000
+        self.assertEqual(
+            get_gre_date(2000, 10, 1), [date(2000, 1, 8), date(2000, 12, 27)]
+        )
+        self.assertEqual(get_gre_date(2020, 12, 10), [date(2020, 7, 31)])
+        self.assertEqual(get_gre_date(2020, 1, 1), [date(2020, 8, 20)])
+
+    def test_get_gre_dates(self):
+        years = range(1990, 2031)
+        gre_dates = get_gre_dates(years, 10, 1)
+        self.assertEqual(list(gre_dates), list(years))
+        for year in years:
+            self.assertEqual(gre_dates[year], get_gre_date(year, 10, 1))
+        self.assertEqual(get_gre_dates([], 10, 1), {})
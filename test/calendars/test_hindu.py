@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+
+from datetime import date
+
+from holidays.calendars import hindu
+
+
+class TestHindu(unittest.TestCase):
+    def test_diwali(self):
+        for year, month, day in (
+            (2017, 10, 19),
+            (2018, 11, 7),
+            (2019, 10, 27),
+            (2020, 11, 14),
+            (2021, 11, 4),
+            (2022, 10, 24),
+            (2023, 11, 12),
+        ):
+            self.assertEqual(hindu.diwali(year), date(year, month, day))
+
+    def test_deepavali(self):
+        # Singapore's announced dates
+        for year, month, day in (
+            (2016, 10, 29),
+            (2017, 10, 18),
+            (2018, 11, 6),
+            (2019, 10, 27),
+            (2020, 11, 14),
+            (2021, 11, 4),
+        ):
+            self.assertEqual(hindu.deepavali(year), date(year, month, day))
+
+    def test_holi(self):
+        for year, month, day in (
+            (2019, 3, 21),
+            (2020, 3, 10),
+            (2021, 3, 29),
+            (2022, 3, 18),
+            (2023, 3, 8),
+            (2024, 3, 25),
+        ):
+            self.assertEqual(hindu.holi(year), date(year, month, day))
+
+    def test_buddha_purnima(self):
+        for year, month, day in (
+            (2018, 4, 30),
+            (2019, 5, 18),
+            (2022, 5, 16),
+            (2023, 5, 5),
+            (2024, 5, 23),
+        ):
+            self.assertEqual(
+                hindu.buddha_purnima(year), date(year, month, day)
+            )
+
+    def test_range(self):
+        self.assertEqual(hindu.diwali(hindu.START_YEAR), date(1901, 11, 10))
+        self.assertEqual(hindu.holi(hindu.END_YEAR), date(2100, 3, 26))
+        self.assertRaises(ValueError, lambda: hindu.holi(1900))
+        self.assertRaises(ValueError, lambda: hindu.diwali(2101))
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from holidays.calendars import korean
+
+
+class TestKorean(unittest.TestCase):
+    def test_lunar_to_gregorian(self):
+        self.assertEqual(
+            korean.lunar_to_gregorian(2020, 1, 1), date(2020, 1, 25)
+        )
+        self.assertEqual(
+            korean.lunar_to_gregorian(2020, 4, 8), date(2020, 4, 30)
+        )
+        self.assertEqual(
+            korean.lunar_to_gregorian(2020, 8, 15), date(2020, 10, 1)
+        )
+        self.assertEqual(
+            korean.lunar_to_gregorian(2019, 3, 10), date(2019, 4, 14)
+        )
+
+    def test_range(self):
+        years = range(1950, 2050)
+        self.assertEqual(
+            korean.lunar_to_gregorian_range(years, 8, 15),
+            [korean.lunar_to_gregorian(year, 8, 15) for year in years],
+        )
+
+    def test_concurrent(self):
+        years = list(range(1900, 2050)) * 4
+        expected = [korean.lunar_to_gregorian(year, 4, 8) for year in years]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda y: korean.lunar_to_gregorian(y, 4, 8), years
+                )
+            )
+        self.assertEqual(results, expected)
+
+    def test_table(self):
+        from korean_lunar_calendar import KoreanLunarCalendar
+
+        cal = KoreanLunarCalendar()
+        for year in (korean.START_YEAR, 1583, 1900, 1984, korean.END_YEAR):
+            for month in range(1, 12):
+                cal.setLunarDate(year, month, 1, False)
+                self.assertEqual(
+                    korean.lunar_to_gregorian(year, month, 1),
+                    date(cal.solarYear, cal.solarMonth, cal.solarDay),
+                )
+        self.assertEqual(korean.START_YEAR, 1000)
+        self.assertIn((korean.END_YEAR, 11), korean._month_starts)
+        self.assertNotIn((korean.END_YEAR, 12), korean._month_starts)
+
+    def test_out_of_range(self):
+        self.assertEqual(korean.END_YEAR, 2050)
+        self.assertRaises(
+            ValueError, lambda: korean.lunar_to_gregorian(2051, 1, 1)
+        )
+        self.assertRaises(
+            ValueError, lambda: korean.lunar_to_gregorian(999, 1, 1)
+        )
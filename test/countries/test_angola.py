@@ -46,3 +46,13 @@ class TestAngola(unittest.TestCase):
         self.assertNotIn("2016-12-28", self.holidays)
         self.assertNotIn("2015-03-02", self.holidays)
         self.assertNotIn("2018-03-23", self.holidays)
+
+    def test_observed_rules_of_later_years(self):
+        # Days off only exist since 2018, even when a later year has been
+        # populated first
+        self.assertIn("2019-04-05", self.holidays)
+        self.assertNotIn("2016-02-05", self.holidays)
+        self.assertEqual(
+            dict(holidays.AO(years=range(2010, 2020))),
+            dict(sum(holidays.AO(years=year) for year in range(2010, 2020))),
+        )
@@ -28,5 +28,6 @@ class TestBangladesh(unittest.TestCase):
         self.assertIn(date(2020, 3, 26), self.holidays)
         self.assertIn(date(2020, 4, 14), self.holidays)
         self.assertIn(date(2020, 5, 1), self.holidays)
+        self.assertEqual(self.holidays[date(2020, 5, 7)], "Buddha Purnima")
         self.assertIn(date(2020, 8, 15), self.holidays)
         self.assertIn(date(2020, 12, 16), self.holidays)
@@ -401,3 +401,16 @@ class TestHongKong(unittest.TestCase):
         name = "The second weekday after Christmas Day"
         self.assertEqual(self.holidays[date(2011, 12, 27)], name)
         self.assertEqual(self.holidays[date(2016, 12, 27)], name)
+
+    def test_deprecated_lunar_calendar(self):
+        calendar = holidays.HK()
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(calendar.get_leap_month(2020), 4)
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(calendar.lunar_month_days(2020, 5), 29)
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(calendar.lunar_year_days(2020), 384)
+        self.assertEqual(
+            (calendar.START_YEAR, calendar.END_YEAR), (1901, 2099)
+        )
+        self.assertRaises(ValueError, lambda: holidays.HK(years=2100))
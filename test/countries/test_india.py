@@ -30,6 +30,8 @@ class TestIND(unittest.TestCase):
         self.assertIn(date(2018, 8, 15), self.holidays)
         self.assertIn(date(2018, 10, 2), self.holidays)
         self.assertIn(date(2018, 12, 25), self.holidays)
+        self.assertEqual(self.holidays[date(2018, 3, 2)], "Holi")
+        self.assertEqual(self.holidays[date(2018, 11, 7)], "Diwali")
 
         gj_holidays = holidays.IND(prov="GJ")
         as_holidays = holidays.IND(prov="AS")
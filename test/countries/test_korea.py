@@ -385,3 +385,12 @@ class TestKorea(unittest.TestCase):
         self.holidays = holidays.KR(years=range(2006, 2021))
         for year in range(2006, 2021):
             self.assertIn(self.holidays[date(year, 1, 1)], "New Year's Day")
+
+    def test_out_of_lunar_range(self):
+        # The lunar table ends in 2050: later years only lack the lunar
+        # holidays
+        self.assertIn(date(2051, 1, 1), self.holidays)
+        self.assertEqual(self.holidays[date(2051, 12, 25)], "Christmas Day")
+        self.assertEqual(self.holidays.get_named("Lunar New Year"), [])
+        self.assertEqual(self.holidays.get_named("Chuseok"), [])
+        self.assertEqual(len(holidays.KR(years=2051)), 10)
@@ -108,6 +108,24 @@ class TestSaudiArabia(unittest.TestCase):
 
                 # self.assertIn(date(2017, 8, 6), self.holidays)
 
+    def test_weekend(self):
+        self.assertEqual(self.holidays.weekend(date(2013, 6, 27)), (3, 4))
+        self.assertEqual(self.holidays.weekend(date(2013, 6, 28)), (4, 5))
+        self.assertTrue(self.holidays.is_weekend(date(2012, 8, 16)))
+        self.assertFalse(self.holidays.is_weekend(date(2012, 8, 18)))
+        self.assertTrue(self.holidays.is_weekend(date(2021, 5, 15)))
+
+    def test_hijri_based_observed_before_2013(self):
+        if sys.version_info >= (3, 6):
+            import importlib.util
+
+            if importlib.util.find_spec("hijri_converter"):
+                # Eid al-Fitr 2012 (Saturday to Tuesday) did not fall on
+                # the THU, FRI weekend of the time
+                self.holidays = holidays.SA(years=[2012])
+                self.assertIn(date(2012, 8, 21), self.holidays)
+                self.assertNotIn(date(2012, 8, 22), self.holidays)
+
     def test_hijri_based_not_observed(self):
 
         if sys.version_info >= (3, 6):
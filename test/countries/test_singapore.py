@@ -81,6 +81,8 @@ class TestSingapore(unittest.TestCase):
         # holidays estimated using lunar calendar
         self.assertIn(date(2021, 5, 26), self.holidays)
         self.assertIn(date(2021, 11, 4), self.holidays)
+        self.assertIn(date(2022, 10, 24), self.holidays)
+        self.assertIn(date(2023, 11, 12), self.holidays)
         # holidays estimated using library hijri-converter
         if sys.version_info >= (3, 6):
             import importlib.util
@@ -91,3 +93,16 @@ class TestSingapore(unittest.TestCase):
                 # 2021
                 self.assertIn(date(2021, 5, 13), self.holidays)
                 self.assertIn(date(2021, 7, 20), self.holidays)
+
+    def test_deprecated_lunar_calendar(self):
+        calendar = holidays.SG()
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(calendar.get_leap_month(2020), 4)
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(calendar.lunar_month_days(2020, 5), 29)
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(calendar.lunar_year_days(2020), 384)
+        self.assertEqual(
+            (calendar.START_YEAR, calendar.END_YEAR), (1901, 2099)
+        )
+        self.assertRaises(ValueError, lambda: holidays.SG(years=2100))
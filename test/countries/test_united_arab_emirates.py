@@ -29,6 +29,20 @@ class UnitedArabEmirates(unittest.TestCase):
         self.assertIn(date(2020, 12, 2), self.holidays)
         self.assertIn(date(2020, 12, 3), self.holidays)
 
+    def test_weekend(self):
+        # THU, FRI until August 2006, then FRI, SAT until 2021
+        self.assertTrue(self.holidays.is_weekend(date(2006, 8, 31)))
+        self.assertFalse(self.holidays.is_weekend(date(2006, 9, 7)))
+        self.assertTrue(self.holidays.is_weekend(date(2006, 9, 2)))
+        self.assertTrue(self.holidays.is_weekend(date(2021, 12, 31)))
+        # SAT, SUN since 2022
+        self.assertTrue(self.holidays.is_weekend(date(2022, 1, 2)))
+        self.assertFalse(self.holidays.is_weekend(date(2022, 1, 7)))
+        self.assertEqual(
+            self.holidays.count_workdays(date(2021, 12, 26), date(2022, 1, 8)),
+            10,
+        )
+
     def test_commemoration_day_since_2015(self):
         # Before 2009 Jan 25th wasn't celebrated
         self.holidays = holidays.AE(years=[2015])
@@ -108,3 +108,12 @@ class TestVietnam(unittest.TestCase):
             self.assertIn(
                 "International New Year's Day", self.holidays[date(year, 1, 1)]
             )
+
+    def test_out_of_lunar_range(self):
+        # The lunar table ends in 2050: later years only lack the lunar
+        # holidays
+        self.holidays = holidays.VN(years=2051)
+        self.assertIn(date(2051, 1, 1), self.holidays)
+        self.assertIn(date(2051, 9, 2), self.holidays)
+        self.assertEqual(self.holidays.get_named("Tet"), [])
+        self.assertEqual(self.holidays.get_named("Hung Kings"), [])
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+
+import holidays
+from holidays import announced
+
+
+class TestAnnounced(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.environ = os.environ.get(announced.DATA_PATH_ENV)
+        announced.clear_cache()
+
+    def tearDown(self):
+        if self.environ is None:
+            os.environ.pop(announced.DATA_PATH_ENV, None)
+        else:
+            os.environ[announced.DATA_PATH_ENV] = self.environ
+        announced.clear_cache()
+        shutil.rmtree(self.directory)
+
+    def write(self, name, data):
+        with open(os.path.join(self.directory, name + ".json"), "w") as f:
+            json.dump(data, f)
+        os.environ[announced.DATA_PATH_ENV] = self.directory
+        announced.clear_cache()
+
+    def test_announced_dates(self):
+        self.assertEqual(
+            announced.announced_dates("singapore", "deepavali", 2021),
+            (date(2021, 11, 4),),
+        )
+        self.assertEqual(
+            announced.announced_dates("singapore", "deepavali", 1990), ()
+        )
+        self.assertEqual(
+            announced.announced_dates("singapore", "unknown", 2021), ()
+        )
+        self.assertEqual(announced.load("unknown"), {})
+
+    def test_parsed_once(self):
+        tables = announced.load("singapore")
+        self.assertIs(announced.load("singapore"), tables)
+        announced.clear_cache()
+        self.assertIsNot(announced.load("singapore"), tables)
+
+    def test_local_file(self):
+        self.write(
+            "singapore",
+            {
+                "version": 1,
+                "country": "SG",
+                "holidays": {
+                    "deepavali": {"2022": ["10-24"]},
+                    "polling_day": {"2025": ["05-03"]},
+                },
+            },
+        )
+        self.assertEqual(
+            announced.announced_dates("singapore", "deepavali", 2022),
+            (date(2022, 10, 24),),
+        )
+        # Packaged dates are kept
+        self.assertEqual(
+            announced.announced_dates("singapore", "deepavali", 2021),
+            (date(2021, 11, 4),),
+        )
+        sg = holidays.SG(years=[2022, 2025])
+        self.assertEqual(sg[date(2022, 10, 24)], "Deepavali")
+        self.assertEqual(sg[date(2025, 5, 3)], "Polling Day")
+
+    def test_version(self):
+        self.write("singapore", {"version": 2, "holidays": {}})
+        self.assertRaises(ValueError, lambda: announced.load("singapore"))
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from datetime import date, timedelta
+
+import holidays
+from holidays.bitmatrix import HolidayMatrix
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestHolidayMatrix(unittest.TestCase):
+    def setUp(self):
+        self.matrix = holidays.matrix(
+            ["US", "DE"], "2019-12-15", "2021-01-10", subdivisions=["CA"]
+        )
+
+    def test_labels(self):
+        self.assertEqual(
+            self.matrix.labels, [("US", None), ("US", "CA"), ("DE", None)]
+        )
+        self.assertEqual(self.matrix.days, 393)
+        self.assertEqual(self.matrix.shape, (3, 50))
+        self.assertEqual(len(self.matrix.data), 150)
+
+    def test_bits(self):
+        for country, subdivision in self.matrix.labels:
+            kwargs = {"state": subdivision} if subdivision else {}
+            calendar = getattr(holidays, country)(**kwargs)
+            day = self.matrix.start
+            while day <= self.matrix.end:
+                self.assertEqual(
+                    self.matrix.is_holiday(country, day, subdivision),
+                    day in calendar,
+                )
+                day += timedelta(days=1)
+        # Day 0 is the least significant bit of the first byte
+        self.assertFalse(self.matrix.data[0] & 1)
+        self.assertTrue(self.matrix.is_holiday("US", "2019-12-25"))
+        self.assertTrue(self.matrix.is_holiday("US", "2020-03-31", "CA"))
+        self.assertFalse(self.matrix.is_holiday("US", "2020-03-31"))
+        self.assertRaises(KeyError, self.matrix.is_holiday, "US", "2021-02-01")
+        self.assertRaises(KeyError, self.matrix.is_holiday, "MX", "2020-01-01")
+        self.assertRaises(
+            ValueError, holidays.matrix, ["US"], "2021-01-02", "2021-01-01"
+        )
+
+    def test_save_load(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        path = os.path.join(path, "holidays.npy")
+        self.matrix.save(path)
+        with open(path, "rb") as f:
+            prefix = f.read(10)
+        self.assertEqual(prefix[:8], b"\x93NUMPY\x01\x00")
+        # The data starts on a 64-byte boundary
+        self.assertEqual((os.path.getsize(path) - 150) % 64, 0)
+        with HolidayMatrix.load(path) as loaded:
+            self.assertEqual(loaded.labels, self.matrix.labels)
+            self.assertEqual(loaded.start, date(2019, 12, 15))
+            self.assertEqual(loaded.end, date(2021, 1, 10))
+            self.assertEqual(bytes(loaded.data), bytes(self.matrix.data))
+            self.assertTrue(loaded.is_holiday("DE", "2020-10-03"))
+        # Leaving the block unmaps the file
+        self.assertRaises(ValueError, bytes, loaded.data)
+        loaded.close()
+        with open(path, "r+b") as f:
+            f.write(b"NOTNPY")
+        self.assertRaises(ValueError, HolidayMatrix.load, path)
+
+    def test_supported_range(self):
+        # 2099 is the last year of the Hong Kong lunar table: the following
+        # year is not populated for the dates it observes
+        matrix = holidays.matrix(["HK", "KR"], "2099-01-01", "2099-12-31")
+        self.assertTrue(matrix.is_holiday("HK", "2099-12-25"))
+        self.assertTrue(matrix.is_holiday("KR", "2099-12-25"))
+        self.assertRaises(
+            ValueError, holidays.matrix, ["HK"], "2100-01-01", "2100-12-31"
+        )
+
+    @unittest.skipIf(numpy is None, "requires numpy")
+    def test_numpy(self):
+        array = self.matrix.to_numpy()
+        self.assertEqual(array.dtype, numpy.uint8)
+        self.assertEqual(array.shape, (3, 50))
+        bits = numpy.unpackbits(array, axis=1, bitorder="little")
+        day = (date(2020, 7, 3) - self.matrix.start).days
+        self.assertEqual(list(bits[:, day]), [1, 1, 0])
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        path = os.path.join(path, "holidays.npy")
+        self.matrix.save(path)
+        self.assertTrue((numpy.load(path, mmap_mode="r") == array).all())
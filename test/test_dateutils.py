@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+import unittest
+
+from datetime import date, timedelta
+
+from dateutil.relativedelta import relativedelta as rd, weekday
+
+from holidays.constants import JAN, FEB, MAR, MAY, NOV, DEC, MON, THU, FRI
+from holidays.dateutils import (
+    add_days,
+    last_weekday,
+    nth_weekday,
+    weekday_on_or_after,
+    weekday_on_or_before,
+)
+
+
+class TestDateUtils(unittest.TestCase):
+    def test_add_days(self):
+        self.assertEqual(add_days(date(2020, 12, 31), 1), date(2021, 1, 1))
+        self.assertEqual(add_days(date(2020, 3, 1), -1), date(2020, 2, 29))
+        self.assertEqual(add_days(date(2020, 3, 1), 0), date(2020, 3, 1))
+
+    def test_nth_weekday(self):
+        # Martin Luther King Jr. Day, Thanksgiving
+        self.assertEqual(nth_weekday(2021, JAN, MON, 3), date(2021, 1, 18))
+        self.assertEqual(nth_weekday(2021, NOV, THU, 4), date(2021, 11, 25))
+        self.assertEqual(nth_weekday(2021, MAR, MON, 1), date(2021, 3, 1))
+        self.assertEqual(nth_weekday(2021, MAY, MON, -1), date(2021, 5, 31))
+        self.assertEqual(nth_weekday(2021, DEC, FRI, -2), date(2021, 12, 24))
+
+    def test_last_weekday(self):
+        self.assertEqual(last_weekday(2021, MAY, MON), date(2021, 5, 31))
+        self.assertEqual(last_weekday(2020, FEB, FRI), date(2020, 2, 28))
+        self.assertEqual(last_weekday(2021, DEC, FRI), date(2021, 12, 31))
+
+    def test_relativedelta(self):
+        dt = date(2019, 12, 20)
+        for _ in range(60):
+            for wd in range(7):
+                for n in range(1, 6):
+                    self.assertEqual(
+                        weekday_on_or_after(dt, wd, n),
+                        dt + rd(weekday=weekday(wd, n)),
+                    )
+                    self.assertEqual(
+                        weekday_on_or_before(dt, wd, n),
+                        dt + rd(weekday=weekday(wd, -n)),
+                    )
+            dt += timedelta(days=1)
@@ -13,6 +13,8 @@
 
 import pickle
 import unittest
+from collections import OrderedDict
+from unittest import mock
 
 from datetime import date, datetime, timedelta
 from dateutil.relativedelta import relativedelta, MO
@@ -307,9 +309,82 @@ class TestBasics(unittest.TestCase):
         self.assertIn("AR", holidays.list_supported_countries())
         self.assertIn("ZA", holidays.list_supported_countries())
 
+    def test_create_holiday_sum(self):
+        ca = holidays.CA(years=[2014])
+        us = holidays.US(years=[2014])
+        cls = holidays.createHolidaySum(ca, us)
+        self.assertTrue(issubclass(cls, holidays.HolidaySum))
+        na = cls(country=["CA", "US"], years=[2014])
+        self.assertEqual(dict(na), dict(ca + us))
+        self.assertEqual(na.holidays, [ca, us])
+
+        class Sum(cls):
+            def _populate(self, year):
+                super(Sum, self)._populate(year)
+                self[date(year, 1, 2)] = "Extra Day"
+
+        na = Sum(years=[2014])
+        self.assertIsInstance(na, holidays.HolidaySum)
+        self.assertEqual(na[date(2014, 1, 2)], "Extra Day")
+        self.assertEqual(na[date(2014, 7, 4)], "Independence Day")
+        loaded = pickle.loads(pickle.dumps(na))
+        self.assertIs(type(loaded), holidays.HolidaySum)
+        self.assertEqual(dict(loaded), dict(na))
+
     def test_radd(self):
         self.assertRaises(TypeError, lambda: 1 + holidays.US())
 
+    def test_union(self):
+        ca = holidays.CA(years=[2014])
+        us = holidays.US(years=[2014, 2015])
+        mx = holidays.MX()
+        na = holidays.union(ca, us, mx)
+        self.assertIsInstance(na, holidays.HolidaySum)
+        self.assertEqual(na, ca + us + mx)
+        self.assertEqual(na.holidays, [ca, us, mx])
+        self.assertEqual(na.country, ["CA", "US", "MX"])
+        self.assertEqual(na.prov, "ON")
+        self.assertEqual(na.years, {2014, 2015})
+        self.assertEqual(
+            na[date(2014, 12, 25)], "Christmas Day, Navidad [Christmas]"
+        )
+        self.assertIn("2015-07-01", na)
+        # Nested sums are flattened
+        self.assertEqual(len(holidays.union(ca + us, mx + ca).holidays), 4)
+        self.assertEqual(len((ca + us + mx).holidays), 3)
+        self.assertEqual(holidays.union(ca, ca).country, "CA")
+        self.assertRaises(TypeError, holidays.union, ca, {})
+
+    def test_union_members_unchanged(self):
+        us = holidays.US(years=[2020])
+        ca = holidays.CA()
+        na = holidays.union(us, ca)
+        self.assertIn("2021-07-04", na)
+        self.assertIn("2021-07-01", na)
+        self.assertEqual(us.years, {2020})
+        self.assertEqual(len(ca), 0)
+        # Each year of a member is populated once for all the sums
+        calls = []
+
+        class Country(holidays.HolidayBase):
+            def _populate(self, year):
+                calls.append(year)
+                self[date(year, 1, 1)] = "New Year's Day"
+
+        country = Country()
+        na = holidays.union(country, us)
+        self.assertIn("2019-01-01", na)
+        self.assertIn("2019-01-01", ca + country)
+        na.observed = True
+        self.assertEqual(calls, [2020, 2019])
+        self.assertEqual(len(country), 0)
+        # Dates observed in years a member does not hold are kept
+        gb = holidays.GB(years=[2000])
+        self.assertEqual(
+            holidays.union(gb, us).get_list(date(1999, 12, 31)),
+            ["Millennium Celebrations", "New Year's Day (Observed)"],
+        )
+
     def test_inheritance(self):
         class NoColumbusHolidays(holidays.US):
             def _populate(self, year):
@@ -351,6 +426,94 @@ class TestBasics(unittest.TestCase):
 
         self.assertIn(date(2014, 12, 31), Dec31Holiday())
 
+    def test_freeze(self):
+        us = holidays.US(years=[2014]).freeze()
+        self.assertFalse(us.expand)
+        self.assertIn(date(2014, 1, 1), us)
+        self.assertNotIn(date(2015, 1, 1), us)
+        self.assertEqual(us.years, {2014})
+        self.assertEqual(us.get_named("Independence"), [date(2014, 7, 4)])
+        with self.assertRaises(TypeError):
+            us[date(2014, 1, 3)] = "Fake Holiday"
+        self.assertRaises(TypeError, lambda: us.append(date(2014, 1, 3)))
+        self.assertRaises(TypeError, lambda: us.pop(date(2014, 1, 1)))
+        self.assertRaises(TypeError, lambda: us.pop_named("Christmas"))
+        self.assertRaises(TypeError, us.clear)
+        self.assertRaises(TypeError, us.popitem)
+        self.assertRaises(TypeError, lambda: us.setdefault(date(2014, 1, 3)))
+        with self.assertRaises(TypeError):
+            us |= {date(2014, 1, 3): "Fake Holiday"}
+        with self.assertRaises(TypeError):
+            del us[date(2014, 1, 1)]
+        with self.assertRaises(TypeError):
+            us.observed = False
+        with self.assertRaises(TypeError):
+            us.expand = True
+        self.assertRaises(TypeError, lambda: us._add_years([2015]))
+        self.assertEqual(len(us), 10)
+        loaded_holidays = pickle.loads(pickle.dumps(us))
+        self.assertRaises(TypeError, loaded_holidays.clear)
+
+    def test_ior(self):
+        us = holidays.US(years=2014)
+        self.assertTrue(us.is_workday("2014-01-03"))
+        us |= {date(2014, 1, 3): "Fake Holiday", "2014-01-01": "Fake"}
+        self.assertEqual(us[date(2014, 1, 3)], "Fake Holiday")
+        self.assertEqual(us[date(2014, 1, 1)], "Fake, New Year's Day")
+        self.assertFalse(us.is_workday("2014-01-03"))
+        us |= [(date(2014, 1, 6), "Other Holiday")]
+        self.assertEqual(us[date(2014, 1, 6)], "Other Holiday")
+
+    def test_fingerprint(self):
+        fingerprint = self.holidays.fingerprint("2014-01-01", "2015-12-31")
+        self.assertEqual(len(fingerprint), 64)
+        self.assertEqual(self.holidays.years, {2014, 2015})
+        self.assertEqual(
+            holidays.US(years=[2015, 2014]).fingerprint(
+                date(2014, 1, 1), date(2015, 12, 31)
+            ),
+            fingerprint,
+        )
+        self.assertEqual(
+            pickle.loads(pickle.dumps(self.holidays)).fingerprint(
+                "2014-01-01", "2015-12-31"
+            ),
+            fingerprint,
+        )
+        # Configuration is part of the digest
+        self.assertNotEqual(
+            holidays.US(state="CA").fingerprint("2014-01-01", "2015-12-31"),
+            fingerprint,
+        )
+        self.assertNotEqual(
+            holidays.US(observed=False).fingerprint(
+                "2014-03-01", "2014-04-01"
+            ),
+            holidays.US().fingerprint("2014-03-01", "2014-04-01"),
+        )
+        # Partial years only include the holidays in range
+        us = holidays.US()
+        self.assertEqual(
+            us.fingerprint("2014-01-02", "2014-01-19"),
+            us.fingerprint("2014-01-03", "2014-01-18"),
+        )
+        self.assertNotEqual(
+            us.fingerprint("2014-01-02", "2014-01-20"),
+            us.fingerprint("2014-01-02", "2014-01-19"),
+        )
+        # Changes invalidate the cached per-year digests
+        self.holidays[date(2015, 3, 3)] = "Fake Holiday"
+        changed = self.holidays.fingerprint("2014-01-01", "2015-12-31")
+        self.assertNotEqual(changed, fingerprint)
+        self.assertEqual(
+            self.holidays.fingerprint("2014-01-01", "2014-12-31"),
+            holidays.US().fingerprint("2014-01-01", "2014-12-31"),
+        )
+        self.holidays.pop(date(2015, 3, 3))
+        self.assertEqual(
+            self.holidays.fingerprint("2014-01-01", "2015-12-31"), fingerprint
+        )
+
     def test_get_named(self):
         us = holidays.UnitedStates(years=[2020])
         # check for "New Year's Day" presence in get_named("new")
@@ -362,6 +525,25 @@ class TestBasics(unittest.TestCase):
         us.get_named("Thanksgiving")
         self.assertEqual([2022], list(us.years))
 
+    def test_populate_apart(self):
+        seen = {}
+
+        class Country(holidays.HolidayBase):
+            def _populate(self, year):
+                self._populate_apart(year, self._populate_holidays)
+
+            def _populate_holidays(self, year, holidays):
+                holidays[date(year, 1, 1)] = "New Year's Day"
+                seen[year] = list(holidays)
+                holidays[date(year, 1, 2)] = "Holiday"
+
+        country = Country(years=[2020, 2021])
+        # The rules of each year only see the holidays of that year
+        self.assertEqual(
+            seen, {2020: [date(2020, 1, 1)], 2021: [date(2021, 1, 1)]}
+        )
+        self.assertEqual(len(country), 4)
+
 
 class TestArgs(unittest.TestCase):
     def setUp(self):
@@ -458,6 +640,32 @@ class TestArgs(unittest.TestCase):
         assert loaded_holidays == self.holidays
         assert (dt in loaded_holidays) == res
 
+    def test_serialization_custom_entries(self):
+        self.holidays = holidays.US(years=range(2000, 2010), observed=False)
+        self.holidays[date(2014, 1, 3)] = "Fake Holiday"
+        self.holidays.pop(date(2005, 7, 4))
+        loaded_holidays = pickle.loads(pickle.dumps(self.holidays))
+        self.assertEqual(loaded_holidays, self.holidays)
+        self.assertFalse(loaded_holidays.observed)
+        self.assertEqual(loaded_holidays.years, self.holidays.years)
+        self.assertEqual(loaded_holidays[date(2014, 1, 3)], "Fake Holiday")
+        self.assertNotIn(date(2005, 7, 4), loaded_holidays)
+
+    def test_serialization_compact(self):
+        self.holidays = holidays.US(years=range(1950, 2050))
+        default = pickle.dumps(dict(self.holidays))
+        self.assertLess(len(pickle.dumps(self.holidays)), len(default) / 2)
+
+    def test_serialization_sum(self):
+        na = holidays.CA(years=[2014]) + holidays.US() + holidays.MX()
+        self.assertIsInstance(na, holidays.HolidaySum)
+        loaded_holidays = pickle.loads(pickle.dumps(na))
+        self.assertEqual(loaded_holidays, na)
+        self.assertEqual(loaded_holidays.country, ["CA", "US", "MX"])
+        self.assertEqual(len(loaded_holidays.holidays), 3)
+        self.assertIn("2015-07-04", loaded_holidays)
+        self.assertIn("2015-07-01", loaded_holidays)
+
 
 class TestKeyTransforms(unittest.TestCase):
     def setUp(self):
@@ -516,6 +724,557 @@ class TestKeyTransforms(unittest.TestCase):
         self.assertRaises((TypeError, ValueError), lambda: {} in self.holidays)
 
 
+class TestWarmup(unittest.TestCase):
+    def test_countries(self):
+        calendars = holidays.warmup(["US", "CA"], years=[2014, 2015])
+        self.assertIn(("US", None), calendars)
+        self.assertIn(("US", "NY"), calendars)
+        self.assertIn(("CA", "BC"), calendars)
+        self.assertEqual(
+            len(calendars), 2 + len(holidays.US.STATES + holidays.CA.PROVINCES)
+        )
+        ny = calendars["US", "NY"]
+        self.assertEqual(ny.state, "NY")
+        self.assertEqual(ny.years, {2014, 2015})
+        self.assertIn(date(2015, 2, 12), ny)
+        self.assertEqual(
+            dict(ny), dict(holidays.US(state="NY", years=[2014, 2015]))
+        )
+        self.assertRaises(TypeError, lambda: ny.pop(date(2015, 2, 12)))
+        self.assertNotIn(date(2016, 1, 1), ny)
+
+    def test_subdivisions(self):
+        calendars = holidays.warmup(
+            ["US", "DE", "IL"], years=2020, subdivisions=["CA", "BY"]
+        )
+        self.assertEqual(
+            list(calendars),
+            [("US", None), ("US", "CA"), ("DE", None), ("DE", "BY")]
+            + [("IL", None)],
+        )
+        calendars = holidays.warmup(["US"], years=2020, subdivisions=None)
+        self.assertEqual(list(calendars), [("US", None)])
+
+    def test_all_countries(self):
+        calendars = holidays.warmup(years=2020, subdivisions=None)
+        self.assertIn(("UnitedStates", None), calendars)
+        self.assertIn(("PortugalExt", None), calendars)
+        self.assertNotIn(("US", None), calendars)
+        self.assertNotIn(("Czech", None), calendars)
+        self.assertTrue(all(h._frozen for h in calendars.values()))
+        self.assertEqual(calendars["UnitedStates", None].years, {2020})
+
+    def test_default_years(self):
+        this_year = date.today().year
+        calendars = holidays.warmup(["US"], subdivisions=None)
+        self.assertEqual(
+            calendars["US", None].years,
+            {this_year - 1, this_year, this_year + 1},
+        )
+
+    def test_exceptions(self):
+        self.assertRaises(KeyError, lambda: holidays.warmup(["XXXX"]))
+
+
+class TestPrecompute(unittest.TestCase):
+    def test_calendars(self):
+        years = range(1990, 2031)
+        calendars = holidays.precompute(
+            ["US", "GB", "SG"], years, processes=0, chunk_years=7
+        )
+        self.assertIn(("US", "NY"), calendars)
+        for country in ("US", "GB", "SG"):
+            self.assertEqual(
+                dict(calendars[country, None]),
+                dict(getattr(holidays, country)(years=years)),
+            )
+            self.assertEqual(calendars[country, None].years, set(years))
+        self.assertEqual(
+            dict(calendars["US", "CA"]),
+            dict(holidays.US(state="CA", years=years)),
+        )
+
+    def test_processes(self):
+        calendars = holidays.precompute(
+            ["US", "DE"], range(2000, 2021), processes=2, chunk_years=5
+        )
+        self.assertEqual(
+            list(calendars),
+            [("US", None)]
+            + [("US", state) for state in holidays.US.STATES]
+            + [("DE", None)]
+            + [("DE", prov) for prov in holidays.DE.PROVINCES],
+        )
+        self.assertEqual(
+            dict(calendars["DE", "BY"]),
+            dict(holidays.DE(prov="BY", years=range(2000, 2021))),
+        )
+
+    def test_rows(self):
+        rows = holidays.precompute(
+            ["US", "CA"],
+            [2015, 2014],
+            subdivisions=["NY", "BC"],
+            processes=0,
+            output="rows",
+        )
+        self.assertEqual(
+            rows, sorted(rows, key=lambda r: (r[0], r[1] or "", r[2]))
+        )
+        self.assertEqual(rows[0][:2], ("CA", None))
+        self.assertIn(
+            ("US", "NY", date(2015, 2, 12), "Lincoln's Birthday"), rows
+        )
+        self.assertEqual(
+            len([row for row in rows if row[:2] == ("US", None)]),
+            len(holidays.US(years=[2014, 2015])),
+        )
+        self.assertRaises(
+            ValueError, lambda: holidays.precompute(["US"], 2015, output="x")
+        )
+
+
+class TestLayers(unittest.TestCase):
+    def test_national_layer_shared(self):
+        calls = []
+
+        class Country(holidays.holiday_base.LayeredHolidayBase):
+            def _populate_national(self, year):
+                calls.append(year)
+                self[date(year, 1, 1)] = "New Year's Day"
+                self[date(year, 12, 25)] = "Christmas Day"
+
+            def _populate_subdivision(self, year):
+                if self.prov == "A":
+                    self[date(year, 1, 1)] = "Founding Day"
+                    self._replace_national(
+                        date(year, 12, 25), "Christmas Day", "Noel"
+                    )
+                elif self.prov == "B":
+                    self._replace_national(date(year, 12, 25), "Christmas Day")
+
+        a = Country(prov="A", years=[2020, 2021])
+        b = Country(prov="B", years=2020)
+        national = Country(years=2020)
+        self.assertEqual(calls, [2020, 2021])
+        self.assertEqual(a[date(2020, 1, 1)], "Founding Day, New Year's Day")
+        self.assertEqual(a[date(2021, 12, 25)], "Noel")
+        self.assertNotIn(date(2020, 12, 25), b)
+        self.assertEqual(
+            dict(national),
+            {
+                date(2020, 1, 1): "New Year's Day",
+                date(2020, 12, 25): "Christmas Day",
+            },
+        )
+        # The national layer depends on the observed setting
+        Country(prov="B", years=2020, observed=False)
+        self.assertEqual(calls, [2020, 2021, 2020])
+
+    def test_subdivisions(self):
+        ca = holidays.US(state="CA", years=2021)
+        nv = holidays.US(state="NV", years=2021)
+        self.assertEqual(ca[date(2021, 10, 11)], "Columbus Day")
+        self.assertNotIn(date(2021, 10, 11), nv)
+        self.assertIn(date(2021, 10, 11), holidays.US(years=2021))
+        ca.observed = False
+        self.assertEqual(
+            dict(ca), dict(holidays.US(state="CA", years=2021, observed=False))
+        )
+
+    def test_shared_layer(self):
+        ca = holidays.US(state="CA", years=[2020, 2021])
+        nv = holidays.US(state="NV", years=[2020, 2021])
+        # The calendars only store the holidays of their subdivision
+        self.assertIs(ca._layers[2021], nv._layers[2021])
+        self.assertLess(dict.__len__(ca), 10)
+        self.assertEqual(len(ca), len(list(ca)))
+        self.assertEqual(len(ca), 29)
+        self.assertEqual(list(ca.items()), list(zip(ca.keys(), ca.values())))
+        self.assertEqual(repr(ca), repr(dict(ca)))
+        self.assertEqual(pickle.loads(pickle.dumps(ca)), ca)
+        self.assertEqual(ca.pop("2021-07-04"), "Independence Day")
+        self.assertNotIn("2021-07-04", ca)
+        self.assertIn("2021-07-04", nv)
+        self.assertEqual(len(ca), 28)
+        ca["2021-07-04"] = "Picnic"
+        self.assertEqual(ca["2021-07-04"], "Picnic")
+        ca.clear()
+        self.assertEqual(len(ca), 0)
+
+    def test_len(self):
+        us = holidays.US(state="TX", years=[2020, 2021])
+        expected = sum(1 for _ in us._entries())
+        # The holidays are counted as they are added, not walked
+        with mock.patch.object(holidays.US, "_entries", side_effect=Exception):
+            self.assertEqual(len(us), expected)
+            self.assertTrue(us)
+        us["2021-07-04"] = "Picnic"
+        us["2021-08-20"] = "Company Day"
+        del us[date(2021, 12, 24)]
+        us.pop("2021-01-01")
+        us.setdefault(date(2021, 8, 21), "Company Day")
+        us.update({"2021-01-01": "New Year's Day"})
+        self.assertEqual(len(us), expected + 1)
+        self.assertEqual(len(us), len(list(us)))
+        us.pop_named("Company Day")
+        self.assertEqual(len(us), expected - 1)
+        self.assertEqual(len(pickle.loads(pickle.dumps(us))), len(us))
+        us.observed = False
+        self.assertEqual(len(us), len(list(us)))
+        us.clear()
+        self.assertFalse(us)
+
+    def test_name_order(self):
+        # Subdivision holidays keep their place in the combined names
+        self.assertEqual(
+            holidays.US(state="CA", years=2016)[date(2016, 2, 15)],
+            "Washington's Birthday, Susan B. Anthony Day",
+        )
+        self.assertEqual(
+            holidays.US(state="VA", years=1997)[date(1997, 1, 20)],
+            "Martin Luther King Jr. Day, Inauguration Day, Lee Jackson Day",
+        )
+        self.assertEqual(
+            holidays.US(state="TX", years=2021)[date(2021, 12, 24)],
+            "Christmas Day (Observed), Christmas Eve",
+        )
+        self.assertEqual(
+            holidays.US(state="NC", years=2016)[date(2016, 12, 26)],
+            "Day After Christmas, Christmas Day (Observed)",
+        )
+        self.assertEqual(
+            holidays.AU(prov="NSW", years=2038)[date(2038, 4, 25)],
+            "Anzac Day, Easter Sunday",
+        )
+        self.assertEqual(
+            holidays.CH(prov="ZH", years=2008)[date(2008, 5, 1)],
+            "Auffahrt, Tag der Arbeit",
+        )
+
+    def test_layers_bounded(self):
+        layers = OrderedDict()
+        with mock.patch.multiple(
+            holidays.holiday_base,
+            _national_layers=layers,
+            _NATIONAL_LAYERS_SIZE=2,
+        ):
+            us = holidays.US(state="TX", years=range(2000, 2010))
+        self.assertEqual(len(layers), 2)
+        self.assertEqual(len(us._layers), 10)
+        self.assertEqual(us, holidays.US(state="TX", years=range(2000, 2010)))
+
+
+class TestCountriesOn(unittest.TestCase):
+    def test_countries_on(self):
+        countries = holidays.countries_on("2021-07-04")
+        self.assertIsInstance(countries, tuple)
+        self.assertIn("UnitedStates", countries)
+        self.assertNotIn("Canada", countries)
+        self.assertIn("Canada", holidays.countries_on(date(2021, 7, 1)))
+        self.assertEqual(list(countries), sorted(countries))
+        for country in ("UnitedStates", "Germany", "Japan"):
+            calendar = getattr(holidays, country)(years=2021)
+            self.assertEqual(
+                country in holidays.countries_on("2021-05-03"),
+                date(2021, 5, 3) in calendar,
+            )
+
+    def test_subdivisions(self):
+        pairs = holidays.countries_on("2021-10-11", subdivisions=True)
+        self.assertIn(("UnitedStates", None), pairs)
+        self.assertIn(("UnitedStates", "CA"), pairs)
+        self.assertNotIn(("UnitedStates", "NV"), pairs)
+        self.assertIn(
+            ("Germany", "BY"),
+            holidays.countries_on("2021-01-06", subdivisions=True),
+        )
+        self.assertNotIn("Germany", holidays.countries_on("2021-01-06"))
+
+    def test_observed(self):
+        # Independence Day 2021 falls on a Sunday
+        self.assertIn("UnitedStates", holidays.countries_on("2021-07-05"))
+        self.assertNotIn(
+            "UnitedStates",
+            holidays.countries_on("2021-07-05", observed=False),
+        )
+        # New Year's Day 2022 is observed in 2021
+        self.assertIn("UnitedStates", holidays.countries_on("2021-12-31"))
+
+    def test_countries_between(self):
+        days = holidays.countries_between("2021-12-20", "2022-01-10")
+        self.assertEqual(list(days), sorted(days))
+        self.assertEqual(min(days), date(2021, 12, 24))
+        self.assertLessEqual(max(days), date(2022, 1, 10))
+        self.assertEqual(
+            days[date(2021, 12, 25)], holidays.countries_on("2021-12-25")
+        )
+        self.assertIn("UnitedStates", days[date(2022, 1, 1)])
+
+    def test_supported_range(self):
+        # The Hijri tables end in 2076; Korea leaves out its lunar
+        # holidays after its table ends in 2050
+        self.assertIn("Korea", holidays.countries_on("2050-12-25"))
+        self.assertIn(
+            ("Korea", None), holidays.countries_on("2050-06-06", True)
+        )
+        self.assertIn("Korea", holidays.countries_on("2051-12-25"))
+        self.assertIn("Egypt", holidays.countries_on("2076-01-07"))
+        self.assertNotIn("Egypt", holidays.countries_on("2077-01-07"))
+        self.assertIn("UnitedStates", holidays.countries_on("2099-12-25"))
+        days = holidays.countries_between("2076-01-07", "2077-01-07")
+        self.assertIn("Egypt", days[date(2076, 1, 7)])
+        self.assertNotIn("Egypt", days[date(2077, 1, 7)])
+
+
+class TestLookupMany(unittest.TestCase):
+    def test_lookup_many(self):
+        dates = [
+            date(2021, 7, 4),
+            "2021-07-01",
+            date(2021, 3, 31),
+            date(2021, 3, 31),
+            datetime(2020, 10, 3, 12),
+            date(2021, 7, 5),
+        ]
+        countries = ["US", "CA", "US", "US", "DE", "US"]
+        subdivisions = [None, None, "CA", None, "BY", "NY"]
+        self.assertEqual(
+            holidays.lookup_many(dates, countries, subdivisions),
+            [
+                "Independence Day",
+                "Canada Day",
+                "César Chávez Day",
+                None,
+                "Tag der Deutschen Einheit",
+                "Independence Day (Observed)",
+            ],
+        )
+        self.assertEqual(
+            holidays.lookup_many(
+                dates[-1:], countries[-1:], subdivisions[-1:], observed=False
+            ),
+            [None],
+        )
+
+    def test_broadcast(self):
+        self.assertEqual(
+            holidays.lookup_many(["2021-12-25", "2021-12-24"], "DE"),
+            ["Erster Weihnachtstag", None],
+        )
+        self.assertEqual(
+            holidays.lookup_many(["2021-01-06"], ["DE"], "BY"),
+            ["Heilige Drei Könige"],
+        )
+        self.assertEqual(holidays.lookup_many([], []), [])
+
+    def test_errors(self):
+        self.assertRaises(
+            ValueError, holidays.lookup_many, ["2021-01-01"], ["US", "CA"]
+        )
+        self.assertRaises(KeyError, holidays.lookup_many, ["2021-01-01"], "XX")
+
+    def test_supported_range(self):
+        # 2050 is the last year of the Korean lunar table, 2076 of the
+        # Hijri tables
+        self.assertEqual(
+            holidays.lookup_many(
+                ["2050-01-23", "2051-01-01", "2076-01-07"], ["KR", "KR", "EG"]
+            ),
+            ["Lunar New Year's Day", "New Year's Day", "Coptic Christmas"],
+        )
+        self.assertRaises(
+            OverflowError, holidays.lookup_many, ["2077-01-07"], "EG"
+        )
+
+
+class TestSubdivisionMatrix(unittest.TestCase):
+    def assertMatrix(self, cls, start, end, keyword):
+        matrix = cls.subdivision_matrix(start, end)
+        self.assertEqual(matrix.dates[0], start)
+        self.assertEqual(matrix.dates[-1], end)
+        self.assertEqual(len(matrix.matrix), len(matrix.dates))
+        for j, code in enumerate(matrix.subdivisions):
+            kwargs = {keyword: code} if code else {}
+            cal = cls(years=range(start.year, end.year + 1), **kwargs)
+            for i, day in enumerate(matrix.dates):
+                self.assertEqual(matrix.matrix[i][j], day in cal)
+                self.assertEqual(
+                    matrix.names[matrix.name_ids[i][j]], cal.get(day, "")
+                )
+
+    def test_matches_calendars(self):
+        self.assertMatrix(
+            holidays.US, date(2019, 12, 1), date(2021, 1, 31), "state"
+        )
+        self.assertMatrix(
+            holidays.DE, date(2018, 1, 1), date(2018, 12, 31), "prov"
+        )
+        self.assertMatrix(
+            holidays.CH, date(2020, 3, 1), date(2020, 6, 30), "prov"
+        )
+        self.assertMatrix(
+            holidays.JP, date(2020, 1, 1), date(2020, 12, 31), "prov"
+        )
+
+    def test_lookup(self):
+        matrix = holidays.US.subdivision_matrix("2021-10-01", "2021-10-31")
+        self.assertEqual(matrix.subdivisions, holidays.US.STATES)
+        self.assertIn("CA", matrix.observing("2021-10-11"))
+        self.assertNotIn("NV", matrix.observing(date(2021, 10, 11)))
+        self.assertEqual(matrix.name("2021-10-11", "CA"), "Columbus Day")
+        self.assertIsNone(matrix.name("2021-10-11", "NV"))
+        self.assertEqual(matrix.observing("2021-10-12"), [])
+        self.assertRaises(KeyError, matrix.observing, "2021-11-01")
+
+    def test_subdivisions(self):
+        matrix = holidays.DE.subdivision_matrix(
+            "2020-01-01", "2020-12-31", subdivisions=["BY", "BE"]
+        )
+        self.assertEqual(matrix.subdivisions, ["BY", "BE"])
+        self.assertEqual(matrix.observing("2020-01-06"), ["BY"])
+        self.assertEqual(matrix.observing("2020-03-08"), ["BE"])
+        self.assertEqual(matrix.observing("2020-12-25"), ["BY", "BE"])
+
+    def test_layered_columns(self):
+        subdivisions = [None] + holidays.US.STATES
+        columns = holidays.US._subdivision_holidays(
+            subdivisions, [2020, 2021], True
+        )
+        for code, column in zip(subdivisions, columns):
+            kwargs = {"state": code} if code else {}
+            cal = holidays.US(years=[2020, 2021], **kwargs)
+            self.assertEqual(column, dict(cal))
+        self.assertIs(columns[0], columns[subdivisions.index("CO")])
+        self.assertIs(columns[0], columns[subdivisions.index("OR")])
+        self.assertIsNot(columns[0], columns[subdivisions.index("CA")])
+
+    def test_invalid_range(self):
+        self.assertRaises(
+            ValueError,
+            holidays.US.subdivision_matrix,
+            "2021-01-02",
+            "2021-01-01",
+        )
+
+
+class TestOperations(unittest.TestCase):
+    def setUp(self):
+        self.us = holidays.US(years=range(2018, 2022))
+        self.gb = holidays.UK(years=range(2018, 2022))
+
+    def assertDates(self, calendar, expected):
+        self.assertEqual(
+            set(dict(calendar)),
+            {key for key in expected if 2018 <= key.year <= 2021},
+        )
+
+    def test_intersection(self):
+        both = self.us & self.gb
+        self.assertIsInstance(both, holidays.HolidayOperation)
+        self.assertDates(both, set(dict(self.us)) & set(dict(self.gb)))
+        self.assertEqual(both.country, ["US", "UK"])
+        self.assertEqual(both.years, set(range(2018, 2022)))
+        self.assertEqual(both[date(2020, 12, 25)], "Christmas Day")
+        self.assertEqual(
+            both[date(2020, 5, 25)], "Memorial Day, Spring Bank Holiday"
+        )
+        self.assertNotIn(date(2020, 7, 4), both)
+
+    def test_names(self):
+        left = self.us.intersection(self.gb, names="left")
+        self.assertEqual(left[date(2020, 5, 25)], "Memorial Day")
+        right = self.us.intersection(self.gb, names="right")
+        self.assertEqual(right[date(2020, 5, 25)], "Spring Bank Holiday")
+        joined = self.us.intersection(
+            self.gb, names=lambda name, other: "%s / %s" % (name, other)
+        )
+        self.assertEqual(
+            joined[date(2020, 12, 25)], "Christmas Day / Christmas Day"
+        )
+        self.assertRaises(ValueError, self.us.intersection, self.gb, None, "")
+
+    def test_difference(self):
+        us_only = self.us - self.gb
+        self.assertDates(us_only, set(dict(self.us)) - set(dict(self.gb)))
+        self.assertEqual(us_only.country, "US")
+        self.assertEqual(us_only[date(2020, 7, 4)], "Independence Day")
+        self.assertNotIn(date(2020, 12, 25), us_only)
+        either = self.us ^ self.gb
+        self.assertDates(either, set(dict(self.us)) ^ set(dict(self.gb)))
+        self.assertEqual(either[date(2020, 7, 4)], "Independence Day")
+        self.assertEqual(either[date(2020, 5, 8)], "May Day")
+        self.assertNotIn(date(2020, 5, 25), either)
+
+    def test_years(self):
+        both = self.us.intersection(holidays.DE(), years=[2020])
+        self.assertEqual(both.years, {2020})
+        self.assertIn("2020-12-25", both)
+        # Expands with either calendar, without changing it
+        self.assertIn("2030-12-25", both)
+        self.assertNotIn(2030, self.us.years)
+        self.assertNotIn(date(2030, 12, 26), both)
+        both = holidays.US(expand=False) & holidays.DE(expand=False)
+        self.assertNotIn("2030-12-25", both)
+        self.assertRaises(TypeError, lambda: self.us & {})
+
+    def test_pickle(self):
+        both = (self.us & self.gb) - holidays.DE()
+        loaded = pickle.loads(pickle.dumps(both))
+        self.assertEqual(loaded, both)
+        self.assertIn("2020-05-25", loaded)
+        self.assertNotIn("2020-12-25", loaded)
+
+
+class TestWorkdays(unittest.TestCase):
+    def setUp(self):
+        self.holidays = holidays.US()
+
+    def test_weekend(self):
+        self.assertEqual(self.holidays.weekend("2021-07-04"), (5, 6))
+        self.assertTrue(self.holidays.is_weekend("2021-07-04"))
+        self.assertFalse(self.holidays.is_weekend("2021-07-05"))
+        self.assertEqual(holidays.IL().weekend("2021-07-04"), (4, 5))
+
+    def test_is_workday(self):
+        self.assertTrue(self.holidays.is_workday("2021-07-06"))
+        self.assertFalse(self.holidays.is_workday("2021-07-05"))
+        self.assertFalse(self.holidays.is_workday("2021-07-03"))
+        self.assertFalse(self.holidays.is_workday(date(2020, 12, 25)))
+        day = date(2020, 1, 1)
+        while day.year < 2022:
+            self.assertEqual(
+                self.holidays.is_workday(day),
+                day.weekday() < 5 and day not in self.holidays,
+            )
+            day += timedelta(days=1)
+
+    def test_count_workdays(self):
+        self.assertEqual(
+            self.holidays.count_workdays("2021-07-01", "2021-07-31"), 21
+        )
+        self.assertEqual(
+            self.holidays.count_workdays("2021-01-01", "2021-12-31"), 250
+        )
+        self.assertEqual(
+            self.holidays.count_workdays("2020-12-24", "2021-01-04"), 6
+        )
+        self.assertEqual(
+            self.holidays.count_workdays("2021-07-05", "2021-07-05"), 0
+        )
+        self.assertEqual(
+            self.holidays.count_workdays("2021-07-02", "2021-07-01"), 0
+        )
+
+    def test_changes(self):
+        self.assertTrue(self.holidays.is_workday("2021-08-20"))
+        self.holidays["2021-08-20"] = "Company Day"
+        self.assertFalse(self.holidays.is_workday("2021-08-20"))
+        frozen = holidays.US(years=2021).freeze()
+        self.assertTrue(frozen.is_workday("2022-07-04"))
+        self.assertFalse(frozen.is_workday("2021-07-05"))
+
+
 class TestCountryHoliday(unittest.TestCase):
     def setUp(self):
         self.holidays = holidays.CountryHoliday("US")
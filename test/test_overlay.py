@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+import pickle
+import unittest
+
+from datetime import date
+
+import holidays
+
+
+class TestHolidayOverlay(unittest.TestCase):
+    def setUp(self):
+        self.base = holidays.US(years=[2020, 2021]).freeze()
+        self.overlay = holidays.HolidayOverlay(self.base)
+
+    def test_base(self):
+        self.assertEqual(dict(self.overlay), dict(self.base))
+        self.assertEqual(len(self.overlay), len(self.base))
+        self.assertEqual(self.overlay["2021-07-04"], "Independence Day")
+        self.assertIn(date(2020, 12, 25), self.overlay)
+        self.assertNotIn(date(2022, 12, 25), self.overlay)
+        self.assertEqual(self.overlay.country, "US")
+        self.assertEqual(self.overlay.years, {2020, 2021})
+
+    def test_edits(self):
+        base = dict(self.base)
+        self.overlay["2021-08-20"] = "Company Day"
+        self.overlay.append(date(2021, 12, 23))
+        self.overlay[date(2021, 7, 4)] = "Company Picnic"
+        del self.overlay["2021-11-11"]
+        self.assertEqual(self.overlay[date(2021, 8, 20)], "Company Day")
+        self.assertEqual(self.overlay[date(2021, 12, 23)], "Holiday")
+        self.assertEqual(
+            self.overlay.get_list("2021-07-04"),
+            ["Company Picnic", "Independence Day"],
+        )
+        self.assertNotIn("2021-11-11", self.overlay)
+        self.assertEqual(len(self.overlay), len(base) + 1)
+        self.assertEqual(
+            set(self.overlay),
+            set(base) - {date(2021, 11, 11)}
+            | {date(2021, 8, 20), date(2021, 12, 23)},
+        )
+        self.assertRaises(KeyError, self.overlay.__delitem__, "2021-11-11")
+        # The base is shared, not copied or changed
+        self.assertEqual(dict(self.base), base)
+        self.assertEqual(len(self.overlay.added), 3)
+        self.assertEqual(self.overlay.removed, {date(2021, 11, 11)})
+        self.overlay["2021-11-11"] = "Company Day"
+        self.assertEqual(self.overlay["2021-11-11"], "Company Day")
+        self.overlay.reset()
+        self.assertEqual(dict(self.overlay), base)
+
+    def test_tenants(self):
+        other = holidays.HolidayOverlay(self.base)
+        self.overlay["2021-08-20"] = "Company Day"
+        other.pop("2021-01-18")
+        self.assertNotIn("2021-08-20", other)
+        self.assertIn("2021-01-18", self.overlay)
+        self.assertEqual(
+            other.pop_named("Labor"), [date(2020, 9, 7), date(2021, 9, 6)]
+        )
+        self.assertEqual(
+            self.overlay.get_named("company"), [date(2021, 8, 20)]
+        )
+        self.assertRaises(KeyError, other.pop_named, "Labor")
+
+    def test_workdays(self):
+        other = holidays.HolidayOverlay(self.base)
+        self.overlay["2021-08-20"] = "Company Day"
+        del self.overlay["2021-11-11"]
+        self.assertFalse(self.overlay.is_workday("2021-08-20"))
+        self.assertTrue(self.overlay.is_workday("2021-11-11"))
+        self.assertFalse(self.overlay.is_workday("2021-08-21"))
+        self.assertTrue(other.is_workday("2021-08-20"))
+        self.assertFalse(other.is_workday("2021-11-11"))
+        self.assertEqual(
+            self.overlay.count_workdays("2021-08-01", "2021-11-30"),
+            self.base.count_workdays("2021-08-01", "2021-11-30"),
+        )
+        self.assertEqual(
+            self.overlay.count_workdays("2021-08-01", "2021-08-31"),
+            self.base.count_workdays("2021-08-01", "2021-08-31") - 1,
+        )
+
+    def test_fingerprint(self):
+        other = holidays.HolidayOverlay(self.base)
+        self.assertEqual(
+            other.fingerprint("2020-03-01", "2021-12-31"),
+            self.base.fingerprint("2020-03-01", "2021-12-31"),
+        )
+        self.overlay["2021-08-20"] = "Company Day"
+        self.assertNotEqual(
+            self.overlay.fingerprint("2021-01-01", "2021-12-31"),
+            other.fingerprint("2021-01-01", "2021-12-31"),
+        )
+        self.assertEqual(
+            self.overlay.fingerprint("2021-01-01", "2021-06-30"),
+            other.fingerprint("2021-01-01", "2021-06-30"),
+        )
+
+    def test_base_methods(self):
+        # The methods of the base would ignore the edits
+        self.assertRaises(AttributeError, getattr, self.overlay, "freeze")
+        self.assertRaises(
+            AttributeError, getattr, self.overlay, "intersection"
+        )
+        self.assertEqual(self.overlay.WEEKENDS, self.base.WEEKENDS)
+
+    def test_expand(self):
+        base = holidays.CA(years=2021)
+        overlay = holidays.HolidayOverlay(base)
+        overlay["2022-02-02"] = "Company Day"
+        del overlay["2021-07-01"]
+        self.assertNotIn("2022-07-01", overlay)
+        self.assertEqual(overlay.get("2022-02-02"), "Company Day")
+        self.assertIsNone(overlay.get("2022-12-25"))
+        self.assertRaises(KeyError, overlay.__delitem__, "2022-12-25")
+        self.assertEqual(len(overlay), len(base))
+        # The base is not populated for the years it does not hold
+        self.assertEqual(base.years, {2021})
+        self.assertEqual(len(base), len(holidays.CA(years=2021)))
+
+    def test_pickle(self):
+        self.overlay["2021-08-20"] = "Company Day"
+        del self.overlay["2021-11-11"]
+        loaded = pickle.loads(pickle.dumps(self.overlay))
+        self.assertEqual(dict(loaded), dict(self.overlay))
+        self.assertEqual(loaded.removed, {date(2021, 11, 11)})
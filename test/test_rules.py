@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+
+import unittest
+
+from datetime import date
+
+import holidays
+from holidays.calendars.easter import EASTER_ORTHODOX
+from holidays.constants import JAN, FEB, MAY, JUL, NOV, DEC
+from holidays.constants import MON, WED, THU, SAT, SUN
+from holidays.rules import (
+    Easter,
+    Fixed,
+    Hijri,
+    Lunar,
+    NthWeekday,
+    RuleHolidayBase,
+    Weekday,
+    evaluate,
+)
+
+
+class Example(RuleHolidayBase):
+    PROVINCES = ["A", "B"]
+
+    RULES = (
+        Fixed("New Year", JAN, 1, observed={SAT: -1, SUN: 1}),
+        Easter("Easter Monday", days=1),
+        NthWeekday("Spring Day", MAY, MON, -1, start_year=2000),
+        Weekday("Local Day", JUL, 1, WED, 2, subdivisions=("A",)),
+        Fixed("Old Day", NOV, 11, end_year=1999),
+        Fixed("Christmas", DEC, 25),
+        Fixed("Noel", DEC, 25),
+    )
+
+    def __init__(self, **kwargs):
+        self.country = "EX"
+        RuleHolidayBase.__init__(self, **kwargs)
+
+
+class ExampleExt(Example):
+    def _populate(self, year):
+        super(ExampleExt, self)._populate(year)
+        self[date(year, FEB, 2)] = "Extra Day"
+
+
+class TestRules(unittest.TestCase):
+    def test_dates(self):
+        years = [2019, 2020, 2021]
+        self.assertEqual(
+            Fixed("", JAN, 1).dates(years),
+            [date(2019, 1, 1), date(2020, 1, 1), date(2021, 1, 1)],
+        )
+        self.assertEqual(
+            NthWeekday("", NOV, THU, 4).dates(years),
+            [date(2019, 11, 28), date(2020, 11, 26), date(2021, 11, 25)],
+        )
+        self.assertEqual(
+            NthWeekday("", DEC, MON, -1).dates(years),
+            [date(2019, 12, 30), date(2020, 12, 28), date(2021, 12, 27)],
+        )
+        self.assertEqual(
+            Weekday("", NOV, 22, WED, -1).dates(years),
+            [date(2019, 11, 20), date(2020, 11, 18), date(2021, 11, 17)],
+        )
+        self.assertEqual(
+            Easter("", days=-2, method=EASTER_ORTHODOX).dates(years),
+            [date(2019, 4, 26), date(2020, 4, 17), date(2021, 4, 30)],
+        )
+        self.assertEqual(
+            Lunar("", 1, 1).dates(years),
+            [date(2019, 2, 5), date(2020, 1, 25), date(2021, 2, 12)],
+        )
+        self.assertEqual(
+            Hijri("", 10, 1).dates([1999, 2000, 2001]),
+            [
+                date(1999, 1, 18),
+                date(2000, 1, 8),
+                date(2000, 12, 27),
+                date(2001, 12, 16),
+            ],
+        )
+
+    def test_filter_years(self):
+        years = list(range(1990, 2011))
+        self.assertIs(Fixed("", JAN, 1).filter_years(years), years)
+        self.assertEqual(
+            Fixed("", JAN, 1, start_year=2009).filter_years(years),
+            [2009, 2010],
+        )
+        self.assertEqual(
+            Fixed("", JAN, 1, end_year=1991).filter_years(years),
+            [1990, 1991],
+        )
+        self.assertEqual(
+            Fixed("", JAN, 1, start_year=2020).filter_years(years), []
+        )
+
+    def test_evaluate(self):
+        result = evaluate(Example.RULES, [2023], "A")
+        self.assertEqual(result[date(2023, 1, 1)], "New Year")
+        self.assertEqual(result[date(2023, 1, 2)], "New Year (Observed)")
+        self.assertEqual(result[date(2023, 4, 10)], "Easter Monday")
+        self.assertEqual(result[date(2023, 5, 29)], "Spring Day")
+        self.assertEqual(result[date(2023, 7, 12)], "Local Day")
+        # Names of a shared date are combined like HolidayBase.__setitem__
+        self.assertEqual(result[date(2023, 12, 25)], "Noel, Christmas")
+        self.assertEqual(len(result), 6)
+        result = evaluate(Example.RULES, [1998], "B", observed=False)
+        self.assertEqual(result[date(1998, 11, 11)], "Old Day")
+        self.assertNotIn(date(1998, 5, 25), result)
+        self.assertEqual(len(result), 4)
+        self.assertEqual(evaluate(Example.RULES, []), {})
+
+    def test_rule_holidays(self):
+        h = Example(prov="A", years=range(1995, 2025))
+        ref = Example(prov="A")
+        for year in range(1995, 2025):
+            date(year, 6, 1) in ref
+        self.assertEqual(h, ref)
+        self.assertEqual(h.years, set(range(1995, 2025)))
+        self.assertIn(date(2021, 12, 31), h)
+        h.observed = False
+        self.assertNotIn(date(2021, 12, 31), h)
+        self.assertNotIn(date(2023, 7, 12), Example(prov="B"))
+
+    def test_rule_holidays_merge(self):
+        h = Example(years=2020)
+        h[date(2021, 1, 1)] = "Custom"
+        self.assertEqual(h[date(2021, 1, 1)], "Custom, New Year")
+        h = Example(expand=False)
+        h[date(2021, 12, 25)] = "Custom"
+        h._add_years(range(2019, 2023))
+        self.assertEqual(h[date(2021, 12, 25)], "Noel, Christmas, Custom")
+
+    def test_subclass_populate(self):
+        h = ExampleExt(years=range(2020, 2023))
+        self.assertEqual(h[date(2021, 2, 2)], "Extra Day")
+        self.assertEqual(h[date(2021, 12, 25)], "Noel, Christmas")
+        h._add_years([2023])
+        self.assertEqual(h[date(2023, 2, 2)], "Extra Day")
+
+    def test_ported_countries(self):
+        for cls in (holidays.Germany, holidays.Poland, holidays.Iceland):
+            self.assertTrue(issubclass(cls, RuleHolidayBase))
+        de = holidays.DE(prov="SN", years=range(1990, 2031))
+        self.assertEqual(de[date(2021, 11, 17)], "Buß- und Bettag")
+        self.assertEqual(len(de.get_named("Reformationstag")), 41)
+        self.assertNotIn(date(1989, 12, 25), holidays.DE())
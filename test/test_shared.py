@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+#  python-holidays
+#  ---------------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Author:  ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#           dr-prodigy <maurizio.montel@gmail.com> (c) 2017-2021
+#  Website: https://github.com/dr-prodigy/python-holidays
+#  License: MIT (see LICENSE file)
+
+import multiprocessing
+import sys
+import unittest
+
+from datetime import date
+
+import holidays
+from holidays.shared import SharedCalendars
+
+
+def _worker_lookup(name):
+    tables = SharedCalendars.attach(name)
+    try:
+        return tables["US-CA"].get(date(2014, 3, 31))
+    finally:
+        tables.close()
+
+
+@unittest.skipIf(sys.version_info < (3, 8), "requires shared_memory")
+class TestSharedCalendars(unittest.TestCase):
+    def setUp(self):
+        self.calendars = [
+            holidays.US(),
+            holidays.US(state="CA"),
+            holidays.DE(prov="BY"),
+        ]
+        self.tables = SharedCalendars.publish(
+            self.calendars, range(2010, 2021)
+        )
+        self.addCleanup(self.tables.unlink)
+        self.addCleanup(self.tables.close)
+
+    def test_keys(self):
+        self.assertEqual(list(self.tables), ["US", "US-CA", "DE-BY"])
+        self.assertEqual(self.tables.years, range(2010, 2021))
+
+    def test_attach(self):
+        tables = SharedCalendars.attach(self.tables.name)
+        self.addCleanup(tables.close)
+        us = tables["US"]
+        self.assertEqual(us.country, "US")
+        self.assertIsNone(us.state)
+        self.assertEqual(dict(us), dict(holidays.US(years=range(2010, 2021))))
+        self.assertIn(date(2014, 1, 1), us)
+        self.assertIn("2014-07-04", us)
+        self.assertNotIn(date(2014, 1, 2), us)
+        self.assertEqual(us[date(2014, 1, 1)], "New Year's Day")
+        self.assertIsNone(us.get(date(2014, 1, 2)))
+        self.assertRaises(KeyError, lambda: us[date(2014, 1, 2)])
+        # Observed New Year's Day of 2011 falls in 2010
+        self.assertIn(date(2010, 12, 31), us)
+        # Years outside the published range are not generated
+        self.assertNotIn(date(2021, 1, 1), us)
+        self.assertEqual(
+            tables["DE-BY"].get_list(date(2015, 1, 6)), ["Heilige Drei Könige"]
+        )
+
+    def test_read_only(self):
+        tables = SharedCalendars.attach(self.tables.name)
+        self.addCleanup(tables.close)
+        with self.assertRaises(TypeError):
+            tables["US"][date(2014, 1, 2)] = "Fake Holiday"
+        with self.assertRaises(TypeError):
+            tables.ordinals[0] = 0
+
+    def test_worker(self):
+        ctx = multiprocessing.get_context()
+        with ctx.Pool(2) as pool:
+            results = pool.map(_worker_lookup, [self.tables.name] * 2)
+        self.assertEqual(results, ["César Chávez Day"] * 2)
+
+    def test_odd_entries(self):
+        class Calendar(holidays.HolidayBase):
+            def _populate(self, year):
+                self[date(year, 1, 1)] = "A"
+                self[date(year, 1, 2)] = "B"
+                self[date(year, 1, 3)] = "C"
+
+        # Three entries leave the name ids ending mid-word before the
+        # bitmaps section.
+        tables = SharedCalendars.publish({"odd": Calendar()}, [2020])
+        self.addCleanup(tables.unlink)
+        self.addCleanup(tables.close)
+        calendar = tables["odd"]
+        self.assertEqual(calendar.get(date(2020, 1, 3)), "C")
+        self.assertEqual(
+            dict(calendar),
+            {
+                date(2020, 1, 1): "A",
+                date(2020, 1, 2): "B",
+                date(2020, 1, 3): "C",
+            },
+        )
+
+    def test_invalid(self):
+        self.assertRaises(
+            ValueError, lambda: SharedCalendars.publish(self.calendars, [])
+        )